@@ -0,0 +1,337 @@
+r"""
+Apollonian gaskets from three mutually tangent clines.
+
+Every cline with :math:`\Delta > 0` is scaled to :math:`\Delta = 1` and given
+an orientation (the sign of the scaling), so that the real vector
+
+.. math::
+
+   x = (c, d, \text{Re}\,\alpha, \text{Im}\,\alpha), \qquad
+   \langle x, y \rangle = \text{Re}\,\alpha_x \text{Re}\,\alpha_y
+   + \text{Im}\,\alpha_x \text{Im}\,\alpha_y - \tfrac{1}{2}(c_x d_y + c_y d_x)
+
+has :math:`\langle x, x \rangle = 1`. For a circle, c is the signed
+curvature and d is the curvature of its image under inversion in the unit
+circle. These are the augmented curvature-center coordinates of Lagarias,
+Mallows and Wilks. Four oriented clines with pairwise disjoint interiors
+that touch pairwise satisfy :math:`\langle x_i, x_j \rangle = -1` (a
+Descartes quadruple). The circle in the gap bounded by three of them,
+other than the fourth, is then given by the linear reflection
+
+.. math::
+
+   x' = 2(x_a + x_b + x_c) - x_o.
+
+This is Descartes' theorem applied to whole coefficient vectors. Lines
+(c = 0) and the enclosing circle (c < 0) need no special cases. A gap is
+stored as its four vectors :math:`(x_a, x_b, x_c, x_o)`. Filling it creates
+three new gaps, one between the new circle and each pair of
+:math:`x_a, x_b, x_c`.
+
+:func:`apollonian_gasket` keeps the pending gaps in an explicit work queue
+or stack (no recursion) and streams the circles out as :class:`ClineArray` chunks.
+Circles inside a gap only get smaller, so a gap whose circle is below
+``min_radius`` is dropped with all its descendants.
+
+Reference:
+    J. Lagarias, C. Mallows, A. Wilks, *Beyond the Descartes circle theorem*,
+    Amer. Math. Monthly 109 (2002).
+"""
+
+import numpy as np
+
+from cline_array import ClineArray
+from inversive import inversive_gram
+
+# Default maximum number of gaps filled per batch (and circles per chunk)
+_GASKET_CHUNK_SIZE = 1 << 14
+
+# Tolerance on the inversive products of the three starting clines
+_TANGENCY_TOL = 1e-8
+
+_ORDERS = ("largest", "depth")
+
+
+def _form(x, y):
+    """The bilinear form <x, y> on rows of coordinates, shape (..., 4)."""
+    return x[..., 2] * y[..., 2] + x[..., 3] * y[..., 3] - (x[..., 0] * y[..., 1] + x[..., 1] * y[..., 0]) / 2
+
+
+def _descartes_quadruple(clines):
+    """Return the oriented coordinates of a Descartes quadruple, shape (4, 4).
+
+    The first three rows are the given clines. The fourth is the cline
+    tangent to all three that closes the quadruple. Of the two candidates
+    it is the one with the smaller signed curvature, so an enclosing circle
+    is among the roots.
+
+    Raises:
+        ValueError: if the clines are not three mutually tangent circles or lines.
+    """
+    A = clines if isinstance(clines, ClineArray) else ClineArray.from_clines(clines)
+    if len(A) != 3:
+        raise ValueError(f"Expected three clines, got {len(A)}")
+    if not (A.is_circle | A.is_line).all():
+        raise ValueError("Starting clines must be circles or lines")
+    G = inversive_gram(A)
+    off_diagonal = G[[0, 0, 1], [1, 2, 2]]
+    if (np.abs(np.abs(off_diagonal) - 1) > _TANGENCY_TOL).any():
+        raise ValueError("Starting clines must be mutually tangent")
+
+    # G is the negated form for c >= 0; choose signs with <x_i, x_j> = -1
+    signs = np.array([1.0, np.sign(G[0, 1]), np.sign(G[0, 2])])
+    if signs[1] * signs[2] * G[1, 2] < 0:
+        raise ValueError("Starting clines do not bound a common gap (tangent at one point?)")
+    base = np.where(A.c < -1e-10, -1.0, 1.0) / np.sqrt(A.discriminant)
+    if (signs * base * A.c).sum() < 0:
+        signs = -signs
+    scale = signs * base
+    X = np.column_stack([A.c, A.d, A.alpha.real, A.alpha.imag]) * scale[:, None]
+
+    # The fourth cline is S + t n with n orthogonal to all three: then
+    # <x4, x_i> = -1 automatically and <x4, x4> = 1 fixes t = ±2/sqrt(<n, n>)
+    S = X.sum(axis=0)
+    Q = np.diag([0.0, 0.0, 1.0, 1.0])
+    Q[0, 1] = Q[1, 0] = -0.5
+    n = np.linalg.svd(X @ Q)[2][-1]
+    t = 2 / np.sqrt(_form(n, n))
+    fourth = min(S + t * n, S - t * n, key=lambda x: x[0])
+    return np.vstack([X, fourth])
+
+
+def _to_cline_array(X):
+    return ClineArray(X[:, 0], X[:, 2] + 1j * X[:, 3], X[:, 1])
+
+
+def _root_gaps(quadruple):
+    """The four gaps of a Descartes quadruple, shape (4, 4, 4)."""
+    gaps = np.empty((4, 4, 4))
+    for o in range(4):
+        gaps[o, :3] = np.delete(quadruple, o, axis=0)
+        gaps[o, 3] = quadruple[o]
+    return gaps
+
+
+def _fill(gaps):
+    """Return the circles filling gaps, shape (G, 4)."""
+    return 2 * (gaps[:, 0] + gaps[:, 1] + gaps[:, 2]) - gaps[:, 3]
+
+
+def _children(gaps, new):
+    """Return the three gaps created by filling each gap, shape (G, 3, 4, 4).
+
+    Child k keeps two of the bounding clines, adds the new circle and has
+    the remaining bounding cline as its opposite.
+    """
+    children = np.empty((len(gaps), 3, 4, 4))
+    for k, (p, q, opposite) in enumerate(((0, 1, 2), (0, 2, 1), (1, 2, 0))):
+        children[:, k, 0] = gaps[:, p]
+        children[:, k, 1] = gaps[:, q]
+        children[:, k, 2] = new
+        children[:, k, 3] = gaps[:, opposite]
+    return children
+
+
+def _child_curvatures(gaps, new):
+    """Return the signed curvatures of the circles filling the child gaps, shape (G, 3)."""
+    c = gaps[:, :, 0]
+    n = new[:, 0]
+    return np.column_stack([
+        2 * (c[:, p] + c[:, q] + n) - c[:, opposite]
+        for p, q, opposite in ((0, 1, 2), (0, 2, 1), (1, 2, 0))
+    ])
+
+
+class _GapQueue:
+    """Pending gaps ordered by key, stored as a few sorted runs.
+
+    Each pushed block is sorted and merged into the previous run while that
+    run is at most twice as long, so only O(log n) runs exist. The k
+    smallest keys are then among the first k entries of each run, and
+    removing entries just advances the run's head.
+    """
+
+    def __init__(self):
+        self._runs = []  # [gaps, keys, head] with keys sorted
+
+    def __len__(self):
+        return sum(len(keys) - head for _, keys, head in self._runs)
+
+    def push(self, gaps, keys):
+        if not len(gaps):
+            return
+        order = np.argsort(keys, kind="stable")
+        self._runs.append([gaps[order], np.asarray(keys, dtype=float)[order], 0])
+        while len(self._runs) > 1 and self._size(-2) <= 2 * self._size(-1):
+            gaps_b, keys_b, head_b = self._runs.pop()
+            gaps_a, keys_a, head_a = self._runs.pop()
+            keys = np.concatenate([keys_a[head_a:], keys_b[head_b:]])
+            order = np.argsort(keys, kind="stable")
+            gaps = np.concatenate([gaps_a[head_a:], gaps_b[head_b:]])[order]
+            self._runs.append([gaps, keys[order], 0])
+
+    def _size(self, run):
+        _, keys, head = self._runs[run]
+        return len(keys) - head
+
+    def peek(self, k):
+        """Return (runs, gaps, keys) of the k smallest entries, sorted by key.
+
+        runs holds the run index of each entry. Ties are taken in run order,
+        so the entries of any run form a prefix of it, and so does every
+        prefix of the result.
+        """
+        heads = [keys[head:head + k] for _, keys, head in self._runs]
+        candidates = np.concatenate(heads)
+        k = min(k, len(candidates))
+        threshold = np.partition(candidates, k - 1)[k - 1]
+        counts = [int(np.searchsorted(h, threshold, side="left")) for h in heads]
+        ties = k - sum(counts)
+        for i, h in enumerate(heads):
+            extra = min(ties, int(np.searchsorted(h, threshold, side="right")) - counts[i])
+            counts[i] += extra
+            ties -= extra
+        runs = np.repeat(np.arange(len(heads)), counts)
+        keys = np.concatenate([h[:n] for h, n in zip(heads, counts)])
+        gaps = np.concatenate([
+            gaps[head:head + n] for (gaps, _, head), n in zip(self._runs, counts)
+        ])
+        order = np.argsort(keys, kind="stable")
+        return runs[order], gaps[order], keys[order]
+
+    def remove(self, runs):
+        """Remove a prefix of the entries returned by peek, given their runs."""
+        for run, n in enumerate(np.bincount(runs, minlength=len(self._runs)).tolist()):
+            self._runs[run][2] += n
+        kept = []
+        for gaps, keys, head in self._runs:
+            if head == len(keys):
+                continue
+            if 2 * head > len(keys):
+                # Release the consumed part
+                gaps, keys, head = gaps[head:].copy(), keys[head:].copy(), 0
+            kept.append([gaps, keys, head])
+        self._runs = kept
+
+
+def apollonian_gasket(
+    clines, min_radius=None, max_circles=None, order="largest", chunk_size=_GASKET_CHUNK_SIZE
+):
+    """Generate the Apollonian gasket of three mutually tangent clines.
+
+    The first chunk starts with the three given clines and the fourth cline
+    that completes their Descartes quadruple. Every circle after that fills
+    one gap of the packing. All clines are returned oriented and scaled to
+    Δ = 1: a circle has c = ±1/r, and an enclosing circle has c < 0.
+
+    Args:
+        clines (ClineArray or iterable of Cline): Three mutually tangent
+            circles or lines, e.g. three externally tangent circles, or two
+            circles inside a third.
+        min_radius (float, optional): Skip circles with a smaller radius,
+            together with everything inside their gaps.
+        max_circles (int, optional): Stop after this many clines in total.
+        order (str, optional): ``"largest"`` yields circles by decreasing
+            radius, for progressive rendering. ``"depth"`` fills the gaps
+            depth first, in batches of up to chunk_size gaps: every circle
+            still comes before those inside its gaps. Defaults to
+            ``"largest"``.
+        chunk_size (int, optional): Maximum number of circles per chunk.
+
+    Yields:
+        ClineArray: Successive chunks of the gasket.
+
+    Raises:
+        ValueError: if the clines are not mutually tangent, order is unknown,
+            or neither min_radius nor max_circles is given (every gasket is
+            infinite).
+
+    Memory use is set by the pending gaps, 128 bytes each. With
+    ``"largest"`` every circle yielded leaves up to three gaps behind for
+    one it used up, so the queue grows with the output, about two gaps per
+    circle (some 50 MB after 200,000 circles). With ``"depth"`` the stack
+    holds at most 3·chunk_size gaps per generation on the current path,
+    however many circles have been yielded, which suits very large gaskets
+    cut off by min_radius.
+    """
+    if order not in _ORDERS:
+        raise ValueError(f"order must be one of {_ORDERS}, got {order!r}")
+    if min_radius is None and max_circles is None:
+        raise ValueError("A gasket is infinite: give min_radius or max_circles")
+    max_curvature = np.inf if min_radius is None else 1 / min_radius
+    remaining = np.inf if max_circles is None else int(max_circles)
+
+    quadruple = _descartes_quadruple(clines)
+    roots = quadruple[:int(min(remaining, 4))]
+    if len(roots):
+        yield _to_cline_array(roots)
+    remaining -= len(roots)
+
+    for circles in _fill_gaps(_root_gaps(quadruple), max_curvature, remaining, order, chunk_size):
+        yield _to_cline_array(circles)
+
+
+def _fill_gaps(gaps, max_curvature, remaining, order, chunk_size):
+    """Fill gaps and all gaps created inside them, using an explicit work queue.
+
+    Args:
+        gaps (numpy.ndarray): Starting gaps, shape (G, 4, 4).
+        max_curvature (float): Skip circles with a larger signed curvature.
+        remaining (float): Maximum number of circles to produce (may be inf).
+        order (str): ``"largest"`` or ``"depth"``.
+        chunk_size (int): Maximum number of circles per yielded array.
+
+    Yields:
+        numpy.ndarray: Oriented coordinates of the new circles, shape (M, 4).
+    """
+    new = _fill(gaps)
+    keep = new[:, 0] <= max_curvature
+    if order == "depth":
+        yield from _fill_gaps_depth_first(gaps[keep], max_curvature, remaining, chunk_size)
+        return
+
+    queue = _GapQueue()
+    queue.push(gaps[keep], new[keep, 0])
+    while remaining > 0 and len(queue):
+        runs, gaps, keys = queue.peek(int(min(chunk_size, remaining)))
+        new = _fill(gaps)
+        child_curvatures = _child_curvatures(gaps, new)
+
+        # Emit the longest prefix that no child of an earlier entry undercuts
+        smallest_child = child_curvatures.min(axis=1)
+        undercut = np.minimum.accumulate(np.concatenate([[np.inf], smallest_child[:-1]]))
+        in_order = keys <= undercut
+        count = len(keys) if in_order.all() else int(np.argmin(in_order))
+        queue.remove(runs[:count])
+
+        child_keys = child_curvatures[:count].ravel()
+        keep = child_keys <= max_curvature
+        children = _children(gaps[:count], new[:count]).reshape(-1, 4, 4)
+        queue.push(children[keep], child_keys[keep])
+        remaining -= count
+        yield new[:count]
+
+
+def _fill_gaps_depth_first(gaps, max_curvature, remaining, chunk_size):
+    """Fill gaps depth first, keeping the pending gaps on a stack of blocks.
+
+    Each step takes up to chunk_size gaps from the top block and pushes the
+    block of their children, so the stack holds at most 3·chunk_size gaps
+    per level of the current path.
+    """
+    stack = [[gaps, 0]] if len(gaps) else []  # [gaps, head]
+    while remaining > 0 and stack:
+        block = stack[-1]
+        count = int(min(chunk_size, remaining, len(block[0]) - block[1]))
+        gaps = block[0][block[1]:block[1] + count]
+        block[1] += count
+        if block[1] == len(block[0]):
+            stack.pop()
+
+        new = _fill(gaps)
+        keep = _child_curvatures(gaps, new).ravel() <= max_curvature
+        children = _children(gaps, new).reshape(-1, 4, 4)[keep]
+        if len(children):
+            stack.append([children, 0])
+        remaining -= count
+        yield new
@@ -0,0 +1,4 @@
+"""Offline performance benchmarks for the cline library.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
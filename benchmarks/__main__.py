@@ -0,0 +1,106 @@
+"""
+Command-line entry point: ``python -m benchmarks``.
+
+Examples::
+
+    python -m benchmarks --quick                      # smallest size of everything
+    python -m benchmarks --filter invert exact        # only matching benchmarks
+    python -m benchmarks --save-baseline              # record benchmarks/baseline.json
+    python -m benchmarks --compare                    # flag regressions, exit 1 if any
+    python -m benchmarks --compare benchmarks/reference.json
+
+Timings depend on the machine, so the default baseline,
+``benchmarks/baseline.json``, is a local file that git ignores. Record it on
+the base commit and compare on the change. ``benchmarks/reference.json`` is
+a committed full run, together with the environment it was recorded in. It
+shows the expected magnitudes, and comparisons against it are only
+meaningful on similar hardware.
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks.harness import compare, format_report, load_baseline, measure, save_baseline
+from benchmarks.workloads import BENCHMARKS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def select(benchmarks, patterns):
+    """Return the benchmarks whose name contains any of the patterns."""
+    if not patterns:
+        return list(benchmarks)
+    return [b for b in benchmarks if any(p in b.name for p in patterns)]
+
+
+def run(benchmarks, quick=False, repeat=5, min_time=0.05, log=None):
+    """Measure the benchmarks and return the results.
+
+    Args:
+        benchmarks (list of Benchmark): What to run.
+        quick (bool, optional): Only the smallest size of each, with fewer repeats.
+        repeat (int, optional): Minimum number of timed runs per size.
+        min_time (float, optional): Minimum timed seconds per size.
+        log (file, optional): Stream for progress lines.
+
+    Returns:
+        list of dict: One result per benchmark and size, see
+        :func:`benchmarks.harness.measure`.
+    """
+    results = []
+    for bench in benchmarks:
+        sizes = bench.sizes[:1] if quick else bench.sizes
+        for size in sizes:
+            if log is not None:
+                print(f"  {bench.name}[{size}]", file=log, flush=True)
+            results.append(measure(bench, size, repeat=min(repeat, 3) if quick else repeat,
+                                   min_time=0 if quick else min_time))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", nargs="*", default=[], metavar="PATTERN",
+                        help="only run benchmarks whose name contains a pattern")
+    parser.add_argument("--quick", action="store_true", help="smallest size only, fewer repeats")
+    parser.add_argument("--repeat", type=int, default=5, help="minimum timed runs per size")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help=f"write results as the new baseline (default {DEFAULT_BASELINE})")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help="compare with a baseline and exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown counted as a regression (default 0.25)")
+    parser.add_argument("--output", metavar="PATH", help="also write the report to a file")
+    args = parser.parse_args(argv)
+
+    benchmarks = select(BENCHMARKS, args.filter)
+    if args.list:
+        for b in benchmarks:
+            print(f"{b.name:<38} sizes {', '.join(map(str, b.sizes))}")
+        return 0
+
+    results = run(benchmarks, quick=args.quick, repeat=args.repeat, log=sys.stderr)
+
+    comparison = None
+    if args.compare:
+        comparison = compare(results, load_baseline(args.compare), args.threshold)
+    report = format_report(results, comparison)
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"baseline written to {args.save_baseline}")
+
+    if comparison and any(row["regression"] for row in comparison):
+        print("performance regressions detected", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Timing, memory measurement and baseline comparison for the benchmark suite.
+
+Every benchmark has a setup function that builds its inputs from a seeded
+random generator and a run function that does the measured work. The seed is
+derived from the benchmark name and size, so each run of the suite times
+exactly the same inputs.
+"""
+
+import importlib.util
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+import zlib
+
+import numpy as np
+
+
+class Benchmark:
+    """A named, sized workload.
+
+    Attributes:
+        name (str): Dotted name, e.g. ``"invert.point"``. The first component
+            is the group.
+        setup (callable): ``setup(rng, size) -> state`` builds the inputs.
+        run (callable): ``run(state)`` does the measured work.
+        sizes (tuple of int): Input sizes to measure. ``size`` is also the
+            number of items used for the throughput figure.
+        requires (tuple of str): Modules that must be importable, otherwise
+            the benchmark is reported as skipped.
+    """
+
+    def __init__(self, name, setup, run, sizes, requires=()):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.sizes = tuple(sizes)
+        self.requires = tuple(requires)
+
+    @property
+    def group(self):
+        """The first component of the name."""
+        return self.name.split(".")[0]
+
+    def missing_requirements(self):
+        """Return the required modules that cannot be imported."""
+        return [m for m in self.requires if importlib.util.find_spec(m) is None]
+
+
+def result_key(name, size):
+    """Return the key under which a result is stored in a baseline."""
+    return f"{name}[{size}]"
+
+
+def measure(bench, size, repeat=5, min_time=0.05):
+    """Time one benchmark at one size.
+
+    The work is run once to warm up. It is then timed ``repeat`` times, or
+    more until ``min_time`` seconds have been spent, and run once more under
+    tracemalloc for the peak memory.
+
+    Args:
+        bench (Benchmark): The benchmark.
+        size (int): The input size.
+        repeat (int, optional): Minimum number of timed runs. Defaults to 5.
+        min_time (float, optional): Minimum total timed seconds. Defaults to 0.05.
+
+    Returns:
+        dict: ``name``, ``size``, ``best`` and ``median`` seconds per run,
+        ``throughput`` (items per second at the median), ``peak_bytes`` and
+        ``runs``. A skipped benchmark has ``skipped`` set to the reason instead.
+    """
+    missing = bench.missing_requirements()
+    if missing:
+        return {"name": bench.name, "size": size, "skipped": f"needs {', '.join(missing)}"}
+
+    rng = np.random.default_rng(zlib.crc32(result_key(bench.name, size).encode()))
+    state = bench.setup(rng, size)
+    bench.run(state)
+
+    times = []
+    spent = 0.0
+    while len(times) < repeat or spent < min_time:
+        start = time.perf_counter()
+        bench.run(state)
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        spent += elapsed
+
+    tracemalloc.start()
+    try:
+        bench.run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "name": bench.name,
+        "size": size,
+        "best": min(times),
+        "median": median,
+        "throughput": size / median if median > 0 else float("inf"),
+        "peak_bytes": peak,
+        "runs": len(times),
+    }
+
+
+def environment():
+    """Return a description of the machine and library versions."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def save_baseline(path, results):
+    """Write measured results to a JSON baseline file."""
+    data = {
+        "environment": environment(),
+        "results": {
+            result_key(r["name"], r["size"]): {
+                k: r[k] for k in ("median", "best", "throughput", "peak_bytes")
+            }
+            for r in results if "skipped" not in r
+        },
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """Read a JSON baseline file written by :func:`save_baseline`."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.25, memory_floor=1 << 16):
+    """Compare results with a baseline and flag regressions.
+
+    A result regresses when its median time or its peak memory exceeds the
+    baseline by more than ``threshold`` (a fraction: 0.25 is 25% slower).
+    Memory growth smaller than ``memory_floor`` bytes is ignored, since tiny
+    peaks are dominated by interpreter noise.
+
+    Args:
+        results (list of dict): Output of :func:`measure`.
+        baseline (dict): Output of :func:`load_baseline`.
+        threshold (float, optional): Allowed relative slowdown. Defaults to 0.25.
+        memory_floor (int, optional): Smallest memory growth, in bytes, that
+            can count as a regression. Defaults to 64 KiB.
+
+    Returns:
+        list of dict: One entry per result present in the baseline, with
+        ``key``, ``time_ratio``, ``memory_ratio`` and ``regression``.
+    """
+    reference = baseline["results"]
+    rows = []
+    for r in results:
+        key = result_key(r["name"], r["size"])
+        if "skipped" in r or key not in reference:
+            continue
+        base = reference[key]
+        time_ratio = r["median"] / base["median"] if base["median"] > 0 else 1.0
+        memory_ratio = (r["peak_bytes"] / base["peak_bytes"]) if base["peak_bytes"] > 0 else 1.0
+        rows.append({
+            "key": key,
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "regression": time_ratio > 1 + threshold or (
+                memory_ratio > 1 + threshold
+                and r["peak_bytes"] - base["peak_bytes"] > memory_floor
+            ),
+        })
+    return rows
+
+
+def _format_seconds(t):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if t >= scale:
+            return f"{t / scale:7.2f} {unit}"
+    return f"{t / 1e-9:7.2f} ns"
+
+
+def _format_bytes(n):
+    for unit, scale in (("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if n >= scale:
+            return f"{n / scale:7.1f} {unit}"
+    return f"{n:7d} B  "
+
+
+def format_report(results, comparison=None):
+    """Return a plain-text table of results, with baseline ratios if given."""
+    ratios = {row["key"]: row for row in comparison or []}
+    lines = [f"{'benchmark':<38} {'median':>10} {'items/s':>12} {'peak mem':>11}  vs baseline"]
+    for r in results:
+        key = result_key(r["name"], r["size"])
+        if "skipped" in r:
+            lines.append(f"{key:<38} skipped ({r['skipped']})")
+            continue
+        line = (
+            f"{key:<38} {_format_seconds(r['median']):>10} {r['throughput']:12.4g} "
+            f"{_format_bytes(r['peak_bytes']):>11}"
+        )
+        if key in ratios:
+            row = ratios[key]
+            line += f"  x{row['time_ratio']:.2f} time, x{row['memory_ratio']:.2f} mem"
+            if row["regression"]:
+                line += "  REGRESSION"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,560 @@
+"""
+Benchmark definitions.
+
+Scalar benchmarks loop over ``size`` independent inputs through the public
+Cline API, so their throughput is calls per second. Array benchmarks hand
+``size`` items to one vectorized call. The ``exact.*`` benchmarks use small
+sympy inputs at ``EXACT_SIZES``, since sympy is orders of magnitude slower.
+The ``gaussian.*`` benchmarks time the Gaussian-rational exact mode, which
+needs no sympy, at the scalar sizes.
+"""
+
+import subprocess
+import sys
+from fractions import Fraction
+
+import numpy as np
+
+from benchmarks.harness import Benchmark
+from cline import Cline
+from cline_array import ClineArray
+from inversive import contact_pairs, inversive_gram
+from mobius import MoebiusTransformation, TransformChain, transform_clines
+
+SCALAR_SIZES = (100, 1000, 10000)
+PAIR_SIZES = (100, 1000)
+ARRAY_SIZES = (1000, 100_000, 1_000_000)
+EXACT_SIZES = (5, 20)
+
+
+def _random_points(rng, n, scale=3.0):
+    return rng.normal(size=n) * scale + 1j * rng.normal(size=n) * scale
+
+
+def _random_circles(rng, n):
+    return [
+        Cline.from_circle(center=z, radius=r)
+        for z, r in zip(_random_points(rng, n).tolist(), rng.uniform(0.2, 3, size=n).tolist())
+    ]
+
+
+def _random_lines(rng, n):
+    return [
+        Cline.from_line(z1, z2)
+        for z1, z2 in zip(_random_points(rng, n).tolist(), _random_points(rng, n).tolist())
+    ]
+
+
+def _sparse_scene(rng, n):
+    """n small circles scattered so that each meets only a few others."""
+    side = np.sqrt(n) * 2.0
+    centers = rng.uniform(0, side, size=n) + 1j * rng.uniform(0, side, size=n)
+    radii = rng.uniform(0.3, 1.2, size=n)
+    return ClineArray(np.ones(n), -np.conj(centers), np.abs(centers) ** 2 - radii ** 2)
+
+
+def _exact_point(rng):
+    import sympy
+
+    a, b = (sympy.Rational(int(x), int(y)) for x, y in rng.integers(1, 9, size=(2, 2)))
+    return a + sympy.I * b
+
+
+def _gaussian_point(rng):
+    from gaussian import GaussianRational
+
+    a, b = (Fraction(int(x), int(y)) for x, y in rng.integers(1, 9, size=(2, 2)))
+    return GaussianRational(a, b)
+
+
+def _gaussian_circles(rng, n):
+    return [
+        Cline.from_circle(center=_gaussian_point(rng), radius=Fraction(int(rng.integers(1, 9)), 2))
+        for _ in range(n)
+    ]
+
+
+def _exact_circles(rng, n):
+    import sympy
+
+    return [
+        Cline.from_circle(center=_exact_point(rng), radius=sympy.Rational(int(rng.integers(1, 9)), 2))
+        for _ in range(n)
+    ]
+
+
+def _exact_lines(rng, n):
+    return [Cline.from_line(_exact_point(rng), _exact_point(rng) + 1) for _ in range(n)]
+
+
+def _unit_circle():
+    return Cline.from_circle(center=0, radius=1)
+
+
+def _grid_inversion(k_max):
+    """The grid-inversion example of docs/examples.rst on a (2 k_max + 1)-line grid.
+
+    Inverts every line x = k and y = k in the unit circle and samples each
+    image with 300 points, as the example does for plotting.
+    """
+    S = _unit_circle()
+    theta = np.linspace(0, 2 * np.pi, 300)
+    t = np.linspace(-2, 2, 300)
+    samples = []
+    for k in range(-k_max, k_max + 1):
+        for line in (Cline(c=0, alpha=1 + 0j, d=-2 * k), Cline(c=0, alpha=1j, d=2 * k)):
+            img = S.invert(line)
+            if img.is_line:
+                samples.append(img.point_on_line + t * img.direction_vector)
+            elif img.is_circle:
+                samples.append(img.center + img.radius * np.exp(1j * theta))
+    return samples
+
+
+def _apollonius(n):
+    from apollonius_anim import compute_apollonius
+
+    for _ in range(n):
+        compute_apollonius()
+
+
+def _gasket(n, order):
+    from apollonian import apollonian_gasket
+
+    roots = [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=0.5, radius=0.5),
+        Cline.from_circle(center=-0.5, radius=0.5),
+    ]
+    for _ in apollonian_gasket(roots, max_circles=n, order=order):
+        pass
+
+
+def _parallel_gasket(min_radius):
+    from parallel import parallel_gasket
+
+    roots = [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=0.5, radius=0.5),
+        Cline.from_circle(center=-0.5, radius=0.5),
+    ]
+    for _ in parallel_gasket(roots, min_radius=min_radius):
+        pass
+
+
+def _limit_set(min_radius):
+    from limit_set import limit_set
+
+    mirrors = [Cline.from_circle(center=np.exp(2j * np.pi * k / 3), radius=0.85) for k in range(3)]
+    for _ in limit_set(mirrors, min_radius=min_radius):
+        pass
+
+
+def _parallel_limit_set(min_radius):
+    from parallel import parallel_limit_set
+
+    mirrors = [Cline.from_circle(center=np.exp(2j * np.pi * k / 3), radius=0.85) for k in range(3)]
+    for _ in parallel_limit_set(mirrors, min_radius=min_radius):
+        pass
+
+
+def _orbit(max_length):
+    from orbit import reflection_orbit
+
+    mirrors = [
+        Cline.from_line(0, 1j),
+        Cline.from_line(0.5, 0.5 + 1j),
+        Cline.from_circle(center=0, radius=1),
+    ]
+    seed = Cline.from_circle(center=0.2 + 1.5j, radius=0.1)
+    reflection_orbit([seed], mirrors, max_length=max_length, min_radius=1e-4)
+
+
+def _plot(clines):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    for C in clines:
+        C.plot(ax=ax, show_points=False)
+    plt.close(fig)
+
+
+def _plot_zoomed(clines):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    for C in clines:
+        C.plot(ax=ax, xlim=(-1, 1), ylim=(-1, 1), show_points=False)
+    plt.close(fig)
+
+
+def _plot_collection(clines):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from plotting import plot_clines
+
+    fig, ax = plt.subplots()
+    plot_clines(clines, ax=ax)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _import_cline(_):
+    subprocess.run([sys.executable, "-c", "import cline"], check=True)
+
+
+def _pairs(make_a, make_b):
+    def setup(rng, n):
+        return list(zip(make_a(rng, n), make_b(rng, n)))
+    return setup
+
+
+def _three_points(rng, n):
+    return _random_points(rng, 3 * n).reshape(n, 3).tolist()
+
+
+BENCHMARKS = [
+    # Constructors
+    Benchmark(
+        "construct.direct",
+        lambda rng, n: list(zip(rng.normal(size=n).tolist(), _random_points(rng, n).tolist(),
+                                rng.normal(size=n).tolist())),
+        lambda args: [Cline(c=c, alpha=a, d=d) for c, a, d in args],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "construct.from_circle",
+        lambda rng, n: list(zip(_random_points(rng, n).tolist(), rng.uniform(0.2, 3, size=n).tolist())),
+        lambda args: [Cline.from_circle(center=z, radius=r) for z, r in args],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "construct.from_line",
+        lambda rng, n: list(zip(_random_points(rng, n).tolist(), _random_points(rng, n).tolist())),
+        lambda args: [Cline.from_line(z1, z2) for z1, z2 in args],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "construct.from_three_points",
+        _three_points,
+        lambda args: [Cline.from_three_points(*zs) for zs in args],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "construct.from_three_points_array",
+        lambda rng, n: _random_points(rng, 3 * n).reshape(n, 3),
+        ClineArray.from_three_points,
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "construct.fit",
+        lambda rng, n: 2 + 1j + np.exp(1j * rng.uniform(0, 2 * np.pi, n)) + 0.01 * _random_points(rng, n),
+        Cline.fit,
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "construct.fit_refined",
+        lambda rng, n: 2 + 1j + np.exp(1j * rng.uniform(0, 2 * np.pi, n)) + 0.01 * _random_points(rng, n),
+        lambda zs: Cline.fit(zs, refine=True),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "construct.cline_array",
+        lambda rng, n: _random_circles(rng, n),
+        ClineArray.from_clines,
+        SCALAR_SIZES,
+    ),
+
+    # Deduplication
+    Benchmark(
+        "dedup.set",
+        lambda rng, n: _random_circles(rng, n // 2) * 2,
+        set,
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "dedup.unique_array",
+        lambda rng, n: ClineArray.concatenate([_sparse_scene(rng, n // 2)] * 2),
+        ClineArray.unique,
+        ARRAY_SIZES,
+    ),
+
+    # Inversion
+    Benchmark(
+        "invert.point",
+        lambda rng, n: (_unit_circle(), _random_points(rng, n).tolist()),
+        lambda s: [s[0].invert(z) for z in s[1]],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "invert.cline",
+        lambda rng, n: (_unit_circle(), _random_circles(rng, n)),
+        lambda s: [s[0].invert(C) for C in s[1]],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "invert.points_array",
+        lambda rng, n: (_unit_circle(), _random_points(rng, n)),
+        lambda s: s[0].invert_points(s[1]),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "invert.cline_array",
+        lambda rng, n: (_unit_circle(), _sparse_scene(rng, n)),
+        lambda s: s[1].invert_in(s[0]),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "evaluate.points_array",
+        lambda rng, n: (_unit_circle(), _random_points(rng, n)),
+        lambda s: s[0].evaluate(s[1]),
+        ARRAY_SIZES,
+    ),
+
+    # Möbius transformations
+    Benchmark(
+        "mobius.point",
+        lambda rng, n: (MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4), _random_points(rng, n).tolist()),
+        lambda s: [s[0](z) for z in s[1]],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "mobius.points_array",
+        lambda rng, n: (MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4), _random_points(rng, n)),
+        lambda s: s[0](s[1]),
+        ARRAY_SIZES + (10_000_000,),
+    ),
+    Benchmark(
+        "mobius.transform_cline",
+        lambda rng, n: (MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4), _random_circles(rng, n)),
+        lambda s: [s[0].transform_cline(C) for C in s[1]],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "mobius.transform_clines",
+        lambda rng, n: (MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4), _sparse_scene(rng, n).hermitian_matrix),
+        lambda s: transform_clines(*s),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "mobius.chain_inversions",
+        lambda rng, n: (_random_circles(rng, n), _random_points(rng, 1000)),
+        lambda s: TransformChain(s[0])(s[1]),
+        SCALAR_SIZES,
+    ),
+
+    # Intersection, angle and orthogonality
+    Benchmark(
+        "intersection.circle_circle",
+        _pairs(_random_circles, _random_circles),
+        lambda pairs: [C1.intersection(C2) for C1, C2 in pairs],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "intersection.circle_line",
+        _pairs(_random_circles, _random_lines),
+        lambda pairs: [C.intersection(L) for C, L in pairs],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "intersection.line_line",
+        _pairs(_random_lines, _random_lines),
+        lambda pairs: [L1.intersection(L2) for L1, L2 in pairs],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "intersection.pairwise_sparse",
+        _sparse_scene,
+        lambda A: A.pairwise_intersections(),
+        (1000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "intersection.pairwise_dense",
+        lambda rng, n: ClineArray.from_clines(_random_circles(rng, n)),
+        lambda A: A.pairwise_intersections(index=False),
+        PAIR_SIZES,
+    ),
+    Benchmark(
+        "angle.circle_circle",
+        _pairs(_random_circles, _random_circles),
+        lambda pairs: [C1.angle(C2) for C1, C2 in pairs],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "orthogonal.scalar",
+        _pairs(_random_circles, _random_lines),
+        lambda pairs: [C.is_orthogonal(L) for C, L in pairs],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "orthogonal.gram",
+        lambda rng, n: ClineArray.from_clines(_random_circles(rng, n)),
+        inversive_gram,
+        (100, 1000, 4000),
+    ),
+    Benchmark(
+        "orthogonal.contact_pairs",
+        _sparse_scene,
+        lambda A: contact_pairs(A, "intersecting"),
+        (1000, 10_000, 100_000),
+    ),
+
+    # Plotting
+    Benchmark(
+        "plot.clines",
+        lambda rng, n: _random_circles(rng, n - n // 2) + _random_lines(rng, n // 2),
+        _plot,
+        (1, 10, 50),
+        requires=("matplotlib",),
+    ),
+    Benchmark(
+        "plot.zoomed",
+        lambda rng, n: [
+            Cline.from_circle(center=complex(0, r), radius=r)
+            for r in np.logspace(-3, 6, n).tolist()
+        ],
+        _plot_zoomed,
+        (10, 50),
+        requires=("matplotlib",),
+    ),
+    Benchmark(
+        "plot.collection",
+        lambda rng, n: ClineArray.concatenate([
+            _sparse_scene(rng, n - n // 10),
+            ClineArray.from_clines(_random_lines(rng, n // 10)),
+        ]),
+        _plot_collection,
+        (1000, 10_000),
+        requires=("matplotlib",),
+    ),
+
+    # Exact mode
+    Benchmark(
+        "exact.from_circle",
+        lambda rng, n: [(_exact_point(rng), int(rng.integers(1, 9))) for _ in range(n)],
+        lambda args: [Cline.from_circle(center=z, radius=r) for z, r in args],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+    Benchmark(
+        "exact.from_three_points",
+        lambda rng, n: [[_exact_point(rng) for _ in range(3)] for _ in range(n)],
+        lambda args: [Cline.from_three_points(*zs) for zs in args],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+    Benchmark(
+        "exact.invert_point",
+        lambda rng, n: (_exact_circles(rng, 1)[0], [_exact_point(rng) for _ in range(n)]),
+        lambda s: [s[0].invert(z) for z in s[1]],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+    Benchmark(
+        "exact.invert_cline",
+        lambda rng, n: (_exact_circles(rng, 1)[0], _exact_circles(rng, n)),
+        lambda s: [s[0].invert(C) for C in s[1]],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+    Benchmark(
+        "exact.intersection",
+        lambda rng, n: list(zip(_exact_circles(rng, n), _exact_lines(rng, n))),
+        lambda pairs: [C.intersection(L) for C, L in pairs],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+    Benchmark(
+        "exact.orthogonal",
+        lambda rng, n: list(zip(_exact_circles(rng, n), _exact_circles(rng, n))),
+        lambda pairs: [C1.is_orthogonal(C2) for C1, C2 in pairs],
+        EXACT_SIZES,
+        requires=("sympy",),
+    ),
+
+    # Gaussian-rational exact mode
+    Benchmark(
+        "gaussian.from_three_points",
+        lambda rng, n: [[_gaussian_point(rng) for _ in range(3)] for _ in range(n)],
+        lambda args: [Cline.from_three_points(*zs) for zs in args],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "gaussian.invert_cline",
+        lambda rng, n: (_gaussian_circles(rng, 1)[0], _gaussian_circles(rng, n)),
+        lambda s: [s[0].invert(C) for C in s[1]],
+        SCALAR_SIZES,
+    ),
+    Benchmark(
+        "gaussian.orthogonal",
+        lambda rng, n: list(zip(_gaussian_circles(rng, n), _gaussian_circles(rng, n))),
+        lambda pairs: [C1.is_orthogonal(C2) for C1, C2 in pairs],
+        SCALAR_SIZES,
+    ),
+
+    # End-to-end workloads
+    Benchmark(
+        "workload.grid_inversion",
+        lambda rng, n: n,
+        _grid_inversion,
+        (3, 30, 300),
+    ),
+    Benchmark(
+        "workload.apollonius",
+        lambda rng, n: n,
+        _apollonius,
+        (1, 100),
+        requires=("manim",),
+    ),
+    Benchmark(
+        "workload.gasket_largest",
+        lambda rng, n: n,
+        lambda n: _gasket(n, "largest"),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "workload.gasket_depth",
+        lambda rng, n: n,
+        lambda n: _gasket(n, "depth"),
+        ARRAY_SIZES,
+    ),
+    Benchmark(
+        "workload.gasket_parallel",
+        lambda rng, n: 1 / n,
+        _parallel_gasket,
+        (1000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "workload.limit_set",
+        lambda rng, n: 1 / n,
+        _limit_set,
+        (1000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "workload.limit_set_parallel",
+        lambda rng, n: 1 / n,
+        _parallel_limit_set,
+        (1000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "workload.reflection_orbit",
+        lambda rng, n: n,
+        _orbit,
+        (10, 20, 40),
+    ),
+    Benchmark(
+        "import.cline",
+        lambda rng, n: n,
+        _import_cline,
+        (1,),
+    ),
+]
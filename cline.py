@@ -18,42 +18,89 @@ Based on the parameters, we have:
 - Is not a valid geometric object (no solutions) if $|\alpha|^2 < c \cdot d$ and $c \neq 0$
 """
 
-import matplotlib.pyplot as plt
+import functools
+import importlib
+import sys
+from fractions import Fraction
+
 import numpy as np
 
-try:
-    import sympy
-    _HAS_SYMPY = True
-except ImportError:
-    _HAS_SYMPY = False
+from gaussian import (
+    GaussianRational, _as_gaussian, _as_real_fraction, _fraction_sqrt, _is_gaussian_input,
+)
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    sympy and matplotlib take far longer to import than the rest of this
+    module, and purely numeric code never touches them.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+sympy = _LazyModule("sympy")
+
+
+def _loaded_sympy():
+    """Return the sympy module if it has been imported, else None.
+
+    A sympy object can only exist once sympy has been imported, so type checks
+    against it never need to trigger the import themselves.
+    """
+    return sys.modules.get("sympy")
 
 
 def _is_sympy(x):
     """Check if x is a sympy expression."""
-    return _HAS_SYMPY and isinstance(x, sympy.Basic)
+    module = _loaded_sympy()
+    return module is not None and isinstance(x, module.Basic)
 
 
 def _conjugate(x):
-    """Conjugate that works for both numeric and sympy types."""
+    """Conjugate that works for numeric, Gaussian-rational and sympy types."""
     if _is_sympy(x):
         return sympy.conjugate(x)
+    if isinstance(x, (GaussianRational, Fraction)):
+        return x.conjugate()
     return np.conj(x)
 
 
 def _abs_sq(x):
-    """Compute |x|^2 for both numeric and sympy types."""
+    """Compute |x|^2 for numeric, Gaussian-rational and sympy types."""
     if _is_sympy(x):
         return (x * sympy.conjugate(x)).expand()
+    if isinstance(x, GaussianRational):
+        return x.abs_sq()
     return abs(x) ** 2
 
 
 def _real(x):
-    """Real part for both numeric and sympy types."""
+    """Real part for numeric, Gaussian-rational and sympy types."""
     if _is_sympy(x):
         return sympy.re(x)
+    if isinstance(x, (GaussianRational, Fraction)):
+        return x.real
     return np.real(x)
 
 
+def _imag(x):
+    """Imaginary part for numeric, Gaussian-rational and sympy types."""
+    if _is_sympy(x):
+        return sympy.im(x)
+    if isinstance(x, (GaussianRational, Fraction)):
+        return x.imag
+    return np.imag(x)
+
+
 def _sqrt(x):
     """Square root for both numeric and sympy types."""
     if _is_sympy(x):
@@ -63,7 +110,261 @@ def _sqrt(x):
 
 def _is_infinity(z):
     """Check if z is the point at infinity (sympy.zoo)."""
-    return _HAS_SYMPY and z is sympy.zoo
+    module = _loaded_sympy()
+    return module is not None and z is module.zoo
+
+
+# Default number of simplified expressions kept by _simplify
+_SIMPLIFY_CACHE_SIZE = 1024
+
+
+def _make_simplify_cache(maxsize):
+    # typed=True keeps e.g. Integer(2) and Float(2.0) apart, which the exact
+    # mode relies on
+    return functools.lru_cache(maxsize=maxsize, typed=True)(lambda expr: sympy.simplify(expr))
+
+
+_simplify_cached = _make_simplify_cache(_SIMPLIFY_CACHE_SIZE)
+
+
+def _simplify(expr):
+    """sympy.simplify through a bounded LRU cache keyed by the expression.
+
+    Exact-mode code paths simplify the same expressions over and over (for
+    example when a family of clines is inverted in the same mirror), and
+    each simplify call can take a sizeable fraction of a second. sympy
+    expressions are immutable and hashable, so the result can be reused.
+    """
+    try:
+        return _simplify_cached(expr)
+    except TypeError:  # unhashable input
+        return sympy.simplify(expr)
+
+
+def simplify_cache_info():
+    """Return the statistics of the exact-mode simplification cache.
+
+    Returns:
+        functools._CacheInfo: Named tuple (hits, misses, maxsize, currsize).
+    """
+    return _simplify_cached.cache_info()
+
+
+def set_simplify_cache_size(maxsize):
+    """Resize the exact-mode simplification cache, discarding its contents.
+
+    Args:
+        maxsize (int or None): Maximum number of cached expressions. 0
+            disables caching and None removes the bound.
+    """
+    global _simplify_cached
+    _simplify_cached = _make_simplify_cache(maxsize)
+
+
+def clear_simplify_cache():
+    """Empty the exact-mode simplification cache and reset its statistics."""
+    _simplify_cached.cache_clear()
+
+
+# Number of elements processed per block by the array kernels below
+_BLOCK_SIZE = 1 << 14
+
+
+def _hermitian_form(c, alpha, d, zs, out=None):
+    r"""Evaluate :math:`c|z|^2 + 2\text{Re}(\alpha z) + d` over broadcast arrays.
+
+    All of c, alpha, d and zs broadcast against each other. The result is written
+    into ``out`` (allocated if None). The work is done in blocks of about
+    ``_BLOCK_SIZE`` elements, so the only scratch memory is one block-sized buffer.
+    """
+    c = np.asarray(c, dtype=float)
+    alpha = np.asarray(alpha, dtype=complex)
+    d = np.asarray(d, dtype=float)
+    zs = np.asarray(zs, dtype=complex)
+    shape = np.broadcast_shapes(c.shape, alpha.shape, d.shape, zs.shape)
+
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape or out.dtype != np.float64:
+        raise ValueError(f"out must be a float64 array of shape {shape}")
+
+    if out.ndim == 0:
+        x, y = zs.real, zs.imag
+        out[...] = c * (x * x + y * y) + 2 * (alpha.real * x - alpha.imag * y) + d
+        return out
+
+    c, a, b, d, x, y = (
+        np.broadcast_to(v, shape) for v in (c, alpha.real, alpha.imag, d, zs.real, zs.imag)
+    )
+    row = int(np.prod(shape[1:]))
+    step = max(1, _BLOCK_SIZE // max(row, 1))
+    scratch = np.empty((min(step, shape[0]),) + shape[1:])
+    for start in range(0, shape[0], step):
+        s = slice(start, start + step)
+        o = out[s]
+        t = scratch[: o.shape[0]]
+        # o = x(cx + 2a) = c x^2 + 2ax
+        np.multiply(c[s], x[s], out=o)
+        o += a[s]
+        o += a[s]
+        o *= x[s]
+        # t = y(cy - 2b) = c y^2 - 2by
+        np.multiply(c[s], y[s], out=t)
+        t -= b[s]
+        t -= b[s]
+        t *= y[s]
+        o += t
+        o += d[s]
+    return out
+
+
+def _invert_coefficients(c, alpha, d, c_j, alpha_j, d_j):
+    r"""Coefficients of the image of the cline (c, alpha, d) under inversion in J.
+
+    Returns :math:`(c, \alpha, d) + (P/\Delta_J)(c_J, \alpha_J, d_J)` with
+    :math:`P = c d_J + c_J d - 2\text{Re}(\alpha\bar\alpha_J)`. Works on numbers,
+    broadcast NumPy arrays and sympy expressions.
+    """
+    product = c * d_j + c_j * d - 2 * _real(alpha * _conjugate(alpha_j))
+    scale = product / (_abs_sq(alpha_j) - c_j * d_j)
+    return c + scale * c_j, alpha + scale * alpha_j, d + scale * d_j
+
+
+def _invert_points(c, alpha, d, zs, out=None):
+    r"""Invert points in clines, :math:`z^* = -(\bar\alpha\bar z + d)/(c\bar z + \alpha)`.
+
+    This single formula covers inversion in a circle and reflection in a line.
+    All of c, alpha, d and zs broadcast against each other. NaN stands for the
+    point at infinity, both in zs and in the result: the center of a circle maps
+    to NaN and NaN maps to the center. The result is written into ``out``
+    (allocated if None).
+    """
+    c = np.asarray(c, dtype=float)
+    alpha = np.asarray(alpha, dtype=complex)
+    d = np.asarray(d, dtype=float)
+    zs = np.asarray(zs, dtype=complex)
+    shape = np.broadcast_shapes(c.shape, alpha.shape, d.shape, zs.shape)
+
+    if out is None:
+        out = np.empty(shape, dtype=complex)
+    elif out.shape != shape or out.dtype != np.complex128:
+        raise ValueError(f"out must be a complex128 array of shape {shape}")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zs_conj = np.conj(zs)
+        den = c * zs_conj + alpha
+        np.multiply(np.conj(alpha), zs_conj, out=out)
+        out += d
+        out /= den
+        np.negative(out, out=out)
+
+        # z = center (up to 1e-15) has no finite image
+        pole = np.abs(den) < 1e-15 * np.abs(c)
+        if pole.any():
+            out[np.broadcast_to(pole, shape)] = np.nan
+
+        # ∞ maps to the center of a circle and stays ∞ for a line
+        at_infinity = ~np.isfinite(zs)
+        if at_infinity.any():
+            image = np.where(np.abs(c) > 1e-10, -np.conj(alpha) / c, np.nan)
+            mask = np.broadcast_to(at_infinity, shape)
+            out[mask] = np.broadcast_to(image, shape)[mask]
+    return out
+
+
+# Quantum of the canonical coefficients compared by Cline.__eq__ and __hash__
+_KEY_TOLERANCE = 1e-9
+
+
+def _unit_coefficients(c, alpha, d):
+    r"""Stack :math:`(c, \text{Re}\,\alpha, \text{Im}\,\alpha, d)` and scale each row to unit norm.
+
+    The result has shape (N, 4) and is defined up to the sign of each row.
+    Rows of zeros or with non-finite entries become NaN.
+    """
+    alpha = np.asarray(alpha, dtype=complex)
+    coefficients = np.stack(np.broadcast_arrays(
+        np.asarray(c, dtype=float), alpha.real, alpha.imag, np.asarray(d, dtype=float)
+    ), axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coefficients /= np.linalg.norm(coefficients, axis=-1, keepdims=True)
+    return coefficients
+
+
+def _canonical_keys(c, alpha, d, tolerance=_KEY_TOLERANCE):
+    """Integer keys of shape (N, 4) that are equal for equal clines.
+
+    The unit-norm coefficients of :func:`_unit_coefficients` get the sign
+    that makes their first component larger than tolerance in absolute
+    value positive (c for circles, then alpha for lines). They are then
+    rounded to integer multiples of tolerance. The keys do not depend on
+    the scale or sign of (c, alpha, d). Clines whose coefficients differ by
+    much less than tolerance (relative to their norm) almost always share
+    a key, but two such clines can fall on either side of a rounding
+    boundary.
+
+    Rows with non-finite coefficients get arbitrary keys and must be
+    filtered out by the caller.
+    """
+    coefficients = _unit_coefficients(c, alpha, d)
+    rows = np.arange(len(coefficients))
+    first = np.argmax(np.abs(coefficients[:, :3]) > tolerance, axis=1)
+    coefficients[coefficients[rows, first] < 0] *= -1
+    with np.errstate(invalid="ignore"):
+        keys = np.round(coefficients / tolerance)
+    return np.nan_to_num(keys).astype(np.int64)
+
+
+def _unit_distance(c1, alpha1, d1, c2, alpha2, d2):
+    """Largest difference of the unit-norm coefficients of two sets of clines, up to sign.
+
+    The arguments broadcast against each other. The result is 0 for equal
+    clines, whatever their scale.
+    """
+    u = _unit_coefficients(c1, alpha1, d1)
+    v = _unit_coefficients(c2, alpha2, d2)
+    return np.minimum(np.abs(u - v).max(axis=-1), np.abs(u + v).max(axis=-1))
+
+
+def _common_mode(C1, C2):
+    """Return two clines in a common arithmetic mode.
+
+    A Gaussian-rational cline paired with a sympy cline is converted to
+    sympy, and one paired with a numeric cline is converted to floats.
+    """
+    if C1._is_gaussian == C2._is_gaussian:
+        return C1, C2
+    gaussian, other = (C1, C2) if C1._is_gaussian else (C2, C1)
+    if other._is_exact:
+        converted = gaussian._to_sympy()
+    else:
+        converted = gaussian._to_numeric()
+    return (converted, other) if C1._is_gaussian else (other, converted)
+
+
+class _lazy_attribute:
+    """Derived Cline attribute that is computed on first access and cached in a slot.
+
+    The value is stored in the slot named after the attribute with a leading
+    underscore. A slot that has never been assigned raises AttributeError, which
+    marks the value as not computed yet.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.slot = "_" + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            pass
+        value = self.func(obj)
+        setattr(obj, self.slot, value)
+        return value
 
 
 class Cline:
@@ -78,6 +379,13 @@ class Cline:
     where c and d are real numbers and alpha is complex.
     """
 
+    __slots__ = (
+        "c", "alpha", "d", "_is_exact", "_is_gaussian", "points", "discriminant",
+        "is_circle", "is_point", "is_line",
+        "_center", "_radius", "_point", "_a", "_b", "_normal_vector",
+        "_direction_vector", "_distance_from_origin", "_point_on_line", "_canonical_key",
+    )
+
     def __init__(self, c=0.0, alpha=0.0 + 0.0j, d=0.0):
         r"""Initialize a cline with its equation parameters.
 
@@ -149,14 +457,24 @@ class Cline:
                * Direction vector: :math:`v = \text{Im}(\alpha) - i \cdot \text{Re}(\alpha)`
                * Distance from origin: :math:`\frac{|d|}{2|\alpha|}`
                * A point on the line by setting either x=0 or y=0 in the Cartesian form
+
+            Only steps 1 and 2 run here. The quantities of steps 3-5 are computed
+            on first access and cached, so short-lived clines that are only used
+            through c, alpha and d never pay for them.
         """
-        # Detect symbolic mode
+        # Detect symbolic mode, then the Gaussian-rational mode (also exact)
+        self._is_gaussian = False
         self._is_exact = any(_is_sympy(x) for x in (c, alpha, d))
 
         if self._is_exact:
             self.c = sympy.sympify(c)
             self.d = sympy.sympify(d)
             self.alpha = sympy.sympify(alpha)
+        elif _is_gaussian_input(c, alpha, d):
+            self._is_exact = self._is_gaussian = True
+            self.c = _as_real_fraction(c)
+            self.d = _as_real_fraction(d)
+            self.alpha = _as_gaussian(alpha)
         else:
             self.c = float(c)
             self.d = float(d)
@@ -169,14 +487,18 @@ class Cline:
         self.discriminant = _abs_sq(self.alpha) - self.c * self.d
 
         # Determine if it's a circle, point, or line
-        if self._is_exact:
+        if self._is_gaussian:
+            self.is_line = self.c == 0
+            self.is_circle = not self.is_line and self.discriminant > 0
+            self.is_point = not self.is_line and self.discriminant == 0
+        elif self._is_exact:
             c_is_zero = self.c == 0
             if c_is_zero:
                 self.is_circle = False
                 self.is_point = False
                 self.is_line = True
             else:
-                disc_simplified = sympy.simplify(self.discriminant)
+                disc_simplified = _simplify(self.discriminant)
                 if disc_simplified.is_positive:
                     self.is_circle = True
                     self.is_point = False
@@ -213,52 +535,132 @@ class Cline:
                 self.is_point = False
                 self.is_line = True
 
-        # Compute center and radius for circles
-        if self.is_circle:
-            # Center: z_0 = -conj(alpha)/c
-            self.center = -_conjugate(self.alpha) / self.c
+    @_lazy_attribute
+    def center(self):
+        r"""Center :math:`-\bar{\alpha}/c` of a circle."""
+        if not self.is_circle:
+            raise AttributeError("center is only defined for circles")
+        return -_conjugate(self.alpha) / self.c
 
-            # Radius: r = sqrt(discriminant) / |c|
-            if self._is_exact:
-                self.radius = _sqrt(self.discriminant) / sympy.Abs(self.c)
-            else:
-                self.radius = np.sqrt(self.discriminant) / abs(self.c)
+    @_lazy_attribute
+    def radius(self):
+        r"""Radius :math:`\sqrt{\Delta}/|c|` of a circle.
 
-        # Compute point location when discriminant = 0
-        if self.is_point:
-            # Point location: z_0 = -conj(alpha)/c
-            self.point = -_conjugate(self.alpha) / self.c
+        In Gaussian-rational mode this is a Fraction when the radius is
+        rational and a sympy expression otherwise.
+        """
+        if not self.is_circle:
+            raise AttributeError("radius is only defined for circles")
+        if self._is_gaussian:
+            radius_sq = self.discriminant / (self.c * self.c)
+            root = _fraction_sqrt(radius_sq)
+            if root is not None:
+                return root
+            return sympy.sqrt(sympy.Rational(radius_sq.numerator, radius_sq.denominator))
+        if self._is_exact:
+            return _sqrt(self.discriminant) / sympy.Abs(self.c)
+        return np.sqrt(self.discriminant) / abs(self.c)
+
+    @_lazy_attribute
+    def point(self):
+        r"""Location :math:`-\bar{\alpha}/c` of a point cline (discriminant 0)."""
+        if not self.is_point:
+            raise AttributeError("point is only defined for point clines")
+        return -_conjugate(self.alpha) / self.c
+
+    @_lazy_attribute
+    def a(self):
+        """Real part of alpha for a line, as in the Cartesian form ax - by + d/2 = 0."""
+        if not self.is_line:
+            raise AttributeError("a is only defined for lines")
+        return _real(self.alpha)
+
+    @_lazy_attribute
+    def b(self):
+        """Imaginary part of alpha for a line, as in the Cartesian form ax - by + d/2 = 0."""
+        if not self.is_line:
+            raise AttributeError("b is only defined for lines")
+        return _imag(self.alpha)
+
+    @_lazy_attribute
+    def normal_vector(self):
+        """Normal vector alpha of a line."""
+        if not self.is_line:
+            raise AttributeError("normal_vector is only defined for lines")
+        return self.alpha
+
+    @_lazy_attribute
+    def direction_vector(self):
+        """Direction vector b - ai of a line (perpendicular to the normal)."""
+        if not self.is_line:
+            raise AttributeError("direction_vector is only defined for lines")
+        if self._is_gaussian:
+            return GaussianRational(self.b, -self.a)
+        if self._is_exact:
+            return self.b - sympy.I * self.a
+        return complex(self.b, -self.a)
+
+    @_lazy_attribute
+    def distance_from_origin(self):
+        """Distance |d|/(2|alpha|) from the origin to a line (numeric mode)."""
+        if not self.is_line or self._is_exact:
+            raise AttributeError("distance_from_origin is only defined for numeric lines")
+        if abs(self.alpha) > 1e-10:
+            return abs(self.d) / (2 * abs(self.alpha))
+        return float("inf")
+
+    @_lazy_attribute
+    def point_on_line(self):
+        """A point on a line, found by setting x=0 or y=0 in the Cartesian form (numeric mode)."""
+        if not self.is_line or self._is_exact:
+            raise AttributeError("point_on_line is only defined for numeric lines")
+        if abs(self.a) > abs(self.b):
+            x = -self.d / (2 * self.a)
+            y = 0
+        else:
+            x = 0
+            y = self.d / (2 * self.b)
+        return complex(x, y)
+
+    def _to_sympy(self):
+        """Return a copy of a Gaussian-rational cline with sympy coefficients."""
+        return Cline(
+            c=sympy.Rational(self.c.numerator, self.c.denominator),
+            alpha=sympy.sympify(self.alpha),
+            d=sympy.Rational(self.d.numerator, self.d.denominator),
+        )
 
-        # Compute line properties when c = 0
-        if self.is_line:
-            if self._is_exact:
-                self.a = sympy.re(self.alpha)
-                self.b = sympy.im(self.alpha)
-                self.normal_vector = self.alpha
-                self.direction_vector = self.b - sympy.I * self.a
-            else:
-                self.a = np.real(self.alpha)
-                self.b = np.imag(self.alpha)
-                self.normal_vector = self.alpha
-                self.direction_vector = complex(self.b, -self.a)
-
-                # Distance from origin: |d|/(2|alpha|)
-                if abs(self.alpha) > 1e-10:
-                    self.distance_from_origin = abs(self.d) / (2 * abs(self.alpha))
-                else:
-                    self.distance_from_origin = float("inf")
+    def _to_numeric(self):
+        """Return a copy of an exact cline with floating-point coefficients."""
+        return Cline(c=float(self.c), alpha=complex(self.alpha), d=float(self.d))
 
-                # Find a point on the line for parametric form
-                if abs(self.a) > abs(self.b):
-                    x = -self.d / (2 * self.a)
-                    y = 0
-                else:
-                    x = 0
-                    y = self.d / (2 * self.b)
-                self.point_on_line = complex(x, y)
+    def _to_gaussian(self):
+        """Return a sympy cline in Gaussian-rational mode, scaled as by canonical().
+
+        The coefficients are scaled like a Gaussian-rational cline in
+        :meth:`canonical` before they are simplified, so a sympy cline equal
+        to some Gaussian-rational cline always converts. Returns None for
+        clines with free symbols or irrational coefficients at that scale.
+        """
+        if any(x.free_symbols for x in (self.c, self.alpha, self.d)):
+            return None
+        c = _simplify(self.c)
+        re, im = _simplify(sympy.re(self.alpha)), _simplify(sympy.im(self.alpha))
+        if c != 0:
+            scale = 1 / c
+        elif re != 0 or im != 0:
+            scale = 1 / (re if re != 0 else im)
+        else:
+            scale = sympy.Integer(1)
+        values = [_simplify(x * scale) for x in (c, re, im, self.d)]
+        if not all(x.is_Rational for x in values):
+            return None
+        c, re, im, d = (Fraction(int(x.p), int(x.q)) for x in values)
+        return Cline(c=c, alpha=GaussianRational(re, im), d=d)
 
     def _format_complex(self, z, precision=4):
         """Format a complex number with specified precision."""
+        z = complex(z)
         real = round(z.real, precision)
         imag = round(z.imag, precision)
 
@@ -277,7 +679,7 @@ class Cline:
 
     def _format_float(self, x, precision=4):
         """Format a float with specified precision."""
-        rounded = round(x, precision)
+        rounded = round(float(x), precision)
 
         # Remove trailing zeros
         if rounded == int(rounded):
@@ -456,6 +858,8 @@ class Cline:
             z1 = sympy.sympify(z1)
             z2 = sympy.sympify(z2)
             return cls._from_three_points_exact(z0, z1, z2)
+        if _is_gaussian_input(z0, z1, z2):
+            return cls._from_three_points_gaussian(*(_as_gaussian(z) for z in (z0, z1, z2)))
 
         # Convert inputs to complex numbers
         # Handle tuples as (real, imag) coordinates
@@ -478,7 +882,7 @@ class Cline:
         if abs(z1 - z0) < 1e-10:  # z0 and z1 are the same point
             if abs(z2 - z0) < 1e-10:  # All three points are the same
                 # Return a point (degenerate case)
-                cline = cls(c=1.0, alpha=-z0, d=abs(z0) ** 2)
+                cline = cls(c=1.0, alpha=-np.conj(z0), d=abs(z0) ** 2)
                 cline.points = [z0, z1, z2]  # Store the points
                 return cline
             else:
@@ -557,13 +961,13 @@ class Cline:
         # Check collinearity via the determinant method
         # Three points are collinear iff Im((z2-z0)/(z1-z0)) = 0
         delta10 = z1 - z0
-        if sympy.simplify(delta10) == 0:
+        if _simplify(delta10) == 0:
             # z0 == z1, use z0 and z2
             return cls.from_line(z0, z2)
 
         delta20 = z2 - z0
         ratio = delta20 / delta10
-        if sympy.simplify(sympy.im(ratio)) == 0:
+        if _simplify(sympy.im(ratio)) == 0:
             # Collinear → line
             return cls.from_line(z0, z1)
 
@@ -583,14 +987,14 @@ class Cline:
 
         # System: [dx1, -dy1; dx2, -dy2] [a; b] = [-S1/2; -S2/2]
         det = dx1 * (-dy2) - dx2 * (-dy1)
-        det = sympy.simplify(det)
+        det = _simplify(det)
 
         a_val = ((-S1 / 2) * (-dy2) - (-S2 / 2) * (-dy1)) / det
         b_val = (dx1 * (-S2 / 2) - dx2 * (-S1 / 2)) / det
 
-        alpha = sympy.simplify(a_val + sympy.I * b_val)
+        alpha = _simplify(a_val + sympy.I * b_val)
         c = sympy.Integer(1)
-        d = sympy.simplify(
+        d = _simplify(
             -(z0 * sympy.conjugate(z0) + alpha * z0
               + sympy.conjugate(alpha) * sympy.conjugate(z0))
         )
@@ -599,6 +1003,34 @@ class Cline:
         cline.points = [z0, z1, z2]
         return cline
 
+    @classmethod
+    def _from_three_points_gaussian(cls, z0, z1, z2):
+        """Gaussian-rational path for from_three_points.
+
+        Solves the same 2x2 system as the numeric path, in exact rational
+        arithmetic.
+        """
+        delta1 = z1 - z0
+        delta2 = z2 - z0
+        if not delta1 and not delta2:
+            # All three points coincide: the point cline |z - z0|^2 = 0
+            cline = cls(c=Fraction(1), alpha=-z0.conjugate(), d=z0.abs_sq())
+        elif not delta1 or not delta2 or (delta1.conjugate() * delta2).imag == 0:
+            # Collinear → line through two distinct points
+            cline = cls.from_line(z0, z2 if not delta1 else z1)
+        else:
+            S1 = z1.abs_sq() - z0.abs_sq()
+            S2 = z2.abs_sq() - z0.abs_sq()
+            # System: [dx1, -dy1; dx2, -dy2] [a; b] = [-S1/2; -S2/2]
+            det = delta2.real * delta1.imag - delta1.real * delta2.imag
+            a = (S1 * delta2.imag - S2 * delta1.imag) / (2 * det)
+            b = (delta2.real * S1 - delta1.real * S2) / (2 * det)
+            alpha = GaussianRational(a, b)
+            d = -(z0.abs_sq() + 2 * (alpha * z0).real)
+            cline = cls(c=Fraction(1), alpha=alpha, d=d)
+        cline.points = [z0, z1, z2]
+        return cline
+
     @classmethod
     def from_line(cls, z0, z1):
         r"""Construct a cline representing a line through two points.
@@ -624,6 +1056,13 @@ class Cline:
             delta = z1 - z0
             alpha = sympy.I * sympy.conjugate(delta)
             d = -2 * sympy.re(alpha * z0)
+        elif _is_gaussian_input(z0, z1):
+            z0, z1 = _as_gaussian(z0), _as_gaussian(z1)
+            if z0 == z1:
+                raise ValueError("Points must be distinct to define a line")
+            c = Fraction(0)
+            alpha = GaussianRational(0, 1) * (z1 - z0).conjugate()
+            d = -2 * (alpha * z0).real
         else:
             if isinstance(z0, tuple):
                 z0 = complex(z0[0], z0[1])
@@ -668,6 +1107,13 @@ class Cline:
             c = sympy.Integer(1)
             alpha = -sympy.conjugate(center)
             d = (center * sympy.conjugate(center) - radius**2).expand()
+        elif _is_gaussian_input(center, radius):
+            center, radius = _as_gaussian(center), _as_real_fraction(radius)
+            if radius <= 0:
+                raise ValueError("Radius must be positive")
+            c = Fraction(1)
+            alpha = -center.conjugate()
+            d = center.abs_sq() - radius * radius
         else:
             if isinstance(center, tuple):
                 center = complex(center[0], center[1])
@@ -729,9 +1175,11 @@ class Cline:
         Args:
             H: 2x2 array-like with :math:`H = H^\dagger`, i.e.,
                H[0,0] and H[1,1] real, H[1,0] = conj(H[0,1]).
+               An (N, 2, 2) stack of such matrices is also accepted.
 
         Returns:
-            Cline: the cline represented by H.
+            Cline: the cline represented by H, or a
+            :class:`cline_array.ClineArray` for a stack of matrices.
 
         Raises:
             ValueError: if H is not Hermitian.
@@ -739,14 +1187,19 @@ class Cline:
         Reference:
             Hitchman, GCT, Definition 3.2.3
         """
-        if _HAS_SYMPY and isinstance(H, sympy.Matrix):
+        module = _loaded_sympy()
+        if module is not None and isinstance(H, module.Matrix):
             c = H[0, 0]
             alpha = H[1, 0]
             d = H[1, 1]
-            if sympy.simplify(H[0, 1] - sympy.conjugate(alpha)) != 0:
+            if _simplify(H[0, 1] - sympy.conjugate(alpha)) != 0:
                 raise ValueError("Matrix is not Hermitian: H[0,1] != conj(H[1,0])")
         else:
             H = np.asarray(H)
+            if H.ndim == 3:
+                from cline_array import ClineArray
+
+                return ClineArray.from_hermitian_matrix(H)
             c = H[0, 0].real
             alpha = H[1, 0]
             d = H[1, 1].real
@@ -754,6 +1207,39 @@ class Cline:
                 raise ValueError("Matrix is not Hermitian: H[0,1] != conj(H[1,0])")
         return cls(c=c, alpha=alpha, d=d)
 
+    @classmethod
+    def fit(cls, points, refine=False, max_iter=50):
+        r"""Fit a cline to noisy points in the least-squares sense.
+
+        The algebraic fit minimizes :math:`\sum f(z_k)^2` for
+        :math:`f(z) = c|z|^2 + \alpha z + \bar\alpha\bar z + d`, subject to
+        Pratt's constraint :math:`\Delta = |\alpha|^2 - cd = 1/4`. This
+        generalized 4x4 eigenproblem becomes a symmetric one after whitening
+        with the moment matrix, solved in centered and scaled coordinates. Unlike center-radius fits it stays finite on
+        nearly straight data: c just goes to 0. See :mod:`fitting` and
+        :class:`fitting.ClineFitAccumulator` for chunked input.
+
+        Args:
+            points (array_like): Complex points, at least three.
+            refine (bool): If True, polish the algebraic fit by Gauss-Newton
+                on the sum of squared geometric distances.
+            max_iter (int): Maximum number of refinement iterations.
+
+        Returns:
+            Cline: The fitted numeric cline, normalized to :math:`\Delta = 1`
+            with :math:`c \geq 0`. A circle then has :math:`c = 1/r`.
+
+        Raises:
+            ValueError: if there are fewer than three points, a point is not
+                finite or all points coincide.
+
+        Reference:
+            V. Pratt, *Direct least-squares fitting of algebraic surfaces*, 1987
+        """
+        from fitting import fit_cline
+
+        return fit_cline(points, refine=refine, max_iter=max_iter)
+
     def contains(self, z):
         r"""Test if a point z lies on this cline.
 
@@ -786,17 +1272,84 @@ class Cline:
             # Lines (c=0) pass through ∞; circles (c≠0) do not
             return self.is_line
 
+        if self._is_gaussian:
+            w = _as_gaussian(z)
+            if w is None:
+                # sympy points stay exact; float points need no sympy
+                converted = self._to_sympy() if _is_sympy(z) else self._to_numeric()
+                return converted.contains(z)
+            return self.c * w.abs_sq() + 2 * (self.alpha * w).real + self.d == 0
+
         if self._is_exact:
             z = sympy.sympify(z)
             val = self.c * z * sympy.conjugate(z) + self.alpha * z + \
                 sympy.conjugate(self.alpha) * sympy.conjugate(z) + self.d
-            return sympy.simplify(val) == 0
+            return _simplify(val) == 0
 
         z = complex(z)
         val = self.c * abs(z) ** 2 + self.alpha * z + \
             np.conj(self.alpha) * np.conj(z) + self.d
         return abs(val) < 1e-10
 
+    def evaluate(self, zs, out=None):
+        r"""Evaluate the Hermitian form of this cline at an array of points.
+
+        The value at z is
+
+        .. math::
+
+            \mathbf{z}^\dagger H \mathbf{z} = c|z|^2 + 2\text{Re}(\alpha z) + d
+
+        which is zero on the cline. Exact clines are evaluated in floating point.
+
+        Args:
+            zs (array_like): Complex points, any shape.
+            out (numpy.ndarray, optional): float64 array of the same shape as zs
+                to write the result into.
+
+        Returns:
+            numpy.ndarray: The real values of the form, same shape as zs.
+        """
+        return _hermitian_form(float(self.c), complex(self.alpha), float(self.d), zs, out)
+
+    def contains_many(self, zs, out=None):
+        """Test which points of an array lie on this cline.
+
+        Uses the same 1e-10 tolerance as :meth:`contains`.
+
+        Args:
+            zs (array_like): Complex points, any shape.
+            out (numpy.ndarray, optional): bool array of the same shape as zs
+                to write the result into.
+
+        Returns:
+            numpy.ndarray: Boolean mask, True where the point lies on the cline.
+        """
+        vals = self.evaluate(zs)
+        return np.less(np.abs(vals, out=vals), 1e-10, out=out)
+
+    def classify_points(self, zs):
+        r"""Locate an array of points relative to this cline.
+
+        For a circle, "inside" is the open disk bounded by it, whatever the sign
+        of c. For a line, "inside" is the open half-plane where
+        :math:`2\text{Re}(\alpha z) + d < 0`.
+
+        Args:
+            zs (array_like): Complex points, any shape.
+
+        Returns:
+            tuple of numpy.ndarray: Boolean masks (on, inside, outside), each with
+            the shape of zs.
+        """
+        vals = self.evaluate(zs)
+        if float(self.c) < -1e-10:
+            np.negative(vals, out=vals)
+        on = np.abs(vals) < 1e-10
+        inside = vals <= -1e-10
+        outside = vals >= 1e-10
+        return on, inside, outside
+
     def invert(self, z):
         r"""Return the image of z under inversion in this cline.
 
@@ -847,29 +1400,35 @@ class Cline:
 
         Derivation (cline inversion):
             Inversion maps clines to clines (Hitchman, *GCT*, Theorem 3.2.12).
-            If this cline (the inversion cline) has Hermitian matrix J, and the
-            argument cline has Hermitian matrix H, then the image cline has
-            Hermitian matrix
+            Write this cline (the inversion cline) as :math:`(c_J, \alpha_J, d_J)`
+            with discriminant :math:`\Delta_J`, and the argument cline as
+            :math:`(c, \alpha, d)`. By the point formula in :meth:`invert_points`,
+            inversion sends z to :math:`z^* = M(\bar z)` with
+            :math:`M = \begin{pmatrix} -\bar\alpha_J & -d_J \\ c_J & \alpha_J \end{pmatrix}`.
+            Since inversion is an involution, :math:`z^*` lies on the image iff
+            :math:`M(\bar{z^*})` lies on the argument cline. Substituting and
+            expanding shows that the image has coefficients
 
             .. math::
 
-                H' = J \cdot H \cdot J
+                (c', \alpha', d') = (c, \alpha, d) + \frac{P}{\Delta_J}(c_J, \alpha_J, d_J),
+                \qquad P = c\,d_J + c_J\,d - 2\text{Re}(\alpha\bar\alpha_J)
 
-            Proof: a point z lies on H iff :math:`\mathbf{z}^\dagger H \mathbf{z} = 0`.
-            Inversion in J acts on homogeneous coordinates as
-            :math:`\mathbf{z} \mapsto J \mathbf{z}` (up to scale). So :math:`z^*`
-            lies on :math:`H'` iff :math:`(J\mathbf{z})^\dagger H' (J\mathbf{z}) = 0`,
-            which equals :math:`\mathbf{z}^\dagger J H' J \mathbf{z}`. For this to
-            equal :math:`\mathbf{z}^\dagger H \mathbf{z}` we need :math:`J H' J = H`,
-            i.e., :math:`H' = J^{-1} H J^{-1}`. Since J is Hermitian and
-            :math:`J^{-1} \propto \text{adj}(J) \propto J` (for an involution),
-            this simplifies to :math:`H' = J H J` (up to a real scalar).
+            where P is the bilinear form used by :meth:`is_orthogonal`. This is
+            a reflection in the space of Hermitian forms: J itself is sent to
+            :math:`-J` (the same cline) and every cline orthogonal to J (P = 0)
+            is fixed. No points are sampled, so the formula stays accurate when
+            the image is nearly a line, and it needs no simplification of
+            intermediate points in exact mode.
 
         Args:
             z: complex number, sympy expression, sympy.zoo (∞), or Cline.
 
         Returns:
             complex/sympy/sympy.zoo if z is a point, or Cline if z is a Cline.
+            An image circle is scaled to c = 1; an image line keeps the scale
+            of the formula above. The image cline is computed from
+            coefficients only, so its ``points`` attribute is None.
 
         Reference:
             Hitchman, *GCT*, Definition 3.2.6 (point inversion in a circle).
@@ -886,6 +1445,19 @@ class Cline:
 
     def _invert_point(self, z):
         """Invert a point z in this cline."""
+        if self._is_gaussian and not _is_infinity(z):
+            w = _as_gaussian(z)
+            if w is None:
+                converted = self._to_sympy() if _is_sympy(z) else self._to_numeric()
+                return converted._invert_point(z)
+            if not (self.is_circle or self.is_line):
+                raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+            # z* = -(conj(alpha) conj(z) + d) / (c conj(z) + alpha)
+            den = self.c * w.conjugate() + self.alpha
+            if not den:
+                return sympy.zoo
+            return -(self.alpha.conjugate() * w.conjugate() + self.d) / den
+
         if self.is_circle:
             if _is_infinity(z):
                 return self.center
@@ -893,9 +1465,9 @@ class Cline:
             if self._is_exact:
                 z = sympy.sympify(z)
                 diff = z - self.center
-                if sympy.simplify(diff) == 0:
+                if _simplify(diff) == 0:
                     return sympy.zoo
-                return sympy.simplify(
+                return _simplify(
                     self.center + self.radius ** 2 / sympy.conjugate(diff)
                 )
 
@@ -911,7 +1483,7 @@ class Cline:
 
             if self._is_exact:
                 z = sympy.sympify(z)
-                return sympy.simplify(
+                return _simplify(
                     -(sympy.conjugate(self.alpha) * sympy.conjugate(z) + self.d)
                     / self.alpha
                 )
@@ -922,49 +1494,61 @@ class Cline:
         else:
             raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
 
+    def invert_points(self, zs, out=None):
+        r"""Invert (or reflect) a whole array of points in this cline.
+
+        Uses the formula
+
+        .. math::
+
+            z^* = -\frac{\bar\alpha\bar z + d}{c\bar z + \alpha}
+
+        which reduces to :math:`z_0 + r^2/\overline{(z - z_0)}` for a circle and to
+        the reflection formula of :meth:`invert` for a line. The point at infinity
+        is represented by NaN, on input and on output: the center of a circle
+        maps to NaN, and NaN maps to the center (circle) or to NaN (line).
+        Exact clines are evaluated in floating point.
+
+        Args:
+            zs (array_like): Complex points, any shape.
+            out (numpy.ndarray, optional): complex128 array of the same shape as
+                zs to write the result into.
+
+        Returns:
+            numpy.ndarray: The image points, same shape as zs.
+
+        Raises:
+            ValueError: if this cline is a point or invalid.
+        """
+        if not (self.is_circle or self.is_line):
+            raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+        return _invert_points(float(self.c), complex(self.alpha), float(self.d), zs, out)
+
     def _invert_cline(self, other):
         r"""Invert a cline in this cline.
 
-        Pick three points on the source cline, invert each through this cline,
-        and construct the image cline from the three image points. This approach
-        is always correct and avoids normalization issues with the matrix formula.
+        Uses the closed form :math:`H' = H + (P/\Delta_J) J` derived in
+        :meth:`invert`, in numeric and exact mode alike. An image that is not
+        a line is scaled to c = 1.
         """
-        if other.is_circle:
-            # Pick three points on the circle
-            if other._is_exact:
-                # Use center ± radius and center + i*radius
-                pts = [
-                    other.center + other.radius,
-                    other.center - other.radius,
-                    other.center + sympy.I * other.radius,
-                ]
-            else:
-                pts = [other.center + other.radius * np.exp(1j * t)
-                       for t in [0, 2 * np.pi / 3, 4 * np.pi / 3]]
-        elif other.is_line:
-            if other._is_exact:
-                # Pick two finite points on the line and ∞
-                # Solve for a point: α·z + ᾱ·z̄ + d = 0
-                # Use z = -d/(2α) · (ᾱ/|α|) ... simpler: use stored points or construct
-                a, b = sympy.re(other.alpha), sympy.im(other.alpha)
-                if a != 0:
-                    z0 = -other.d / (2 * a) + sympy.Integer(0) * sympy.I
-                    z1 = z0 + other.direction_vector
-                else:
-                    z0 = sympy.I * other.d / (2 * b)
-                    z1 = z0 + other.direction_vector
-                pts = [z0, z1, sympy.zoo]
-            else:
-                z0 = other.point_on_line
-                z1 = other.point_on_line + other.direction_vector
-                pts = [z0, z1, sympy.zoo]
-        else:
+        if not (self.is_circle or self.is_line):
+            raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+        if not (other.is_circle or other.is_line):
             raise ValueError("Cannot invert a degenerate cline")
 
-        # Invert the three points
-        img_pts = [self._invert_point(p) for p in pts]
-
-        return Cline.from_three_points(*img_pts)
+        c, alpha, d = _invert_coefficients(
+            other.c, other.alpha, other.d, self.c, self.alpha, self.d
+        )
+        exact = any(_is_sympy(x) for x in (c, alpha, d))
+        if exact:
+            c, alpha, d = _simplify(c), _simplify(alpha), _simplify(d)
+        image = Cline(c=c, alpha=alpha, d=d)
+        if image.is_line or c == 0:
+            return image
+        alpha, d, c = alpha / c, d / c, c / c
+        if exact:
+            alpha, d = _simplify(alpha), _simplify(d)
+        return Cline(c=c, alpha=alpha, d=d)
 
     def intersection(self, other):
         r"""Return the intersection points of two clines.
@@ -978,6 +1562,7 @@ class Cline:
         """
         if not isinstance(other, Cline):
             raise TypeError("Can only intersect with another Cline")
+        self, other = _common_mode(self, other)
 
         if self.is_line and other.is_line:
             return self._intersect_line_line(other)
@@ -994,15 +1579,25 @@ class Cline:
         """Intersect two lines. Returns 0 or 1 points."""
         # Line equations: 2*Re(α·z) + d = 0
         # In Cartesian: a₁x - b₁y + d₁/2 = 0 and a₂x - b₂y + d₂/2 = 0
+        if self._is_gaussian:
+            a1, b1, d1 = self.a, self.b, self.d
+            a2, b2, d2 = other.a, other.b, other.d
+            det = a2 * b1 - a1 * b2
+            if det == 0:
+                return []  # parallel
+            x = (d1 * b2 - d2 * b1) / (2 * det)
+            y = (a2 * d1 - a1 * d2) / (2 * det)
+            return [GaussianRational(x, y)]
+
         if self._is_exact or other._is_exact:
             a1, b1, d1 = sympy.re(self.alpha), sympy.im(self.alpha), self.d
             a2, b2, d2 = sympy.re(other.alpha), sympy.im(other.alpha), other.d
             det = a1 * (-b2) - a2 * (-b1)
-            if sympy.simplify(det) == 0:
+            if _simplify(det) == 0:
                 return []  # parallel
             x = ((-d1 / 2) * (-b2) - (-d2 / 2) * (-b1)) / det
             y = (a1 * (-d2 / 2) - a2 * (-d1 / 2)) / det
-            return [sympy.simplify(x + sympy.I * y)]
+            return [_simplify(x + sympy.I * y)]
 
         a1, b1, d1 = self.a, self.b, self.d
         a2, b2, d2 = other.a, other.b, other.d
@@ -1017,27 +1612,32 @@ class Cline:
 
     def _intersect_circle_circle(self, other):
         """Intersect two circles. Returns 0, 1, or 2 points."""
-        # Subtract the two cline equations to get the radical axis
-        c_diff = self.c - other.c
-        alpha_diff = self.alpha - other.alpha
-        d_diff = self.d - other.d
+        # Eliminate |z|² between the two cline equations to get the radical axis:
+        # c₂·(self) - c₁·(other) has no |z|² term
+        alpha_diff = other.c * self.alpha - self.c * other.alpha
+        d_diff = other.c * self.d - self.c * other.d
 
         # Check if the radical axis is degenerate
-        # When c_diff=0 and alpha_diff=0, the radical equation is just d_diff=0
+        # When alpha_diff=0, the radical equation is just d_diff=0
         # If d_diff≠0: no intersection (concentric, different radii)
         # If d_diff=0: identical circles (infinite intersections, return [])
-        if self._is_exact or other._is_exact:
-            if sympy.simplify(c_diff) == 0 and sympy.simplify(alpha_diff) == 0:
+        if self._is_gaussian:
+            if not alpha_diff:
+                return []
+        elif self._is_exact or other._is_exact:
+            if _simplify(alpha_diff) == 0:
                 return []
         else:
-            if abs(c_diff) < 1e-10 and abs(alpha_diff) < 1e-10:
+            if abs(alpha_diff) < 1e-10:
                 return []
 
-        radical = Cline(c=c_diff, alpha=alpha_diff, d=d_diff)
+        radical = Cline(c=0, alpha=alpha_diff, d=d_diff)
         return self._intersect_circle_line(radical)
 
     def _intersect_circle_line(self, line):
         """Intersect a circle (self) with a line. Returns 0, 1, or 2 points."""
+        if self._is_gaussian:
+            return self._intersect_circle_line_gaussian(line)
         if self._is_exact or line._is_exact:
             return self._intersect_circle_line_exact(line)
 
@@ -1100,6 +1700,35 @@ class Cline:
             return results[:1]  # tangent — one point
         return results
 
+    def _intersect_circle_line_gaussian(self, line):
+        r"""Gaussian-rational circle-line intersection.
+
+        With :math:`f(z) = 2\text{Re}(\alpha z) + d` for the line, the foot of
+        the perpendicular from the center :math:`z_0` is
+        :math:`p = z_0 - f(z_0)\bar\alpha / (2|\alpha|^2)` and the points are
+        :math:`p \pm i\bar\alpha\sqrt{q}` with
+        :math:`q = (r^2 - f(z_0)^2/(4|\alpha|^2))/|\alpha|^2`. Everything but
+        :math:`\sqrt{q}` is rational, so the points are GaussianRationals
+        whenever q is a rational square and sympy expressions otherwise.
+        """
+        center = self.center
+        radius_sq = self.discriminant / (self.c * self.c)
+        norm_sq = line.alpha.abs_sq()
+        f = 2 * (line.alpha * center).real + line.d
+        foot = center - line.alpha.conjugate() * (f / (2 * norm_sq))
+        q = (radius_sq - f * f / (4 * norm_sq)) / norm_sq
+        if q < 0:
+            return []
+        if q == 0:
+            return [foot]
+        offset = GaussianRational(0, 1) * line.alpha.conjugate()
+        root = _fraction_sqrt(q)
+        if root is None:
+            root = sympy.sqrt(sympy.Rational(q.numerator, q.denominator))
+            foot, offset = sympy.sympify(foot), sympy.sympify(offset)
+            return [sympy.expand(foot + sign * root * offset) for sign in (1, -1)]
+        return [foot + offset * root, foot - offset * root]
+
     def _intersect_circle_line_exact(self, line):
         """Symbolic circle-line intersection using sympy.solve."""
         x, y = sympy.symbols('x y', real=True)
@@ -1120,9 +1749,9 @@ class Cline:
         solutions = sympy.solve([eq1, eq2], [x, y])
         if isinstance(solutions, dict):
             solutions = [solutions]
-        return [sympy.simplify(sol[0] + sympy.I * sol[1])
+        return [_simplify(sol[0] + sympy.I * sol[1])
                 if isinstance(sol, (list, tuple))
-                else sympy.simplify(sol[x] + sympy.I * sol[y])
+                else _simplify(sol[x] + sympy.I * sol[y])
                 for sol in solutions]
 
     def angle(self, other):
@@ -1131,8 +1760,11 @@ class Cline:
         For two circles with centers z1, z2 and radii r1, r2:
             :math:`\cos\theta = \frac{|z_1 - z_2|^2 - r_1^2 - r_2^2}{2 r_1 r_2}`
 
-        For circle and line, or two lines: computed from direction vectors
-        at the intersection point.
+        For two lines: the acute angle between their normal vectors.
+
+        For a circle and a line: the acute angle from the normalized inversive
+        product, :math:`|\cos\theta| = \frac{|c_1 d_2 + c_2 d_1 - 2\text{Re}(\alpha_1\bar\alpha_2)|}{2\sqrt{\Delta_1\Delta_2}}`,
+        which needs no intersection points (see :mod:`inversive`).
 
         Returns:
             float (radians) or sympy expression.
@@ -1143,12 +1775,17 @@ class Cline:
         Reference:
             Hitchman, GCT, Section 3.2
         """
+        self, other = _common_mode(self, other)
+        if self._is_gaussian:
+            # The angle needs square roots and acos
+            return self._to_sympy().angle(other._to_sympy())
+
         if self.is_circle and other.is_circle:
             if self._is_exact or other._is_exact:
                 d_sq = _abs_sq(self.center - other.center)
                 cos_theta = (d_sq - self.radius**2 - other.radius**2) / \
                     (2 * self.radius * other.radius)
-                return sympy.acos(sympy.simplify(cos_theta))
+                return sympy.acos(_simplify(cos_theta))
 
             d = abs(self.center - other.center)
             cos_theta = (d**2 - self.radius**2 - other.radius**2) / \
@@ -1161,7 +1798,7 @@ class Cline:
             # Angle between two lines from their normal vectors
             if self._is_exact or other._is_exact:
                 dot = sympy.re(self.alpha * sympy.conjugate(other.alpha))
-                return sympy.acos(sympy.simplify(
+                return sympy.acos(_simplify(
                     dot / (sympy.Abs(self.alpha) * sympy.Abs(other.alpha))
                 ))
 
@@ -1171,34 +1808,23 @@ class Cline:
             return np.arccos(abs(cos_theta))
 
         else:
-            # Circle-line case: find intersection, compute angle there
-            pts = self.intersection(other)
-            if not pts:
-                raise ValueError("Clines do not intersect")
+            # Circle-line case: normalized inversive product. The line has no
+            # preferred side, so only |cos θ| is meaningful and the acute
+            # angle is returned, as for two lines.
+            product = self.c * other.d + other.c * self.d - \
+                2 * _real(self.alpha * _conjugate(other.alpha))
+            if self._is_exact or other._is_exact:
+                cos_theta = _simplify(
+                    product / (2 * sympy.sqrt(self.discriminant * other.discriminant))
+                )
+                if (cos_theta ** 2 - 1).is_positive:
+                    raise ValueError("Clines do not intersect")
+                return sympy.acos(sympy.Abs(cos_theta))
 
-            # At intersection point, angle = angle between tangent to circle
-            # and the line direction. Use the formula via normals.
-            if self.is_circle:
-                circle, line = self, other
-            else:
-                circle, line = other, self
-
-            # Tangent to circle at intersection point is perpendicular to radius
-            p = pts[0]
-            if circle._is_exact or line._is_exact:
-                p = sympy.sympify(p)
-                radius_dir = p - circle.center
-                # Angle between radius direction and line normal
-                dot = sympy.re(radius_dir * sympy.conjugate(line.alpha))
-                cos_angle = dot / (sympy.Abs(radius_dir) * sympy.Abs(line.alpha))
-                # Angle between tangent and line = pi/2 - angle between radius and line
-                return sympy.simplify(sympy.Abs(sympy.asin(sympy.simplify(cos_angle))))
-
-            radius_dir = p - circle.center
-            dot = np.real(radius_dir * np.conj(line.alpha))
-            cos_angle = dot / (abs(radius_dir) * abs(line.alpha))
-            cos_angle = max(-1, min(1, cos_angle))
-            return abs(np.arcsin(cos_angle))
+            cos_theta = abs(product) / (2 * np.sqrt(self.discriminant * other.discriminant))
+            if cos_theta > 1 + 1e-10:
+                raise ValueError("Clines do not intersect")
+            return np.arccos(min(1, cos_theta))
 
     def is_orthogonal(self, other):
         r"""Return True if two clines meet at right angles.
@@ -1234,13 +1860,99 @@ class Cline:
             Hitchman, *GCT*, Section 5.1 (orthogonality, Poincare disk geodesics).
             https://mphitchman.com/geometry/section5-1.html
         """
+        self, other = _common_mode(self, other)
         val = self.c * other.d + other.c * self.d - \
             2 * _real(self.alpha * _conjugate(other.alpha))
 
+        if self._is_gaussian:
+            return val == 0
         if self._is_exact or other._is_exact:
-            return sympy.simplify(val) == 0
+            return _simplify(val) == 0
         return abs(val) < 1e-10
 
+    def canonical(self):
+        r"""Return the same cline with canonically scaled coefficients.
+
+        :math:`(c, \alpha, d)` and :math:`\lambda(c, \alpha, d)` describe the
+        same cline for every real :math:`\lambda \neq 0`. The canonical
+        scaling is c = 1 for clines with c ≠ 0 (circles, points and invalid
+        clines). A line gets :math:`|\alpha| = 1` with
+        :math:`\text{Re}\,\alpha > 0`, or :math:`\text{Re}\,\alpha = 0` and
+        :math:`\text{Im}\,\alpha > 0`.
+
+        In Gaussian-rational mode :math:`|\alpha|` is usually irrational, so a
+        line is instead scaled to make the first nonzero of
+        :math:`\text{Re}\,\alpha` and :math:`\text{Im}\,\alpha` equal to 1.
+
+        Returns:
+            Cline: A new cline in the same arithmetic mode. A line with
+            α = 0 is returned unchanged.
+        """
+        c, alpha, d = self.c, self.alpha, self.d
+        if self._is_gaussian:
+            if c != 0:
+                scale = 1 / c
+            elif alpha:
+                scale = 1 / (alpha.real if alpha.real != 0 else alpha.imag)
+            else:
+                return Cline(c=c, alpha=alpha, d=d)
+        elif self._is_exact:
+            if c != 0:
+                scale = 1 / c
+            elif alpha != 0:
+                scale = 1 / sympy.sqrt(_abs_sq(alpha))
+                re, im = sympy.re(alpha), sympy.im(alpha)
+                if re.is_negative or (re.is_zero and im.is_negative):
+                    scale = -scale
+            else:
+                return Cline(c=c, alpha=alpha, d=d)
+            return Cline(c=_simplify(c * scale), alpha=_simplify(alpha * scale), d=_simplify(d * scale))
+        else:
+            if not self.is_line:
+                scale = 1 / c
+            elif alpha != 0:
+                scale = 1 / abs(alpha)
+                if alpha.real < 0 or (alpha.real == 0 and alpha.imag < 0):
+                    scale = -scale
+            else:
+                return Cline(c=c, alpha=alpha, d=d)
+        return Cline(c=c * scale, alpha=alpha * scale, d=d * scale)
+
+    @_lazy_attribute
+    def canonical_key(self):
+        """Quantized canonical coefficients, a tuple of four ints used by == and hash of numeric clines.
+
+        Equal for clines whose coefficients agree up to scale within about
+        1e-9 relative to their norm. Exact clines are converted to floats
+        first. None for symbolic clines that cannot be converted.
+        """
+        try:
+            c, alpha, d = float(self.c), complex(self.alpha), float(self.d)
+        except TypeError:
+            return None
+        return tuple(_canonical_keys([c], [alpha], [d])[0].tolist())
+
+    def isclose(self, other, tolerance=_KEY_TOLERANCE):
+        """Return True if two clines are equal up to scale, within a tolerance.
+
+        The coefficients of both clines are scaled to unit norm and compared
+        up to sign. Unlike ``==``, this test has no rounding boundaries, but
+        it is not transitive. Exact clines are compared as floats.
+
+        Args:
+            other (Cline): The cline to compare with.
+            tolerance (float, optional): Largest allowed difference of the
+                unit-norm coefficients. Defaults to 1e-9.
+
+        Returns:
+            bool: True if the clines are close.
+        """
+        distance = _unit_distance(
+            float(self.c), complex(self.alpha), float(self.d),
+            float(other.c), complex(other.alpha), float(other.d),
+        )
+        return bool(distance <= tolerance)
+
     def plot(
         self,
         ax=None,
@@ -1251,7 +1963,7 @@ class Cline:
         point_color="red",
         label=None,
         show_points=True,
-        num_points=100,
+        num_points=None,
         precision=4,
         **kwargs,
     ):
@@ -1268,15 +1980,25 @@ class Cline:
             show_points (bool, optional): Whether to show the points used to create the cline.
                 Defaults to True.
             num_points (int, optional): Number of points to use when plotting a circle.
-                Defaults to 100.
+                If None (the default), only the arcs inside the axis limits are
+                sampled, with as many points as their size on screen needs.
             precision (int, optional): Number of decimal places to round to. Defaults to 4.
             **kwargs: Additional keyword arguments passed to the plot function.
 
         Returns:
             matplotlib.axes.Axes: The axes containing the plot.
+
+        Circles and lines are clipped to the axis limits and sampled again
+        whenever the limits change, so clines plotted earlier on the same axes
+        stay complete when a later call moves the view. Lines are clipped
+        analytically from alpha and d, so stored points are not needed.
         """
+        from plotting import _circle_polyline, _clip_lines, _follow_limits
+
         # Create a new figure if ax is not provided
         if ax is None:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=figsize)
 
         # Set the aspect ratio to equal
@@ -1314,9 +2036,12 @@ class Cline:
                 auto_xlim = (x_min, x_max)
                 auto_ylim = (y_min, y_max)
             else:
-                # Fallback for lines without stored points
-                auto_xlim = (-5, 5)
-                auto_ylim = (-5, 5)
+                # Fallback for lines without stored points: a window around
+                # the point of the line closest to the origin
+                alpha, d = complex(self.alpha), float(self.d)
+                foot = -d * alpha.conjugate() / (2 * abs(alpha) ** 2)
+                auto_xlim = (foot.real - 5, foot.real + 5)
+                auto_ylim = (foot.imag - 5, foot.imag + 5)
 
         # Apply limits, prioritizing provided values over auto-calculated ones
         ax.set_xlim(xlim if xlim is not None else auto_xlim)
@@ -1328,10 +2053,18 @@ class Cline:
         # Plot the cline based on its type
         if self.is_circle:
             # Plot a circle
-            theta = np.linspace(0, 2 * np.pi, num_points)
-            x = self.center.real + self.radius * np.cos(theta)
-            y = self.center.imag + self.radius * np.sin(theta)
-            ax.plot(x, y, color=color, label=label, **kwargs)
+            if num_points is None:
+                center, radius = complex(self.center), float(self.radius)
+                (curve,) = ax.plot([], [], color=color, label=label, **kwargs)
+                _follow_limits(
+                    ax, curve,
+                    lambda xlim, ylim, scale: _circle_polyline(center, radius, xlim, ylim, scale),
+                )
+            else:
+                theta = np.linspace(0, 2 * np.pi, num_points)
+                x = self.center.real + self.radius * np.cos(theta)
+                y = self.center.imag + self.radius * np.sin(theta)
+                ax.plot(x, y, color=color, label=label, **kwargs)
 
             # Mark the center
             ax.plot(self.center.real, self.center.imag, "o", color=color, markersize=5)
@@ -1367,103 +2100,14 @@ class Cline:
             )
 
         elif self.is_line:
-            # Completely rewritten line plotting logic for maximum robustness
-            if self.points is not None and len(self.points) >= 2:
-                # Get the two points that define the line
-                z0, z1 = self.points[0], self.points[1]
-
-                # Get the current axis limits
-                x_min, x_max = ax.get_xlim()
-                y_min, y_max = ax.get_ylim()
-
-                # Calculate the slope
-                dx = z1.real - z0.real
-                dy = z1.imag - z0.imag
-
-                # Handle vertical lines (or nearly vertical lines)
-                if abs(dx) < 1e-10:
-                    # Use a vertical line at the x-coordinate
-                    x_coords = [z0.real, z0.real]
-                    y_coords = [y_min, y_max]
-                else:
-                    # For non-vertical lines, calculate y = m(x - x0) + y0
-                    slope = dy / dx
-
-                    # Calculate y-coordinates at the min and max x values
-                    y_at_xmin = slope * (x_min - z0.real) + z0.imag
-                    y_at_xmax = slope * (x_max - z0.real) + z0.imag
-
-                    # Use the boundaries to create the line
-                    x_coords = [x_min, x_max]
-                    y_coords = [y_at_xmin, y_at_xmax]
-
-                    # If the line runs outside the y-axis boundaries, calculate intersections
-                    if (
-                        y_at_xmin < y_min
-                        or y_at_xmin > y_max
-                        or y_at_xmax < y_min
-                        or y_at_xmax > y_max
-                    ):
-                        points = []
-
-                        # Calculate intersection with each boundary line
-                        # Left boundary (x = x_min)
-                        if y_min <= y_at_xmin <= y_max:
-                            points.append((x_min, y_at_xmin))
-
-                        # Right boundary (x = x_max)
-                        if y_min <= y_at_xmax <= y_max:
-                            points.append((x_max, y_at_xmax))
-
-                        # Calculate x-coordinates at min and max y values
-                        if abs(slope) > 1e-10:  # Avoid division by zero
-                            # Calculate x at minimum y value
-                            x_at_ymin = (y_min - z0.imag) / slope + z0.real
-                            # Calculate x at maximum y value
-                            x_at_ymax = (y_max - z0.imag) / slope + z0.real
-
-                            # Bottom boundary (y = y_min)
-                            if x_min <= x_at_ymin <= x_max:
-                                points.append((x_at_ymin, y_min))
-
-                            # Top boundary (y = y_max)
-                            if x_min <= x_at_ymax <= x_max:
-                                points.append((x_at_ymax, y_max))
-
-                        # If we found at least 2 intersection points, use them
-                        if len(points) >= 2:
-                            # Sort the points by x-coordinate for consistency
-                            points.sort()
-                            x_coords = [p[0] for p in points[:2]]
-                            y_coords = [p[1] for p in points[:2]]
-
-                # Double-check if the line actually intersects the plot area
-                if len(x_coords) >= 2:
-                    # Plot the line
-                    ax.plot(x_coords, y_coords, color=color, label=label, **kwargs)
-            else:
-                # Fallback approach if points are not available
-                # Draw a line in the direction of the normal vector through the origin
-                direction = self.direction_vector
-
-                # Calculate a reasonable length for the line
-                max_extent = max(
-                    abs(ax.get_xlim()[0]),
-                    abs(ax.get_xlim()[1]),
-                    abs(ax.get_ylim()[0]),
-                    abs(ax.get_ylim()[1]),
-                )
-
-                # Generate points along the line
-                t_values = np.linspace(-2 * max_extent, 2 * max_extent, num_points)
-                points = [self.point_on_line + t * direction for t in t_values]
+            alpha, d = np.array([complex(self.alpha)]), np.array([float(self.d)])
 
-                # Extract x and y coordinates
-                x_coords = [p.real for p in points]
-                y_coords = [p.imag for p in points]
+            def clip(xlim, ylim, scale):
+                segments, visible = _clip_lines(alpha, d, xlim, ylim)
+                return (segments[0, :, 0], segments[0, :, 1]) if visible[0] else ([], [])
 
-                # Plot the line
-                ax.plot(x_coords, y_coords, color=color, label=label, **kwargs)
+            (segment,) = ax.plot([], [], color=color, label=label, **kwargs)
+            _follow_limits(ax, segment, clip)
 
         # Plot the points used to create the cline if available and requested
         if self.points is not None and show_points:
@@ -1490,7 +2134,8 @@ class Cline:
                 ax.set_title(f"Point: {point_str}")
             elif self.is_line:
                 normal_str = self._format_complex(self.normal_vector, precision)
-                distance_str = self._format_float(self.distance_from_origin, precision)
+                distance = abs(float(self.d)) / (2 * abs(complex(self.alpha)))
+                distance_str = self._format_float(distance, precision)
                 ax.set_title(f"Line: normal={normal_str}, distance={distance_str}")
             else:
                 ax.set_title("Invalid Cline")
@@ -1507,6 +2152,46 @@ class Cline:
 
         return ax
 
+    def __eq__(self, other):
+        """Return True if both clines describe the same set.
+
+        Two exact clines (sympy or Gaussian-rational) are compared exactly
+        through their canonical coefficients. Two numeric clines are equal
+        when their :attr:`canonical_key` values are, that is, when they agree
+        up to scale within the key tolerance. An exact cline never equals a
+        numeric one, as sympy's ``Rational(1, 2) == Float(0.5)`` is False,
+        since no hash could agree with both comparisons. Use :meth:`isclose`
+        to compare across modes or without rounding boundaries.
+        """
+        if not isinstance(other, Cline):
+            return NotImplemented
+        if self._is_exact != other._is_exact:
+            return False
+        if self._is_exact:
+            first, second = _common_mode(self, other)
+            first, second = first.canonical(), second.canonical()
+            pairs = zip((first.c, first.alpha, first.d), (second.c, second.alpha, second.d))
+            if first._is_gaussian:
+                return all(x == y for x, y in pairs)
+            return all(_simplify(x - y) == 0 for x, y in pairs)
+        return self.canonical_key == other.canonical_key
+
+    def __hash__(self):
+        """Return a hash consistent with ``==``.
+
+        Numeric clines hash their :attr:`canonical_key`. Exact clines hash
+        their exact canonical coefficients in Gaussian-rational mode, so equal
+        sympy and Gaussian-rational clines hash alike. Symbolic clines, which
+        compare equal after simplification, all share one hash.
+        """
+        if not self._is_exact:
+            return hash(self.canonical_key)
+        C = self if self._is_gaussian else self._to_gaussian()
+        if C is None:
+            return hash(Cline)
+        C = C.canonical()
+        return hash((C.c, C.alpha, C.d))
+
     def __str__(self):
         """Return a string representation of the cline."""
         # Format the equation with rounded values
@@ -0,0 +1,723 @@
+r"""
+Structure-of-arrays container for large collections of numeric clines.
+
+A :class:`ClineArray` stores the coefficients of N clines
+
+.. math::
+
+   c_k z\bar{z} + \alpha_k z + \bar{\alpha}_k\bar{z} + d_k = 0, \qquad k = 0, \ldots, N-1
+
+as three one-dimensional NumPy arrays ``c`` (float), ``alpha`` (complex) and ``d`` (float).
+The arrays may be strided views, such as the fields of a memory-mapped
+:data:`CLINE_DTYPE` record array (see :mod:`cline_io`), so opening a large
+dataset does not copy it. Classification and the derived geometric quantities are computed with whole-array
+operations using the same tolerance rules as :class:`cline.Cline`, so hot paths can
+work on millions of clines without creating a Python object per cline.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+from cline import (
+    _KEY_TOLERANCE, Cline, _canonical_keys, _hermitian_form, _invert_coefficients, _invert_points,
+    _unit_distance,
+)
+
+
+#: Record type returned by the intersection engine: the indices of the two
+#: clines, one intersection point and its multiplicity (2 for a tangency).
+INTERSECTION_DTYPE = np.dtype([
+    ("i", np.intp),
+    ("j", np.intp),
+    ("point", complex),
+    ("multiplicity", np.int8),
+])
+
+#: Record type of one cline in a structured array, and of the on-disk format
+#: of :mod:`cline_io`: little-endian float64 c, complex128 alpha, float64 d.
+CLINE_DTYPE = np.dtype([("c", "<f8"), ("alpha", "<c16"), ("d", "<f8")])
+
+# Default number of cline pairs processed per chunk by the intersection engine
+_PAIR_CHUNK_SIZE = 1 << 18
+
+# Odd 64-bit multipliers that mix the four columns of a key into one hash
+_KEY_MIX = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5],
+    dtype=np.uint64,
+).view(np.int64)
+
+
+class ClineArray:
+    r"""A collection of N numeric clines stored as coefficient arrays.
+
+    The derived attributes mirror those of :class:`cline.Cline`, with one entry per cline.
+    They are computed on first access and cached.
+
+    Attributes:
+        c (numpy.ndarray): Real coefficients of :math:`z\bar{z}`, shape (N,)
+        alpha (numpy.ndarray): Complex coefficients of z, shape (N,)
+        d (numpy.ndarray): Real constant terms, shape (N,)
+    """
+
+    def __init__(self, c, alpha, d):
+        r"""Initialize from coefficient arrays.
+
+        Args:
+            c (array_like): Real coefficients of :math:`z\bar{z}`, shape (N,)
+            alpha (array_like): Complex coefficients of z, shape (N,)
+            d (array_like): Real constant terms, shape (N,)
+
+        Raises:
+            ValueError: if the arrays are not one-dimensional or have different lengths.
+
+        Arrays that already have the right dtype are kept as they are, views
+        included, without a copy.
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.alpha = np.asarray(alpha, dtype=complex)
+        self.d = np.asarray(d, dtype=float)
+
+        if self.c.ndim != 1 or self.alpha.ndim != 1 or self.d.ndim != 1:
+            raise ValueError("c, alpha and d must be one-dimensional arrays")
+        if not len(self.c) == len(self.alpha) == len(self.d):
+            raise ValueError("c, alpha and d must have the same length")
+
+    @classmethod
+    def from_clines(cls, clines):
+        """Construct a ClineArray from a sequence of Cline objects.
+
+        Exact (sympy) clines are converted to floating point.
+
+        Args:
+            clines (iterable of Cline): The clines to pack.
+
+        Returns:
+            ClineArray: The packed clines, in the same order.
+        """
+        clines = list(clines)
+        n = len(clines)
+        c = np.fromiter((float(C.c) for C in clines), dtype=float, count=n)
+        alpha = np.fromiter((complex(C.alpha) for C in clines), dtype=complex, count=n)
+        d = np.fromiter((float(C.d) for C in clines), dtype=float, count=n)
+        return cls(c, alpha, d)
+
+    @classmethod
+    def from_records(cls, records):
+        """Wrap a structured array with fields c, alpha and d, without copying.
+
+        The fields of records become the coefficient arrays as strided views,
+        so a memory-mapped record array stays on disk until its values are
+        used.
+
+        Args:
+            records (numpy.ndarray): One-dimensional structured array, usually
+                of dtype :data:`CLINE_DTYPE`.
+
+        Returns:
+            ClineArray: Clines viewing the fields of records.
+
+        Raises:
+            ValueError: if records lacks one of the fields c, alpha and d.
+        """
+        names = records.dtype.names or ()
+        missing = [name for name in CLINE_DTYPE.names if name not in names]
+        if missing:
+            raise ValueError(f"records has no field {missing[0]!r}")
+        return cls(records["c"], records["alpha"], records["d"])
+
+    def to_records(self):
+        """Return the coefficients as a new structured array of dtype :data:`CLINE_DTYPE`.
+
+        Returns:
+            numpy.ndarray: Array of shape (N,) with fields c, alpha and d.
+        """
+        records = np.empty(len(self), dtype=CLINE_DTYPE)
+        records["c"] = self.c
+        records["alpha"] = self.alpha
+        records["d"] = self.d
+        return records
+
+    def to_clines(self):
+        """Return the clines as a list of Cline objects.
+
+        Returns:
+            list of Cline: One Cline per entry, in order.
+        """
+        return [
+            Cline(c=c, alpha=alpha, d=d)
+            for c, alpha, d in zip(self.c.tolist(), self.alpha.tolist(), self.d.tolist())
+        ]
+
+    @property
+    def hermitian_matrix(self):
+        r"""The Hermitian matrices :math:`[[c, \bar\alpha], [\alpha, d]]`, shape (N, 2, 2).
+
+        The stacked form of :attr:`cline.Cline.hermitian_matrix`. A new
+        complex array is returned on every access.
+        """
+        H = np.empty((len(self), 2, 2), dtype=complex)
+        H[:, 0, 0] = self.c
+        H[:, 0, 1] = np.conj(self.alpha)
+        H[:, 1, 0] = self.alpha
+        H[:, 1, 1] = self.d
+        return H
+
+    @classmethod
+    def from_hermitian_matrix(cls, H):
+        """Construct a ClineArray from a stack of 2x2 Hermitian matrices.
+
+        Args:
+            H (array_like): Shape (N, 2, 2) with every H[k] Hermitian.
+
+        Returns:
+            ClineArray: The N clines represented by the matrices.
+
+        Raises:
+            ValueError: if H does not have shape (N, 2, 2) or a matrix is not
+                Hermitian (within 1e-10).
+        """
+        H = np.asarray(H)
+        if H.ndim != 3 or H.shape[1:] != (2, 2):
+            raise ValueError(f"H must have shape (N, 2, 2), got {H.shape}")
+        alpha = H[:, 1, 0]
+        if (np.abs(H[:, 0, 1] - np.conj(alpha)) > 1e-10).any():
+            raise ValueError("Matrix is not Hermitian: H[0,1] != conj(H[1,0])")
+        return cls(H[:, 0, 0].real, alpha, H[:, 1, 1].real)
+
+    @classmethod
+    def from_three_points(cls, zs):
+        r"""Construct the clines through N triples of points.
+
+        The batched form of :meth:`cline.Cline.from_three_points`, giving the
+        same coefficients: c = 1 for circles, c = 0 for lines and the point
+        cline :math:`|z - z_0|^2 = 0` when all three points coincide.
+
+        Circles use the closed-form circumcenter in coordinates shifted to
+        :math:`z_0`. With :math:`u = z_1 - z_0` and :math:`v = z_2 - z_0` the
+        center is
+
+        .. math::
+
+           m = z_0 + \frac{|u|^2 v - |v|^2 u}{2i\,\text{Im}(\bar{u} v)},
+
+        so :math:`\alpha = -\bar{m}` and :math:`d = |z_0|^2 + 2\text{Re}(z_0 \overline{(m - z_0)})`.
+        Triples are classified with masks, so no Python loop runs per row.
+
+        Args:
+            zs (array_like): Complex points, shape (N, 3). A non-finite entry
+                (inf or NaN) is the point at infinity.
+
+        Returns:
+            ClineArray: The N clines, in order. A row with one point at
+            infinity gives the line through the other two. A row that does
+            not determine a cline has NaN coefficients. This happens when two
+            or more points are at infinity, or one is at infinity and the
+            other two coincide.
+
+        Raises:
+            ValueError: if zs does not have shape (N, 3).
+        """
+        zs = np.asarray(zs, dtype=complex)
+        if zs.ndim != 2 or zs.shape[1] != 3:
+            raise ValueError(f"zs must have shape (N, 3), got {zs.shape}")
+        z0, z1, z2 = zs[:, 0], zs[:, 1], zs[:, 2]
+        infinite = ~np.isfinite(zs)
+        n_infinite = infinite.sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            u = z1 - z0
+            v = z2 - z0
+            uu = u.real ** 2 + u.imag ** 2
+            vv = v.real ** 2 + v.imag ** 2
+            cross = u.real * v.imag - u.imag * v.real  # Im(conj(u) v)
+
+            # Same tests as the scalar constructor: |u| < 1e-10 for
+            # coincidence and |Im(v / u)| < 1e-10 for collinearity
+            same01 = uu < 1e-20
+            is_point = same01 & (vv < 1e-20)
+            is_line = same01 | (np.abs(cross) < 1e-10 * uu)
+
+            offset = (uu * v - vv * u) / (2j * cross)
+            alpha = -np.conj(z0 + offset)
+            d = z0.real ** 2 + z0.imag ** 2 + 2 * (z0 * np.conj(offset)).real
+            c = np.ones(len(zs))
+
+            # Lines through z0 along u, or along v when z0 = z1
+            direction = np.where(same01, v, u)
+            line_alpha = 1j * np.conj(direction)
+            c[is_line] = 0.0
+            alpha = np.where(is_line, line_alpha, alpha)
+            d = np.where(is_line, -2 * (line_alpha * z0).real, d)
+
+            alpha = np.where(is_point, -np.conj(z0), alpha)
+            d = np.where(is_point, z0.real ** 2 + z0.imag ** 2, d)
+            c[is_point] = 1.0
+
+            # One point at infinity: the line through the other two, in order
+            at_infinity = n_infinite == 1
+            p = np.where(infinite[:, 0], z1, z0)
+            q = np.where(infinite[:, 2], z1, z2)
+            line_alpha = 1j * np.conj(q - p)
+            c[at_infinity] = 0.0
+            alpha = np.where(at_infinity, line_alpha, alpha)
+            d = np.where(at_infinity, -2 * (line_alpha * p).real, d)
+
+            undefined = (n_infinite > 1) | (at_infinity & (np.abs(q - p) < 1e-10))
+            c[undefined] = np.nan
+            alpha[undefined] = np.nan
+            d[undefined] = np.nan
+        return cls(c, alpha, d)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """Join several ClineArrays end to end.
+
+        Args:
+            arrays (iterable of ClineArray): The arrays to join.
+
+        Returns:
+            ClineArray: A new array holding all clines in order.
+        """
+        arrays = list(arrays)
+        if not arrays:
+            return cls(np.empty(0), np.empty(0, dtype=complex), np.empty(0))
+        return cls(
+            np.concatenate([A.c for A in arrays]),
+            np.concatenate([A.alpha for A in arrays]),
+            np.concatenate([A.d for A in arrays]),
+        )
+
+    @cached_property
+    def discriminant(self):
+        r"""The discriminants :math:`\Delta = |\alpha|^2 - c \cdot d`, shape (N,)."""
+        return self.alpha.real ** 2 + self.alpha.imag ** 2 - self.c * self.d
+
+    @cached_property
+    def is_line(self):
+        """Boolean mask of clines with c = 0 (within 1e-10)."""
+        return np.abs(self.c) <= 1e-10
+
+    @cached_property
+    def is_circle(self):
+        """Boolean mask of clines that are circles (c ≠ 0 and Δ > 1e-10)."""
+        return (np.abs(self.c) > 1e-10) & (self.discriminant > 1e-10)
+
+    @cached_property
+    def is_point(self):
+        """Boolean mask of clines that are single points (c ≠ 0 and |Δ| < 1e-10)."""
+        return (np.abs(self.c) > 1e-10) & (np.abs(self.discriminant) < 1e-10)
+
+    @cached_property
+    def center(self):
+        r"""Circle centers :math:`-\bar{\alpha}/c`, NaN for clines that are not circles."""
+        center = np.full(len(self), np.nan, dtype=complex)
+        mask = self.is_circle
+        center[mask] = -np.conj(self.alpha[mask]) / self.c[mask]
+        return center
+
+    @cached_property
+    def radius(self):
+        r"""Circle radii :math:`\sqrt{\Delta}/|c|`, NaN for clines that are not circles."""
+        radius = np.full(len(self), np.nan)
+        mask = self.is_circle
+        radius[mask] = np.sqrt(self.discriminant[mask]) / np.abs(self.c[mask])
+        return radius
+
+    @cached_property
+    def point(self):
+        r"""Point locations :math:`-\bar{\alpha}/c` of point clines, NaN elsewhere."""
+        point = np.full(len(self), np.nan, dtype=complex)
+        mask = self.is_point
+        point[mask] = -np.conj(self.alpha[mask]) / self.c[mask]
+        return point
+
+    def evaluate(self, zs, out=None):
+        r"""Evaluate the Hermitian forms :math:`c|z|^2 + 2\text{Re}(\alpha z) + d`.
+
+        The coefficient arrays of shape (N,) broadcast against zs with the usual
+        NumPy rules: zs of shape (N,) pairs each cline with one point, while zs of
+        shape (M, 1) evaluates every cline at every point, giving shape (M, N).
+
+        Args:
+            zs (array_like): Complex points, broadcastable against (N,).
+            out (numpy.ndarray, optional): float64 array of the broadcast shape
+                to write the result into.
+
+        Returns:
+            numpy.ndarray: The real values of the forms.
+        """
+        return _hermitian_form(self.c, self.alpha, self.d, zs, out)
+
+    def contains_many(self, zs, out=None):
+        """Boolean mask of where points lie on the clines (tolerance 1e-10).
+
+        Broadcasting follows :meth:`evaluate`.
+
+        Args:
+            zs (array_like): Complex points, broadcastable against (N,).
+            out (numpy.ndarray, optional): bool array of the broadcast shape
+                to write the result into.
+
+        Returns:
+            numpy.ndarray: Boolean mask, True where the point lies on the cline.
+        """
+        vals = self.evaluate(zs)
+        return np.less(np.abs(vals, out=vals), 1e-10, out=out)
+
+    def classify_points(self, zs):
+        """Locate points relative to the clines, as in :meth:`cline.Cline.classify_points`.
+
+        Broadcasting follows :meth:`evaluate`.
+
+        Args:
+            zs (array_like): Complex points, broadcastable against (N,).
+
+        Returns:
+            tuple of numpy.ndarray: Boolean masks (on, inside, outside).
+        """
+        vals = self.evaluate(zs)
+        vals *= np.where(self.c < -1e-10, -1.0, 1.0)
+        on = np.abs(vals) < 1e-10
+        inside = vals <= -1e-10
+        outside = vals >= 1e-10
+        return on, inside, outside
+
+    def invert_points(self, zs, out=None):
+        """Invert (or reflect) points in the clines, as in :meth:`cline.Cline.invert_points`.
+
+        Broadcasting follows :meth:`evaluate`. NaN stands for the point at
+        infinity. Images under degenerate clines (points or invalid) are NaN.
+
+        Args:
+            zs (array_like): Complex points, broadcastable against (N,).
+            out (numpy.ndarray, optional): complex128 array of the broadcast shape
+                to write the result into.
+
+        Returns:
+            numpy.ndarray: The image points.
+        """
+        out = _invert_points(self.c, self.alpha, self.d, zs, out)
+        degenerate = ~(self.is_circle | self.is_line)
+        if degenerate.any():
+            out[np.broadcast_to(degenerate, out.shape)] = np.nan
+        return out
+
+    def invert_in(self, mirror):
+        r"""Return the images of these clines under inversion in ``mirror``.
+
+        Uses the closed form of :meth:`cline.Cline.invert` for all clines at once:
+
+        .. math::
+
+            (c', \alpha', d') = (c, \alpha, d) + \frac{P}{\Delta_J}(c_J, \alpha_J, d_J)
+
+        Args:
+            mirror (Cline or ClineArray): A single inversion cline, or one
+                inversion cline per entry (same length as this array).
+
+        Returns:
+            ClineArray: The image clines. Entries whose source or mirror is
+            degenerate (a point or invalid) are NaN.
+
+        Raises:
+            ValueError: if mirror is a single degenerate Cline.
+        """
+        if isinstance(mirror, Cline):
+            if not (mirror.is_circle or mirror.is_line):
+                raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+            mirror_valid = True
+            c_j, alpha_j, d_j = float(mirror.c), complex(mirror.alpha), float(mirror.d)
+        else:
+            mirror_valid = mirror.is_circle | mirror.is_line
+            c_j, alpha_j, d_j = mirror.c, mirror.alpha, mirror.d
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c, alpha, d = _invert_coefficients(self.c, self.alpha, self.d, c_j, alpha_j, d_j)
+        invalid = ~((self.is_circle | self.is_line) & mirror_valid)
+        if invalid.any():
+            c[invalid] = np.nan
+            alpha[invalid] = np.nan
+            d[invalid] = np.nan
+        return ClineArray(c, alpha, d)
+
+    def canonical(self):
+        r"""Return the clines with canonically scaled coefficients.
+
+        The vectorized form of :meth:`cline.Cline.canonical`: c = 1 for
+        clines with c ≠ 0, and :math:`|\alpha| = 1` with a positive first
+        nonzero component of alpha for lines. Lines with α = 0 are left
+        unchanged.
+
+        Returns:
+            ClineArray: The rescaled clines.
+        """
+        norm = np.abs(self.alpha)
+        flip = (self.alpha.real < 0) | ((self.alpha.real == 0) & (self.alpha.imag < 0))
+        scale = np.where(
+            self.is_line,
+            np.where(flip, -1.0, 1.0) / np.where(norm == 0, 1.0, norm),
+            1 / np.where(self.is_line, 1.0, self.c),
+        )
+        return ClineArray(self.c * scale, self.alpha * scale, self.d * scale)
+
+    def keys(self, tolerance=_KEY_TOLERANCE):
+        """Return quantized canonical keys, equal for clines that are equal up to scale.
+
+        Row k equals :attr:`cline.Cline.canonical_key` of ``self[k]`` when
+        tolerance has its default value, so ``==`` on Clines and these keys
+        agree. The coefficients are scaled to unit norm with a fixed sign
+        and rounded to integer multiples of tolerance.
+
+        Args:
+            tolerance (float, optional): Quantum of the unit-norm
+                coefficients. Defaults to 1e-9.
+
+        Returns:
+            numpy.ndarray: int64 array of shape (N, 4).
+        """
+        return _canonical_keys(self.c, self.alpha, self.d, tolerance)
+
+    def isclose(self, other, tolerance=_KEY_TOLERANCE):
+        """Test which clines are equal to other up to scale, within a tolerance.
+
+        The vectorized form of :meth:`cline.Cline.isclose`.
+
+        Args:
+            other (Cline or ClineArray): One cline, or one cline per entry.
+            tolerance (float, optional): Largest allowed difference of the
+                unit-norm coefficients. Defaults to 1e-9.
+
+        Returns:
+            numpy.ndarray: Boolean array of shape (N,).
+        """
+        if isinstance(other, Cline):
+            other_c, other_alpha, other_d = float(other.c), complex(other.alpha), float(other.d)
+        else:
+            other_c, other_alpha, other_d = other.c, other.alpha, other.d
+        distance = _unit_distance(self.c, self.alpha, self.d, other_c, other_alpha, other_d)
+        return distance <= tolerance
+
+    def unique(self, tolerance=_KEY_TOLERANCE):
+        """Remove duplicate clines, keeping the first of each.
+
+        Two clines are duplicates when their :meth:`keys` are equal. Each key
+        is mixed into one 64-bit hash and the hashes are deduplicated in a
+        single pass over a sorted one-dimensional array. Different keys with
+        the same hash are detected, and the keys are then compared in full.
+        Invalid clines with non-finite coefficients all count as one.
+
+        Args:
+            tolerance (float, optional): Quantum of the unit-norm
+                coefficients. Defaults to 1e-9.
+
+        Returns:
+            tuple: ``(unique, indices)``. unique is a ClineArray of the kept
+            clines in their original order, and indices are their positions
+            in this array (increasing).
+        """
+        keys = self.keys(tolerance)
+        _, first, inverse = np.unique(keys @ _KEY_MIX, return_index=True, return_inverse=True)
+        if (keys != keys[first[inverse]]).any():
+            _, first = np.unique(keys, axis=0, return_index=True)
+        first.sort()
+        return self[first], first
+
+    def pairwise_intersections(self, chunk_size=_PAIR_CHUNK_SIZE, index=None):
+        """Return every intersection point of every pair of clines in the array.
+
+        Vectorized counterpart of calling :meth:`cline.Cline.intersection` on
+        all pairs ``i < j``. The pairs are processed in chunks of at most
+        ``chunk_size`` so memory stays bounded for large arrays.
+
+        By default a :class:`spatial.ClineIndex` is built first and only the
+        pairs it cannot rule out are tested, so sparse scenes cost roughly in
+        proportion to the number of nearby pairs rather than :math:`N^2`.
+
+        Args:
+            chunk_size (int, optional): Maximum number of pairs per chunk.
+            index (spatial.ClineIndex or bool, optional): A prebuilt index over
+                this array, or False to test all pairs. Defaults to building
+                an index.
+
+        Returns:
+            numpy.ndarray: Structured array of dtype :data:`INTERSECTION_DTYPE`,
+            sorted by (i, j). A pair meeting transversally contributes two
+            rows of multiplicity 1, a tangent pair one row of multiplicity 2
+            and two crossing lines one row (their common point at infinity is
+            not reported). Disjoint, coincident, concentric and parallel pairs,
+            and pairs involving a degenerate cline, contribute nothing.
+        """
+        if index is False:
+            return _intersection_records(self, self, chunk_size, upper=True)
+
+        from spatial import ClineIndex
+
+        if index is None or index is True:
+            index = ClineIndex(self)
+        elif index.clines is not self:
+            raise ValueError("index was built for a different ClineArray")
+        chunks = [
+            _intersect_pairs(self, ii, self, jj)
+            for ii, jj in index.iter_candidate_pairs(chunk_size)
+        ]
+        if not chunks:
+            return np.empty(0, dtype=INTERSECTION_DTYPE)
+        records = np.concatenate(chunks)
+        return records[np.lexsort((records["j"], records["i"]))]
+
+    def __len__(self):
+        """Return the number of clines."""
+        return len(self.c)
+
+    def __getitem__(self, index):
+        """Return a Cline for an integer index, or a ClineArray for a slice, mask or index array."""
+        if isinstance(index, (int, np.integer)):
+            return Cline(c=self.c[index], alpha=self.alpha[index], d=self.d[index])
+        return ClineArray(self.c[index], self.alpha[index], self.d[index])
+
+    def __iter__(self):
+        """Iterate over the clines as Cline objects."""
+        return iter(self.to_clines())
+
+    def __reduce__(self):
+        """Pickle only the coefficient arrays, not the cached derived attributes."""
+        return (ClineArray, (self.c, self.alpha, self.d))
+
+    def __repr__(self):
+        """Return a short summary of the array."""
+        return (
+            f"ClineArray({len(self)} clines: {int(self.is_circle.sum())} circles, "
+            f"{int(self.is_line.sum())} lines, {int(self.is_point.sum())} points)"
+        )
+
+
+def cross_intersections(A, B, chunk_size=_PAIR_CHUNK_SIZE):
+    """Return every intersection point between a cline of A and a cline of B.
+
+    Like :meth:`ClineArray.pairwise_intersections`, but over all pairs
+    ``(i, j)`` with i indexing A and j indexing B.
+
+    Args:
+        A (ClineArray): First set of clines.
+        B (ClineArray): Second set of clines.
+        chunk_size (int, optional): Maximum number of pairs per chunk.
+
+    Returns:
+        numpy.ndarray: Structured array of dtype :data:`INTERSECTION_DTYPE`,
+        sorted by (i, j).
+    """
+    return _intersection_records(A, B, chunk_size, upper=False)
+
+
+def _pair_chunks(n_rows, n_cols, chunk_size, upper):
+    """Yield (ii, jj) index arrays covering all pairs in blocks of rows.
+
+    With ``upper`` only pairs with jj > ii are produced. Pairs come out in
+    lexicographic order.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    rows_per_chunk = max(1, chunk_size // max(n_cols, 1))
+    cols = np.arange(n_cols)
+    for start in range(0, n_rows, rows_per_chunk):
+        rows = np.arange(start, min(start + rows_per_chunk, n_rows))
+        if upper:
+            ii, jj = np.nonzero(cols[None, :] > rows[:, None])
+            yield rows[ii], jj
+        else:
+            yield np.repeat(rows, n_cols), np.tile(cols, len(rows))
+
+
+def _intersection_records(A, B, chunk_size, upper):
+    """Run the chunked intersection engine and collect the records."""
+    chunks = [
+        _intersect_pairs(A, ii, B, jj)
+        for ii, jj in _pair_chunks(len(A), len(B), chunk_size, upper)
+    ]
+    if not chunks:
+        return np.empty(0, dtype=INTERSECTION_DTYPE)
+    return np.concatenate(chunks)
+
+
+def _tangency_reach(radius):
+    """Return how far outside a circle another curve still counts as touching.
+
+    Two circles are reported tangent when the gap between them is below the
+    sum of their reaches, and a circle and a line when the gap is below the
+    reach of the circle. :func:`_intersect_pairs` derives its tolerance from
+    this, and :class:`spatial.ClineIndex` pads its boxes by it, so the index
+    never prunes a pair that the engine would report.
+    """
+    return 5e-11 * radius
+
+
+def _intersect_pairs(A, ii, B, jj):
+    r"""Intersect the clines A[ii] and B[jj] elementwise.
+
+    Every pair involving a circle is reduced to a circle and a line: for two
+    circles the line is their radical axis, obtained by subtracting the monic
+    equations :math:`|z|^2 + 2\text{Re}((\alpha/c) z) + d/c = 0`. With
+    :math:`s` the signed distance from the center p to the line
+    :math:`2\text{Re}(\alpha_L z) + d_L = 0` and unit normal
+    :math:`n = \bar{\alpha}_L/|\alpha_L|`, the intersection points are
+
+    .. math::
+
+        p - s n \pm i n \sqrt{r^2 - s^2}
+
+    A pair of lines is solved directly with Cramer's rule.
+    """
+    circle1, line1 = A.is_circle[ii], A.is_line[ii]
+    circle2, line2 = B.is_circle[jj], B.is_line[jj]
+    c1, alpha1, d1 = A.c[ii], A.alpha[ii], A.d[ii]
+    c2, alpha2, d2 = B.c[jj], B.alpha[jj], B.d[jj]
+    radius1, radius2 = A.radius[ii], B.radius[jj]
+    circles = circle1 & circle2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Circle-circle, circle-line and line-circle pairs. Of two circles the
+        # smaller one is kept, so that r² - s² does not lose its precision
+        from_a = circle1 & ~(circles & (radius2 < radius1))
+        center = np.where(from_a, A.center[ii], B.center[jj])
+        radius = np.where(from_a, radius1, radius2)
+        alpha_l = np.where(circles, alpha1 / c1 - alpha2 / c2, np.where(line2, alpha2, alpha1))
+        d_l = np.where(circles, d1 / c1 - d2 / c2, np.where(line2, d2, d1))
+
+        norm = np.abs(alpha_l)
+        normal = np.conj(alpha_l) / norm
+        s = (2 * (alpha_l * center).real + d_l) / (2 * norm)
+        foot = center - s * normal
+        disc = radius ** 2 - s ** 2
+        half_chord = 1j * normal * np.sqrt(np.maximum(disc, 0))
+
+        # Near a tangency with gap g, disc ≈ -2 r₁ r₂ g / (r₁ + r₂) for two
+        # circles and -2 r g for a circle and a line; for two circles norm
+        # is the distance of their centers
+        with_circle = (circle1 & (circle2 | line2)) | (line1 & circle2)
+        with_circle &= norm > np.where(circles, 1e-10 * (radius1 + radius2), 0)  # concentric
+        gap = np.where(
+            circles, _tangency_reach(radius1) + _tangency_reach(radius2), _tangency_reach(radius)
+        )
+        tolerance = 2 * gap * np.where(circles, radius1 * radius2 / (radius1 + radius2), radius)
+        tangent = with_circle & (np.abs(disc) < tolerance)
+        crossing = with_circle & (disc >= tolerance)
+
+        # Line-line pairs: a₁x - b₁y = -d₁/2, a₂x - b₂y = -d₂/2
+        a1, b1, a2, b2 = alpha1.real, alpha1.imag, alpha2.real, alpha2.imag
+        det = a2 * b1 - a1 * b2
+        x = (d1 * b2 - d2 * b1) / (2 * det)
+        y = (a2 * d1 - a1 * d2) / (2 * det)
+        lines = line1 & line2 & (np.abs(det) >= 1e-10 * np.abs(alpha1) * np.abs(alpha2))
+
+        first = np.where(lines, x + 1j * y, foot + half_chord)
+        second = foot - half_chord
+    keep = np.stack([tangent | crossing | lines, crossing], axis=1)
+    rows, cols = np.nonzero(keep)
+
+    out = np.empty(len(rows), dtype=INTERSECTION_DTYPE)
+    out["i"] = ii[rows]
+    out["j"] = jj[rows]
+    out["point"] = np.where(cols == 0, first[rows], second[rows])
+    out["multiplicity"] = np.where(tangent[rows], 2, 1)
+    return out
@@ -0,0 +1,197 @@
+r"""
+Binary storage of large cline collections.
+
+A collection of N clines is stored as a standard NumPy ``.npy`` file holding
+a one-dimensional array of :data:`cline_array.CLINE_DTYPE` records:
+
+=========  ============  ==========================================
+field      type          meaning
+=========  ============  ==========================================
+``c``      ``<f8``       real coefficient of :math:`z\bar z`
+``alpha``  ``<c16``      complex coefficient of z
+``d``      ``<f8``       real constant term
+=========  ============  ==========================================
+
+Each record is 32 bytes and the records follow the header in order, so the
+file can be read by ``numpy.load`` (or any ``.npy`` reader) without this
+package. :func:`load` with ``mmap_mode`` maps the file instead of reading
+it. The :class:`ClineArray` it returns views the mapped fields, so opening
+a multi-gigabyte file is instant and slicing it copies nothing. Only the
+pages that are actually used get read.
+
+The ``.npy`` file always holds floating-point coefficients. If some of the
+saved clines were exact (sympy or Gaussian-rational), their exact
+coefficients also go into a JSON side table next to it, with the suffix
+``.exact.json`` instead of ``.npy``::
+
+    {"version": 1, "rows": [
+        {"index": 3, "mode": "gaussian",
+         "c": "1/2", "alpha": ["3", "-1/4"], "d": "-7"},
+        {"index": 8, "mode": "sympy",
+         "c": "Integer(1)", "alpha": "...", "d": "..."}
+    ]}
+
+Gaussian-rational values are stored as fraction strings and sympy values
+as ``sympy.srepr`` strings. :func:`load_exact` rebuilds those clines.
+"""
+
+import json
+import os
+from fractions import Fraction
+
+import numpy as np
+
+from cline import Cline, sympy
+from cline_array import CLINE_DTYPE, ClineArray
+from gaussian import GaussianRational
+
+# Number of records written per step by save, bounding its scratch memory
+_SAVE_CHUNK_SIZE = 1 << 20
+
+_SIDE_TABLE_VERSION = 1
+
+
+def _npy_path(path):
+    """Append .npy to path unless present, like numpy.save."""
+    path = os.fspath(path)
+    return path if path.endswith(".npy") else path + ".npy"
+
+
+def _side_table_path(path):
+    """Path of the exact side table that belongs to a .npy file."""
+    return _npy_path(path)[:-len(".npy")] + ".exact.json"
+
+
+def _exact_row(index, C):
+    """Side table entry of one exact cline."""
+    if C._is_gaussian:
+        return {
+            "index": index,
+            "mode": "gaussian",
+            "c": str(C.c),
+            "alpha": [str(C.alpha.real), str(C.alpha.imag)],
+            "d": str(C.d),
+        }
+    return {
+        "index": index,
+        "mode": "sympy",
+        "c": sympy.srepr(C.c),
+        "alpha": sympy.srepr(C.alpha),
+        "d": sympy.srepr(C.d),
+    }
+
+
+def _cline_from_row(row):
+    """Rebuild an exact cline from its side table entry."""
+    if row["mode"] == "gaussian":
+        real, imag = row["alpha"]
+        return Cline(
+            c=Fraction(row["c"]),
+            alpha=GaussianRational(Fraction(real), Fraction(imag)),
+            d=Fraction(row["d"]),
+        )
+    if row["mode"] == "sympy":
+        return Cline(
+            c=sympy.sympify(row["c"]),
+            alpha=sympy.sympify(row["alpha"]),
+            d=sympy.sympify(row["d"]),
+        )
+    raise ValueError(f"Unknown exact mode {row['mode']!r} in side table")
+
+
+def save(path, clines):
+    """Save clines to a .npy file of :data:`cline_array.CLINE_DTYPE` records.
+
+    Records are written in chunks through a memory map of the output file,
+    so saving a ClineArray needs little memory beyond the array itself.
+    Exact clines in a list are written as floats, and their exact
+    coefficients go to the side table. An existing side table for the same
+    path is removed when there are no exact clines.
+
+    Args:
+        path (str or os.PathLike): Output file. ``.npy`` is appended if
+            missing, as by ``numpy.save``.
+        clines (ClineArray or iterable of Cline): The clines to save.
+
+    Returns:
+        str: The path of the .npy file written.
+    """
+    path = _npy_path(path)
+    exact_rows = []
+    if not isinstance(clines, ClineArray):
+        clines = list(clines)
+        exact_rows = [_exact_row(k, C) for k, C in enumerate(clines) if C._is_exact]
+        clines = ClineArray.from_clines(clines)
+
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=CLINE_DTYPE, shape=(len(clines),))
+    try:
+        for start in range(0, len(clines), _SAVE_CHUNK_SIZE):
+            stop = start + _SAVE_CHUNK_SIZE
+            out["c"][start:stop] = clines.c[start:stop]
+            out["alpha"][start:stop] = clines.alpha[start:stop]
+            out["d"][start:stop] = clines.d[start:stop]
+        out.flush()
+    finally:
+        del out
+
+    side_table = _side_table_path(path)
+    if exact_rows:
+        with open(side_table, "w", encoding="utf-8") as f:
+            json.dump({"version": _SIDE_TABLE_VERSION, "rows": exact_rows}, f)
+    elif os.path.exists(side_table):
+        os.remove(side_table)
+    return path
+
+
+def load(path, mmap_mode=None):
+    """Load clines saved by :func:`save` as a ClineArray.
+
+    Args:
+        path (str or os.PathLike): The .npy file (``.npy`` is appended if
+            missing).
+        mmap_mode (str, optional): None reads the whole file into memory.
+            ``"r"`` (read-only), ``"r+"`` or ``"c"`` (copy-on-write) map it
+            instead, as in ``numpy.load``. The coefficient arrays of the
+            result then view the mapped file.
+
+    Returns:
+        ClineArray: The clines, with floating-point coefficients. Use
+        :func:`load_exact` for the exact ones.
+
+    Raises:
+        ValueError: if the file does not hold a one-dimensional array of
+            :data:`cline_array.CLINE_DTYPE` records.
+    """
+    records = np.load(_npy_path(path), mmap_mode=mmap_mode, allow_pickle=False)
+    if records.dtype != CLINE_DTYPE or records.ndim != 1:
+        raise ValueError(
+            f"Expected a one-dimensional array of {CLINE_DTYPE}, "
+            f"got {records.dtype} with shape {records.shape}"
+        )
+    return ClineArray.from_records(records)
+
+
+def load_exact(path):
+    """Load the exact clines of the side table written by :func:`save`.
+
+    Sympy coefficients are parsed with ``sympy.sympify``, which evaluates
+    code. Only load side tables from trusted sources.
+
+    Args:
+        path (str or os.PathLike): The .npy file the side table belongs to.
+
+    Returns:
+        dict: Maps the index of each exact cline to the rebuilt Cline. Empty
+        if there is no side table.
+
+    Raises:
+        ValueError: if the side table has an unknown version or mode.
+    """
+    side_table = _side_table_path(path)
+    if not os.path.exists(side_table):
+        return {}
+    with open(side_table, encoding="utf-8") as f:
+        table = json.load(f)
+    if table.get("version") != _SIDE_TABLE_VERSION:
+        raise ValueError(f"Unsupported side table version {table.get('version')!r}")
+    return {row["index"]: _cline_from_row(row) for row in table["rows"]}
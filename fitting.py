@@ -0,0 +1,328 @@
+r"""
+Least-squares fitting of clines to point clouds.
+
+A cline :math:`c|z|^2 + \alpha z + \bar\alpha\bar z + d = 0` is linear in its
+coefficients. With :math:`z = x + iy` and :math:`\alpha = a + bi` each point
+gives the row :math:`r = (x^2 + y^2, x, y, 1)` and the residual
+
+.. math::
+
+   f(z) = r \cdot \theta, \qquad \theta = (c, 2a, -2b, d).
+
+The algebraic fit minimizes :math:`\theta^T M \theta` with the moment matrix
+:math:`M = \sum r r^T`, subject to Pratt's constraint
+
+.. math::
+
+   \theta^T N \theta = 4\Delta = 4(|\alpha|^2 - cd) = 1.
+
+Near the cline :math:`|\nabla f|^2 = 4\Delta`, so the constraint makes the
+residuals approximate distances. It also treats lines (c = 0) like any other
+cline. Center-radius fits blow up on nearly straight data because the radius
+goes to infinity; this fit lets c go smoothly to 0. The minimizer is the
+eigenvector of :math:`M\theta = \eta N\theta` with the smallest nonnegative
+:math:`\eta`. N is indefinite, so this generalized problem is not symmetric
+as it stands. Whitening with the positive semidefinite M turns it into an
+ordinary symmetric 4x4 eigenproblem, solved with ``numpy.linalg.eigh``.
+
+:math:`M` only needs the power sums :math:`\sum x^i y^j` with
+:math:`i + j \leq 4`. A :class:`ClineFitAccumulator` therefore consumes
+points chunk by chunk in O(1) memory. Accumulators filled in different
+processes merge exactly.
+
+Fitted clines are normalized to :math:`\Delta = 1` with :math:`c \geq 0`.
+A circle then has :math:`c = 1/r`, and a line has a unit normal
+:math:`\alpha` and c = 0.
+
+Reference:
+    V. Pratt, *Direct least-squares fitting of algebraic surfaces*,
+    SIGGRAPH 1987; N. Chernov, *Circular and Linear Regression*, 2010, Ch. 5.
+"""
+
+from math import comb
+
+import numpy as np
+
+from cline import Cline
+
+# Exponent pairs (i, j) of the stored power sums sum x^i y^j, i + j <= 4
+_POWERS = [(i, j) for i in range(5) for j in range(5 - i)]
+_INDEX = {p: k for k, p in enumerate(_POWERS)}
+
+# Pratt's constraint matrix: theta^T N theta = A^2 + B^2 - 4cd for theta = (c, A, B, d)
+_PRATT = np.array([
+    [0.0, 0.0, 0.0, -2.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [-2.0, 0.0, 0.0, 0.0],
+])
+
+# Default cap on Gauss-Newton iterations of the geometric refinement
+_REFINE_MAX_ITER = 50
+
+
+def _as_points(points):
+    """Return points as a finite one-dimensional complex array."""
+    zs = np.asarray(points, dtype=complex).ravel()
+    if not np.isfinite(zs).all():
+        raise ValueError("Points must be finite")
+    return zs
+
+
+def _power_sums(x, y):
+    """Return the power sums sum x^i y^j for (i, j) in _POWERS."""
+    xp = [np.ones_like(x)]
+    yp = [np.ones_like(y)]
+    for _ in range(4):
+        xp.append(xp[-1] * x)
+        yp.append(yp[-1] * y)
+    return np.array([np.dot(xp[i], yp[j]) for i, j in _POWERS])
+
+
+def _shift_power_sums(S, dx, dy):
+    """Re-express power sums about a reference moved by (dx, dy).
+
+    Given sums of x^i y^j, returns sums of (x - dx)^i (y - dy)^j.
+    """
+    shifted = np.zeros_like(S)
+    for i, j in _POWERS:
+        total = 0.0
+        for k in range(i + 1):
+            for m in range(j + 1):
+                total += (comb(i, k) * comb(j, m) * (-dx) ** (i - k) * (-dy) ** (j - m)
+                          * S[_INDEX[k, m]])
+        shifted[_INDEX[i, j]] = total
+    return shifted
+
+
+def _moment_matrix(S):
+    """Build M = sum r r^T for r = (x^2 + y^2, x, y, 1) from power sums."""
+    s = lambda i, j: S[_INDEX[i, j]]  # noqa: E731
+    M = np.empty((4, 4))
+    M[0, 0] = s(4, 0) + 2 * s(2, 2) + s(0, 4)
+    M[0, 1] = s(3, 0) + s(1, 2)
+    M[0, 2] = s(2, 1) + s(0, 3)
+    M[0, 3] = s(2, 0) + s(0, 2)
+    M[1, 1] = s(2, 0)
+    M[1, 2] = s(1, 1)
+    M[1, 3] = s(1, 0)
+    M[2, 2] = s(0, 2)
+    M[2, 3] = s(0, 1)
+    M[3, 3] = s(0, 0)
+    iu = np.triu_indices(4, 1)
+    M[iu[1], iu[0]] = M[iu]
+    return M
+
+
+def _pratt_solve(M):
+    r"""Return the unit-Pratt-norm theta minimizing theta^T M theta.
+
+    The stationary points solve :math:`N\theta = \mu M\theta` with
+    :math:`\mu = 1/\eta`. M is symmetric positive semidefinite, so whitening
+    with :math:`M = QDQ^T` and :math:`B = QD^{-1/2}` turns this into the
+    symmetric eigenproblem of :math:`B^T N B`, with :math:`\theta = Bu`.
+    The minimizer has the largest :math:`\mu`. Eigenvalues of M below a
+    relative floor are raised to it, so points lying exactly on a cline
+    (singular M) give that cline as the dominant eigenvector.
+    """
+    D, Q = np.linalg.eigh(M)
+    if not D[-1] > 0:
+        raise ValueError("Points do not determine a cline")
+    B = Q / np.sqrt(np.maximum(D, 1e-15 * D[-1]))
+    mu, U = np.linalg.eigh(B.T @ _PRATT @ B)
+    if not mu[-1] > 0:
+        raise ValueError("Points do not determine a cline")
+    theta = B @ U[:, -1]
+    return theta / np.sqrt(theta @ _PRATT @ theta)
+
+
+def _to_cline(theta, center, scale):
+    """Map theta fitted in w = (z - center)/scale back to a normalized Cline."""
+    c_w, A, B, d_w = theta
+    alpha_w = complex(A / 2, -B / 2)
+    c = c_w / scale ** 2
+    alpha = alpha_w / scale - c * np.conj(center)
+    d = c * abs(center) ** 2 - 2 * (alpha_w * center).real / scale + d_w
+    # Normalize to Delta = 1 and c >= 0
+    norm = np.sqrt(abs(alpha) ** 2 - c * d)
+    if c < 0:
+        norm = -norm
+    return Cline(c=c / norm, alpha=alpha / norm, d=d / norm)
+
+
+def _signed_distances(theta, x, y):
+    r"""Signed distances of points to the cline theta, with their Jacobian.
+
+    For :math:`\Delta = (A^2 + B^2)/4 - cd` the distance is
+    :math:`g = f / (\sqrt{\Delta} + \sqrt{\Delta + cf})`, which reduces to
+    :math:`f / (2|\alpha|)` for lines.
+    """
+    c, A, B, d = theta
+    rows = np.stack([x * x + y * y, x, y, np.ones_like(x)], axis=1)
+    f = rows @ theta
+    delta = (A * A + B * B) / 4 - c * d
+    s = np.sqrt(delta)
+    t = np.sqrt(np.maximum(delta + c * f, 1e-300))
+    D = s + t
+    g = f / D
+
+    d_delta = np.array([-d, A / 2, B / 2, -c])
+    d_s = d_delta / (2 * s)
+    d_t = (d_delta + np.outer(f, [1.0, 0.0, 0.0, 0.0]) + c * rows) / (2 * t[:, None])
+    J = rows / D[:, None] - (f / D ** 2)[:, None] * (d_s + d_t)
+    return g, J
+
+
+def _refine(theta, x, y, max_iter=_REFINE_MAX_ITER, tol=1e-10):
+    """Minimize the sum of squared geometric distances by Gauss-Newton.
+
+    The distance is invariant under scaling theta, so each step is the
+    minimum-norm least-squares solution, halved until the cost decreases.
+    Near the minimum the cost changes by less than its rounding error, so
+    a step is also accepted if the cost grows by at most that much, and
+    the iteration stops once a step is smaller than tol relative to theta.
+    """
+    g, J = _signed_distances(theta, x, y)
+    cost = g @ g
+    for _ in range(max_iter):
+        step = np.linalg.lstsq(J, -g, rcond=None)[0]
+        improved = False
+        for _ in range(20):
+            candidate = theta + step
+            norm = candidate @ _PRATT @ candidate
+            if norm > 0:
+                candidate = candidate / np.sqrt(norm)
+                g_new, J_new = _signed_distances(candidate, x, y)
+                cost_new = g_new @ g_new
+                if cost_new <= cost * (1 + 1e-12):
+                    improved = True
+                    break
+            step = step / 2
+        if not improved:
+            break
+        done = np.linalg.norm(step) <= tol * np.linalg.norm(theta)
+        theta, g, J, cost = candidate, g_new, J_new, cost_new
+        if done:
+            break
+    return theta
+
+
+class ClineFitAccumulator:
+    """Streaming algebraic cline fit over chunks of points.
+
+    Only the point count and the power sums up to degree 4 are stored, about
+    a reference point taken from the first chunk. Memory use does not depend
+    on the number of points. Accumulators pickle, so partial fits can be
+    computed in worker processes and combined with :meth:`merge`.
+
+    Example::
+
+        acc = ClineFitAccumulator()
+        for chunk in chunks:
+            acc.add(chunk)
+        C = acc.fit()
+
+    Attributes:
+        count (int): Number of points consumed so far.
+    """
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self._reference = 0j
+        self._sums = np.zeros(len(_POWERS))
+
+    def add(self, points):
+        """Consume a chunk of points.
+
+        Args:
+            points (array_like): Complex points, any shape.
+
+        Returns:
+            ClineFitAccumulator: self, to allow chaining.
+
+        Raises:
+            ValueError: if a point is not finite.
+        """
+        zs = _as_points(points)
+        if len(zs) == 0:
+            return self
+        if self.count == 0:
+            # Power sums about a point near the data keep the fourth powers
+            # from swamping the lower ones
+            self._reference = complex(zs.mean())
+        w = zs - self._reference
+        self._sums += _power_sums(w.real, w.imag)
+        self.count += len(zs)
+        return self
+
+    def merge(self, other):
+        """Add the points consumed by another accumulator.
+
+        Args:
+            other (ClineFitAccumulator): The accumulator to merge in. It is
+                not modified.
+
+        Returns:
+            ClineFitAccumulator: self, to allow chaining.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self._reference = other._reference
+            self._sums = other._sums.copy()
+        else:
+            shift = self._reference - other._reference
+            self._sums += _shift_power_sums(other._sums, shift.real, shift.imag)
+        self.count += other.count
+        return self
+
+    def fit(self):
+        """Return the algebraic (Pratt) fit of all points consumed so far.
+
+        Returns:
+            Cline: The fitted cline, normalized to Δ = 1 with c ≥ 0.
+
+        Raises:
+            ValueError: if fewer than three points were consumed or all points
+                coincide.
+        """
+        if self.count < 3:
+            raise ValueError("At least three points are needed to fit a cline")
+        S = self._sums
+        n = self.count
+        mx, my = S[_INDEX[1, 0]] / n, S[_INDEX[0, 1]] / n
+        # Center on the centroid and scale to unit RMS distance
+        S = _shift_power_sums(S, mx, my)
+        scale = np.sqrt(max(S[_INDEX[2, 0]] + S[_INDEX[0, 2]], 0.0) / n)
+        if scale < 1e-12 * max(1.0, abs(self._reference)):
+            raise ValueError("Points must not all coincide")
+        S = S / np.array([scale ** (i + j) for i, j in _POWERS])
+        theta = _pratt_solve(_moment_matrix(S))
+        return _to_cline(theta, self._reference + complex(mx, my), scale)
+
+    def __repr__(self):
+        return f"ClineFitAccumulator(count={self.count})"
+
+
+def fit_cline(points, refine=False, max_iter=_REFINE_MAX_ITER):
+    """Fit a cline to points in the least-squares sense.
+
+    See :meth:`cline.Cline.fit`.
+    """
+    zs = _as_points(points)
+    fitted = ClineFitAccumulator().add(zs).fit()
+    if not refine:
+        return fitted
+    center = complex(zs.mean())
+    w = zs - center
+    scale = np.sqrt(np.mean(w.real ** 2 + w.imag ** 2))
+    x, y = w.real / scale, w.imag / scale
+    # Express the algebraic fit in the same normalized coordinates
+    c = fitted.c * scale ** 2
+    alpha = (fitted.alpha + fitted.c * np.conj(center)) * scale
+    d = fitted.c * abs(center) ** 2 + 2 * (fitted.alpha * center).real + fitted.d
+    theta = np.array([c, 2 * alpha.real, -2 * alpha.imag, d])
+    theta = theta / np.sqrt(theta @ _PRATT @ theta)
+    theta = _refine(theta, x, y, max_iter=max_iter)
+    return _to_cline(theta, center, scale)
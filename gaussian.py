@@ -0,0 +1,238 @@
+r"""
+Exact Gaussian rationals: complex numbers :math:`p + qi` with rational p and q.
+
+Clines built from integers, :class:`fractions.Fraction` values and
+:class:`GaussianRational` values keep c and d as Fractions and alpha as a
+GaussianRational. Classification, containment, inversion, line intersection
+and orthogonality then reduce to exact integer arithmetic. This is far
+cheaper than sympy, which :class:`cline.Cline` only falls back to when a
+square root is needed (radii, angles, most circle intersection points).
+
+Example::
+
+    from fractions import Fraction
+    from gaussian import GaussianRational
+
+    C = Cline.from_circle(center=GaussianRational(1, 2), radius=Fraction(3, 2))
+    C.invert(GaussianRational(0, 1))   # exact GaussianRational result
+"""
+
+import numbers
+import operator
+import sys
+from fractions import Fraction
+from math import isqrt
+
+
+_ZERO = Fraction(0)
+
+
+class GaussianRational:
+    """An exact complex number with rational real and imaginary parts.
+
+    Instances are immutable and hashable. Arithmetic with ints, Fractions
+    and other GaussianRationals is exact; mixing in a float or complex gives
+    a complex result, as for :class:`fractions.Fraction`. sympy converts
+    GaussianRationals automatically through ``_sympy_``.
+
+    Attributes:
+        real (fractions.Fraction): The real part.
+        imag (fractions.Fraction): The imaginary part.
+    """
+
+    __slots__ = ("real", "imag")
+
+    def __init__(self, real=0, imag=0):
+        """Initialize from the real and imaginary parts.
+
+        Args:
+            real: Anything accepted by :class:`fractions.Fraction`. Defaults to 0.
+            imag: Anything accepted by :class:`fractions.Fraction`. Defaults to 0.
+        """
+        self.real = Fraction(real)
+        self.imag = Fraction(imag)
+
+    @classmethod
+    def _from_fractions(cls, real, imag):
+        # Skips the Fraction conversions of __init__, for internal arithmetic
+        # on values that are already Fractions
+        obj = object.__new__(cls)
+        obj.real = real
+        obj.imag = imag
+        return obj
+
+    def conjugate(self):
+        """Return the complex conjugate."""
+        return GaussianRational._from_fractions(self.real, -self.imag)
+
+    def abs_sq(self):
+        """Return :math:`|z|^2` as a Fraction."""
+        return self.real * self.real + self.imag * self.imag
+
+    def _binary(self, other, exact, fallback):
+        # Exact for rationals, sympy for sympy values, complex for floats
+        w = _as_gaussian(other)
+        if w is not None:
+            return exact(w)
+        if _is_sympy(other):
+            return fallback(self._sympy_(), other)
+        if isinstance(other, numbers.Complex):
+            return fallback(complex(self), other)
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._binary(
+            other,
+            lambda w: GaussianRational._from_fractions(self.real + w.real, self.imag + w.imag),
+            operator.add,
+        )
+
+    def __radd__(self, other):
+        return self._binary(
+            other,
+            lambda w: GaussianRational._from_fractions(w.real + self.real, w.imag + self.imag),
+            lambda z, o: o + z,
+        )
+
+    def __sub__(self, other):
+        return self._binary(
+            other,
+            lambda w: GaussianRational._from_fractions(self.real - w.real, self.imag - w.imag),
+            operator.sub,
+        )
+
+    def __rsub__(self, other):
+        return self._binary(
+            other,
+            lambda w: GaussianRational._from_fractions(w.real - self.real, w.imag - self.imag),
+            lambda z, o: o - z,
+        )
+
+    def __mul__(self, other):
+        return self._binary(other, self._mul, operator.mul)
+
+    def __rmul__(self, other):
+        return self._binary(other, self._mul, lambda z, o: o * z)
+
+    def _mul(self, w):
+        return GaussianRational._from_fractions(
+            self.real * w.real - self.imag * w.imag,
+            self.real * w.imag + self.imag * w.real,
+        )
+
+    def __truediv__(self, other):
+        return self._binary(other, lambda w: self._mul(w._reciprocal()), operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._binary(other, lambda w: w._mul(self._reciprocal()), lambda z, o: o / z)
+
+    def _reciprocal(self):
+        norm = self.abs_sq()
+        if norm == 0:
+            raise ZeroDivisionError("GaussianRational division by zero")
+        return GaussianRational._from_fractions(self.real / norm, -self.imag / norm)
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, numbers.Integral):
+            return complex(self) ** exponent
+        result = GaussianRational(1)
+        base = self if exponent >= 0 else self._reciprocal()
+        for _ in range(abs(int(exponent))):
+            result = result._mul(base)
+        return result
+
+    def __neg__(self):
+        return GaussianRational._from_fractions(-self.real, -self.imag)
+
+    def __pos__(self):
+        return self
+
+    def __bool__(self):
+        return bool(self.real) or bool(self.imag)
+
+    def __eq__(self, other):
+        return self._binary(
+            other, lambda w: self.real == w.real and self.imag == w.imag, operator.eq
+        )
+
+    def __hash__(self):
+        # Agrees with hash(complex) and hash(Fraction) for equal values
+        value = hash(self.real) + sys.hash_info.imag * hash(self.imag)
+        value %= sys.hash_info.modulus if value >= 0 else -sys.hash_info.modulus
+        return -2 if value == -1 else value
+
+    def __complex__(self):
+        return complex(float(self.real), float(self.imag))
+
+    def __float__(self):
+        if self.imag:
+            raise TypeError("can't convert a GaussianRational with nonzero imaginary part to float")
+        return float(self.real)
+
+    def _sympy_(self):
+        import sympy
+
+        return sympy.Rational(self.real.numerator, self.real.denominator) + sympy.I * sympy.Rational(
+            self.imag.numerator, self.imag.denominator
+        )
+
+    def __repr__(self):
+        return f"GaussianRational({str(self.real)!r}, {str(self.imag)!r})"
+
+    def __str__(self):
+        if not self.imag:
+            return str(self.real)
+        if not self.real:
+            return f"{self.imag}i"
+        sign = "-" if self.imag < 0 else "+"
+        return f"({self.real}{sign}{abs(self.imag)}i)"
+
+
+def _is_sympy(x):
+    module = sys.modules.get("sympy")
+    return module is not None and isinstance(x, module.Basic)
+
+
+def _as_gaussian(x):
+    """Return x as a GaussianRational, or None if it is not an exact rational value."""
+    if isinstance(x, GaussianRational):
+        return x
+    if isinstance(x, Fraction):
+        return GaussianRational._from_fractions(x, _ZERO)
+    if isinstance(x, numbers.Rational):
+        return GaussianRational(x)
+    return None
+
+
+def _is_gaussian_input(*values):
+    """Check if values select the Gaussian-rational mode of Cline.
+
+    At least one value must be a Fraction or GaussianRational and all of them
+    must be exact rationals (ints included). Plain ints alone keep the
+    numeric mode.
+    """
+    return any(isinstance(x, (Fraction, GaussianRational)) for x in values) and all(
+        _as_gaussian(x) is not None for x in values
+    )
+
+
+def _as_real_fraction(x):
+    """Return an exact real value as a Fraction.
+
+    Raises:
+        ValueError: if x is a GaussianRational with nonzero imaginary part.
+    """
+    if isinstance(x, GaussianRational):
+        if x.imag:
+            raise ValueError(f"Expected a real value, got {x}")
+        return x.real
+    return Fraction(x)
+
+
+def _fraction_sqrt(q):
+    """Return the square root of a nonnegative Fraction if it is rational, else None."""
+    num, den = q.numerator, q.denominator
+    root_num, root_den = isqrt(num), isqrt(den)
+    if root_num * root_num == num and root_den * root_den == den:
+        return Fraction(root_num, root_den)
+    return None
@@ -0,0 +1,258 @@
+r"""
+Normalized inversive products of clines.
+
+For two clines with Hermitian matrices :math:`H_1, H_2` the inversive product is
+
+.. math::
+
+   B_{12} = \text{tr}(H_1\,\text{adj}(H_2)) = c_1 d_2 + c_2 d_1 - 2\text{Re}(\alpha_1\bar\alpha_2)
+
+(the bilinear form behind :meth:`cline.Cline.is_orthogonal`). Dividing by
+:math:`2\sqrt{\Delta_1\Delta_2}` and fixing the sign so that both clines have
+:math:`c \geq 0` gives the normalized product
+
+.. math::
+
+   G_{12} = \frac{\sigma_1\sigma_2 B_{12}}{2\sqrt{\Delta_1\Delta_2}}, \qquad \sigma = \text{sign}(c)
+
+which is invariant under Möbius transformations. For two circles with centers
+:math:`z_1, z_2` and radii :math:`r_1, r_2`,
+:math:`G_{12} = \frac{|z_1 - z_2|^2 - r_1^2 - r_2^2}{2 r_1 r_2} = \cos\theta`,
+so one number classifies the pair without any intersection points:
+
+- :math:`|G| < 1`: the clines cross at angle :math:`\arccos G`
+- :math:`G = 0`: orthogonal
+- :math:`G = +1`: externally tangent, :math:`G = -1`: internally tangent
+- :math:`|G| > 1`: disjoint
+
+A line has no preferred side, so only :math:`|G|` is meaningful for pairs
+involving a line.
+
+Writing each cline as the row :math:`x = (c, d, \text{Re}\,\alpha, \text{Im}\,\alpha)`
+scaled by :math:`\sigma/\sqrt{2\Delta}`, the whole matrix is :math:`G = X Q X^T`
+with :math:`Q = \begin{pmatrix} 0 & 1 \\ 1 & 0 \end{pmatrix} \oplus (-2 I_2)`,
+a single matrix product handled by BLAS.
+
+Reference:
+    Hitchman, *GCT*, Section 5.1; the inversive product of circles is also
+    known as the inversive distance (Coxeter).
+"""
+
+import numpy as np
+
+from cline_array import ClineArray
+
+# Default tolerance on G. G is a ratio of quantities of size |center|^2 / radius,
+# so it carries more rounding error than the raw coefficients.
+_G_TOL = 1e-8
+
+# Default number of matrix entries computed per block by contact_pairs
+_GRAM_BLOCK_SIZE = 1 << 22
+
+_CONTACT_KINDS = ("tangent", "orthogonal", "crossing", "intersecting")
+
+
+def _as_cline_array(clines):
+    if isinstance(clines, ClineArray):
+        return clines
+    return ClineArray.from_clines(clines)
+
+
+def _scene_origin(*arrays):
+    """Return the mean center of all circles in the given ClineArrays (0 if none)."""
+    centers = np.concatenate([A.center[A.is_circle] for A in arrays])
+    return complex(centers.mean()) if len(centers) else 0j
+
+
+def _inversive_coordinates(A, origin=0j):
+    """Return the normalized rows X and X·Q for a ClineArray, shape (N, 4) each.
+
+    The coefficients are first rewritten in the coordinate w = z - origin,
+    which leaves G unchanged but keeps the entries of X small when the scene
+    is far from 0. Points and invalid clines get NaN rows.
+    """
+    valid = A.is_circle | A.is_line
+    sign = np.where(A.c < -1e-10, -1.0, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(valid, sign / np.sqrt(2 * A.discriminant), np.nan)
+    X = np.empty((len(A), 4))
+    X[:, 0] = A.c
+    X[:, 1] = A.evaluate(np.full(len(A), origin))
+    alpha = A.alpha + A.c * np.conj(origin)
+    X[:, 2] = alpha.real
+    X[:, 3] = alpha.imag
+    X *= scale[:, None]
+    XQ = np.empty_like(X)
+    XQ[:, 0] = X[:, 1]
+    XQ[:, 1] = X[:, 0]
+    XQ[:, 2:] = -2 * X[:, 2:]
+    return X, XQ
+
+
+def inversive_gram(clines, others=None):
+    """Return the matrix of normalized inversive products.
+
+    Args:
+        clines (ClineArray or iterable of Cline): N clines.
+        others (ClineArray or iterable of Cline, optional): M clines to pair
+            with. Defaults to clines itself, giving the symmetric Gram matrix.
+
+    Returns:
+        numpy.ndarray: Float array of shape (N, M) with entry (i, j) equal to
+        :math:`G_{ij}`. Rows and columns of points and invalid clines are NaN.
+        The diagonal of the Gram matrix is -1.
+    """
+    A = _as_cline_array(clines)
+    if others is None:
+        X, XQ = _inversive_coordinates(A, _scene_origin(A))
+        return X @ XQ.T
+    B = _as_cline_array(others)
+    origin = _scene_origin(A, B)
+    X, _ = _inversive_coordinates(A, origin)
+    _, XQ = _inversive_coordinates(B, origin)
+    return X @ XQ.T
+
+
+def _pair_products(A, ii, jj):
+    r"""Return :math:`G_{ij}` for the pairs (ii, jj) of a ClineArray.
+
+    Uses the geometric forms of G, which avoid the cancellation of the
+    coefficient form for small circles far from the origin: the center
+    formula for two circles, the signed distance from the center over the
+    radius for a circle and a line, and the cosine between normals for two
+    lines.
+    """
+    circle_i, circle_j = A.is_circle[ii], A.is_circle[jj]
+    center_i, center_j = A.center[ii], A.center[jj]
+    radius_i, radius_j = A.radius[ii], A.radius[jj]
+    alpha_i, alpha_j = A.alpha[ii], A.alpha[jj]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        both = (np.abs(center_i - center_j) ** 2 - radius_i ** 2 - radius_j ** 2) / (
+            2 * radius_i * radius_j
+        )
+        center = np.where(circle_i, center_i, center_j)
+        radius = np.where(circle_i, radius_i, radius_j)
+        line_alpha = np.where(circle_i, alpha_j, alpha_i)
+        line_d = np.where(circle_i, A.d[jj], A.d[ii])
+        mixed = (2 * (line_alpha * center).real + line_d) / (2 * np.abs(line_alpha) * radius)
+        lines = -(alpha_i * np.conj(alpha_j)).real / (np.abs(alpha_i) * np.abs(alpha_j))
+    return np.where(circle_i & circle_j, both, np.where(circle_i | circle_j, mixed, lines))
+
+
+def tangency_mask(G, tol=_G_TOL):
+    """Boolean mask of tangent pairs, :math:`||G| - 1| \\leq` tol.
+
+    Coincident clines also have :math:`|G| = 1`.
+    """
+    return np.abs(np.abs(G) - 1) <= tol
+
+
+def orthogonality_mask(G, tol=_G_TOL):
+    """Boolean mask of orthogonal pairs, :math:`|G| \\leq` tol."""
+    return np.abs(G) <= tol
+
+
+def crossing_mask(G, tol=_G_TOL):
+    """Boolean mask of pairs meeting transversally in two points, :math:`|G| < 1 -` tol."""
+    return np.abs(G) < 1 - tol
+
+
+def angle_matrix(clines, others=None, tol=_G_TOL):
+    """Return the crossing angles of all pairs of clines.
+
+    Follows :meth:`cline.Cline.angle`: :math:`\\arccos G` for two circles
+    and the acute angle :math:`\\arccos |G|` when a line is involved.
+
+    Args:
+        clines (ClineArray or iterable of Cline): N clines.
+        others (ClineArray or iterable of Cline, optional): M clines to pair
+            with. Defaults to clines itself.
+        tol (float, optional): Tolerance on |G| - 1 for counting tangent pairs
+            as meeting (at angle 0 or pi).
+
+    Returns:
+        numpy.ndarray: Angles in radians, shape (N, M). NaN for disjoint
+        pairs and for pairs involving points or invalid clines.
+    """
+    A = _as_cline_array(clines)
+    B = A if others is None else _as_cline_array(others)
+    G = inversive_gram(A, B)
+    G = np.where(A.is_line[:, None] | B.is_line[None, :], np.abs(G), G)
+    with np.errstate(invalid="ignore"):
+        angles = np.arccos(np.clip(G, -1, 1))
+        angles[~(np.abs(G) <= 1 + tol)] = np.nan
+    return angles
+
+
+def contact_pairs(clines, kind="tangent", tol=_G_TOL, index=None, block_size=_GRAM_BLOCK_SIZE):
+    """Return the pairs of clines in a given contact relation.
+
+    By default a :class:`spatial.ClineIndex` first discards pairs whose
+    bounding boxes are apart (they cannot touch), and G is evaluated only on
+    the remaining pairs, from centers and radii. This keeps contact graphs of
+    large sparse packings cheap and accurate. With ``index=False`` the Gram
+    matrix is computed densely in row blocks of about ``block_size`` entries
+    instead.
+
+    Args:
+        clines (ClineArray or iterable of Cline): The clines.
+        kind (str, optional): One of "tangent", "orthogonal", "crossing"
+            (two intersection points) or "intersecting" (crossing or
+            tangent). Defaults to "tangent".
+        tol (float, optional): Tolerance on G. Defaults to 1e-8.
+        index (spatial.ClineIndex or bool, optional): A prebuilt index over
+            clines, or False for the dense computation. Defaults to building
+            an index.
+        block_size (int, optional): Matrix entries per block in the dense
+            computation.
+
+    Returns:
+        tuple of numpy.ndarray: (ii, jj, g) with ii < jj sorted
+        lexicographically and g the normalized inversive products.
+
+    Raises:
+        ValueError: if kind is unknown or index was built for other clines.
+    """
+    if kind not in _CONTACT_KINDS:
+        raise ValueError(f"kind must be one of {_CONTACT_KINDS}, got {kind!r}")
+    A = _as_cline_array(clines)
+
+    if index is False:
+        X, XQ = _inversive_coordinates(A, _scene_origin(A))
+        chunks = []
+        rows_per_block = max(1, block_size // max(len(A), 1))
+        for start in range(0, len(A), rows_per_block):
+            G = X[start:start + rows_per_block] @ XQ.T
+            G[np.tril_indices(G.shape[0], k=start, m=G.shape[1])] = np.nan
+            mask = _contact_mask(G, kind, tol)
+            ii, jj = np.nonzero(mask)
+            chunks.append((ii + start, jj, G[ii, jj]))
+    else:
+        from spatial import ClineIndex
+
+        if index is None or index is True:
+            index = ClineIndex(A, slack=tol)
+        elif index.clines is not A:
+            raise ValueError("index was built for a different ClineArray")
+        chunks = []
+        for ii, jj in index.iter_candidate_pairs(block_size):
+            g = _pair_products(A, ii, jj)
+            mask = _contact_mask(g, kind, tol)
+            chunks.append((ii[mask], jj[mask], g[mask]))
+
+    if not chunks:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)
+    ii, jj, g = (np.concatenate(parts) for parts in zip(*chunks))
+    order = np.lexsort((jj, ii))
+    return ii[order].astype(np.intp), jj[order].astype(np.intp), g[order]
+
+
+def _contact_mask(G, kind, tol):
+    with np.errstate(invalid="ignore"):
+        if kind == "tangent":
+            return tangency_mask(G, tol)
+        if kind == "orthogonal":
+            return orthogonality_mask(G, tol)
+        if kind == "crossing":
+            return crossing_mask(G, tol)
+        return np.abs(G) <= 1 + tol
@@ -0,0 +1,298 @@
+r"""
+Limit sets of Schottky groups and of groups generated by cline inversions.
+
+A group is given by its generators. Each generator contributes one or two
+letters, and every letter g comes with a disk :math:`D_g` (a cline). Applying
+g maps everything outside the disk of its inverse letter into :math:`D_g`:
+
+- an inversion in a cline C is its own inverse, with :math:`D_g = C`
+- a Schottky pair of circles :math:`(C_a, C_A)` gives the map
+  :math:`a(z) = Q + rs/(z - P)`, which sends :math:`C_a` (center P, radius
+  r) onto :math:`C_A` (center Q, radius s) and the outside of :math:`C_a`
+  into :math:`C_A`. Its letters are a with :math:`D_a = C_A` and
+  :math:`a^{-1}` with :math:`D_{a^{-1}} = C_a`
+- a Möbius matrix :math:`g = [[a, b], [c, d]]` with c ≠ 0 uses its isometric
+  circles. With det g = 1, g sends :math:`|cz + d| = 1` onto
+  :math:`|cz - a| = 1`, which are then :math:`D_{g^{-1}}` and :math:`D_g`
+
+A reduced word :math:`w = g_1 g_2 \cdots g_n` never has a letter next to its
+inverse. If the disks are disjoint, the disks
+:math:`g_1 \cdots g_{n-1}(D_{g_n})` are nested and shrink onto the limit set
+as n grows.
+
+:func:`limit_set` walks the tree of reduced words depth first. Every node
+stores the matrix of its word, so a child costs one 2×2 product with the
+matrix of its last letter and one congruence for its disk. Prefixes are
+never recomputed. Nodes are processed in blocks of up to ``chunk_size``,
+and the stack holds at most one block per letter and level. Memory is
+therefore proportional to the depth of the search, not to the size of the
+output.
+
+Reference:
+    D. Mumford, C. Series, D. Wright, *Indra's Pearls*, Chapters 4 and 6.
+"""
+
+import numpy as np
+
+from cline import Cline
+from cline_array import ClineArray
+from mobius import MoebiusTransformation, _congruence
+
+# Default maximum number of tree nodes processed per block (and clines per chunk)
+_LIMIT_SET_CHUNK_SIZE = 1 << 14
+
+_OUTPUTS = ("clines", "points")
+
+
+def _cline_coefficients(C):
+    return float(C.c), complex(C.alpha), float(C.d)
+
+
+def _circle_coefficients(center, radius):
+    """Coefficients (1, -conj(center), |center|^2 - radius^2) of a circle."""
+    return 1.0, -np.conj(center), abs(center) ** 2 - radius ** 2
+
+
+def _pairing_matrix(C_a, C_A):
+    r"""Matrix of :math:`z \mapsto Q + rs/(z - P)`, which maps C_a onto C_A.
+
+    Raises:
+        ValueError: if C_a or C_A is not a circle.
+    """
+    if not (C_a.is_circle and C_A.is_circle):
+        raise ValueError("A Schottky pair must consist of two circles")
+    P, r = complex(C_a.center), float(C_a.radius)
+    Q, s = complex(C_A.center), float(C_A.radius)
+    return np.array([[Q, r * s - P * Q], [1, -P]], dtype=complex)
+
+
+def _letters(generators):
+    """Expand the generators into letters.
+
+    Returns:
+        tuple: ``(matrices, anti, inverse, sources)``. matrices has shape
+        (K, 2, 2) and anti (K,) flags the orientation-reversing letters.
+        inverse[g] is the index of the inverse letter. sources has shape
+        (K, 3) and holds the coefficients (c, alpha, d) of the disk of the
+        inverse letter, which g maps onto its own disk.
+    """
+    matrices, anti, inverse, sources = [], [], [], []
+
+    def add(G, is_anti, source, inverse_offset):
+        k = len(matrices)
+        matrices.append(G)
+        anti.append(is_anti)
+        inverse.append(k + inverse_offset)
+        sources.append(source)
+
+    for generator in generators:
+        if isinstance(generator, Cline):
+            if not (generator.is_circle or generator.is_line):
+                raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+            c, alpha, d = _cline_coefficients(generator)
+            add(np.array([[-np.conj(alpha), -d], [c, alpha]]), True, (c, alpha, d), 0)
+        elif isinstance(generator, (tuple, list)) and len(generator) == 2 and all(
+            isinstance(C, Cline) for C in generator
+        ):
+            C_a, C_A = generator
+            G = _pairing_matrix(C_a, C_A)
+            add(G, False, _cline_coefficients(C_a), 1)
+            add(np.linalg.inv(G), False, _cline_coefficients(C_A), -1)
+        else:
+            if isinstance(generator, MoebiusTransformation):
+                generator = generator.matrix
+            G = np.array(generator, dtype=complex)
+            if G.shape != (2, 2):
+                raise ValueError(f"A generator matrix must have shape (2, 2), got {G.shape}")
+            det = np.linalg.det(G)
+            if abs(det) < 1e-10:
+                raise ValueError("Degenerate transformation: ad - bc = 0")
+            G = G / np.sqrt(det)
+            (a, _), (c, d) = G
+            if abs(c) < 1e-10:
+                raise ValueError("A generator matrix fixing ∞ (c = 0) has no isometric circle")
+            radius = 1 / abs(c)
+            add(G, False, _circle_coefficients(-d / c, radius), 1)
+            add(np.linalg.inv(G), False, _circle_coefficients(a / c, radius), -1)
+
+    if not matrices:
+        raise ValueError("At least one generator is required")
+    return (
+        np.array(matrices, dtype=complex),
+        np.array(anti, dtype=bool),
+        np.array(inverse, dtype=np.intp),
+        np.array(sources, dtype=complex),
+    )
+
+
+def _images(M, det, anti, source):
+    r"""Images of one cline under maps :math:`z \mapsto M z` or :math:`M \bar z`.
+
+    The images are scaled to Δ = 1 with c >= 0, so that a circle has
+    c = 1/r. The congruence multiplies Δ by :math:`|\det M|^2`. That factor
+    is taken from det, which is tracked through the products, because
+    computing Δ from the tiny coefficients of a deep image cancels
+    catastrophically.
+    """
+    c, alpha, d = source.real[0], source[1], source.real[2]
+    alpha = np.where(anti, np.conj(alpha), alpha)
+    a, b, cc, dd = M[:, 0, 0], M[:, 0, 1], M[:, 1, 0], M[:, 1, 1]
+    c_new, alpha_new, d_new = _congruence(dd, -b, -cc, a, c, alpha, d)
+    root_discriminant = np.sqrt(abs(alpha) ** 2 - c * d)
+    scale = np.where(c_new < 0, -1, 1) / (np.abs(det) * root_discriminant)
+    return c_new * scale, alpha_new * scale, d_new * scale
+
+
+def limit_set(
+    generators, min_radius, max_depth=64, output="points", chunk_size=_LIMIT_SET_CHUNK_SIZE
+):
+    """Generate the limit set of a group by depth-first search over reduced words.
+
+    A word stops growing once its disk has a radius below min_radius or it
+    reaches max_depth letters. The disk, or its center, is then yielded.
+    Words are visited depth first, in blocks of up to chunk_size words, so
+    the output order is deterministic.
+
+    Args:
+        generators (iterable): The group generators. Each one is a Cline to
+            invert in, a pair (C_a, C_A) of circles forming a Schottky pair,
+            or a MoebiusTransformation or 2×2 array_like whose isometric
+            circles are used as its disks.
+        min_radius (float): Stop refining disks smaller than this.
+        max_depth (int, optional): Maximum word length. Defaults to 64.
+        output (str, optional): ``"points"`` yields the centers of the final
+            disks as complex arrays, ``"clines"`` yields the disks as
+            ClineArray chunks. Defaults to ``"points"``.
+        chunk_size (int, optional): Maximum number of words processed per
+            block, and of disks or points per chunk.
+
+    Yields:
+        numpy.ndarray or ClineArray: Successive chunks of limit points or
+        final disks.
+
+    Raises:
+        ValueError: if a generator is invalid, min_radius is not positive,
+            max_depth is less than 1, or output is unknown.
+
+    The disks shrink onto the limit set only if they are pairwise disjoint
+    (a Schottky group, or inversions in disjoint circles). Otherwise the
+    search is still bounded by max_depth, but the result is not a limit set.
+    Memory use is about chunk_size words per letter and level of the search.
+    """
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS}, got {output!r}")
+    if not min_radius > 0:
+        raise ValueError(f"min_radius must be positive, got {min_radius}")
+    if max_depth < 1:
+        raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+    alphabet = _alphabet(generators)
+    pending = []
+    pending_count = 0
+    for c, alpha, d in _search([_root_block(alphabet)], alphabet, min_radius, max_depth, chunk_size):
+        final = _output(c, alpha, d, output)
+        pending.append(final)
+        pending_count += len(final)
+        if pending_count >= chunk_size:
+            yield from _flush(pending, output, chunk_size)
+            pending_count = sum(len(chunk) for chunk in pending)
+
+    if pending:
+        yield from _flush(pending, output, chunk_size, final=True)
+
+
+def _alphabet(generators):
+    """The letters of :func:`_letters` with their conjugates and determinants.
+
+    Returns:
+        tuple: ``(matrices, conj_matrices, dets, anti, inverse, sources)``.
+    """
+    matrices, anti, inverse, sources = _letters(generators)
+    return matrices, np.conj(matrices), np.linalg.det(matrices), anti, inverse, sources
+
+
+def _root_block(alphabet):
+    """The block of all one-letter words: (matrices, dets, anti flags, last letters, depth)."""
+    matrices, _, dets, anti, _, _ = alphabet
+    return matrices, dets, anti, np.arange(len(matrices)), 1
+
+
+def _disks(alphabet, M, det, is_anti, last):
+    """Coefficients (c, alpha, d) of the disks of a block of words."""
+    sources = alphabet[5]
+    c = np.empty(len(M))
+    alpha = np.empty(len(M), dtype=complex)
+    d = np.empty(len(M))
+    for g in range(len(sources)):
+        rows = last == g
+        c[rows], alpha[rows], d[rows] = _images(M[rows], det[rows], is_anti[rows], sources[g])
+    return c, alpha, d
+
+
+def _extend(alphabet, M, det, is_anti, last):
+    """Extend every word of a block by each letter that is not its last letter's inverse.
+
+    Returns:
+        tuple: ``(matrices, dets, anti flags, last letters)`` of the children,
+        grouped by the appended letter.
+    """
+    matrices, conj_matrices, letter_dets, anti, inverse, _ = alphabet
+    children = []
+    for g in range(len(matrices)):
+        rows = inverse[last] != g
+        parent_anti = is_anti[rows]
+        G = np.where(parent_anti[:, None, None], conj_matrices[g], matrices[g])
+        G_det = np.where(parent_anti, np.conj(letter_dets[g]), letter_dets[g])
+        child = M[rows] @ G
+        norm = np.linalg.norm(child, axis=(1, 2))
+        child /= norm[:, None, None]
+        child_det = det[rows] * G_det / norm ** 2
+        children.append((child, child_det, parent_anti ^ anti[g], np.full(len(child), g)))
+    return tuple(np.concatenate(parts) for parts in zip(*children))
+
+
+def _search(stack, alphabet, min_radius, max_depth, chunk_size):
+    """Depth-first search from the blocks on the stack, the last one first.
+
+    Each stack entry is a block of words: (matrices, their determinants,
+    anti flags, last letters, depth). The stack is consumed.
+
+    Yields:
+        tuple: ``(c, alpha, d)`` of the finished words of each block that
+        has any, in search order.
+    """
+    while stack:
+        M, det, is_anti, last, depth = stack.pop()
+        c, alpha, d = _disks(alphabet, M, det, is_anti, last)
+        done = (c > 1 / min_radius) | (depth >= max_depth)
+        if done.any():
+            yield c[done], alpha[done], d[done]
+
+        keep = ~done
+        if not keep.any():
+            continue
+        M, det, is_anti, last = _extend(alphabet, M[keep], det[keep], is_anti[keep], last[keep])
+        # Push blocks in reverse so that the first block is processed next
+        for start in reversed(range(0, len(M), chunk_size)):
+            block = slice(start, start + chunk_size)
+            stack.append((M[block], det[block], is_anti[block], last[block], depth + 1))
+
+
+def _output(c, alpha, d, output):
+    """Final disks as limit points (their centers) or as a ClineArray."""
+    if output == "points":
+        return -np.conj(alpha) / c
+    return ClineArray(c, alpha, d)
+
+
+def _flush(pending, output, chunk_size, final=False):
+    """Yield full chunks from the pending list, keeping the remainder in it."""
+    if output == "points":
+        merged = np.concatenate(pending)
+    else:
+        merged = ClineArray.concatenate(pending)
+    count = len(merged) if final else len(merged) - len(merged) % chunk_size
+    for start in range(0, count, chunk_size):
+        yield merged[start:start + chunk_size]
+    pending.clear()
+    if count < len(merged):
+        pending.append(merged[count:])
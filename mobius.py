@@ -0,0 +1,638 @@
+r"""
+Möbius transformations of the extended complex plane.
+
+A Möbius transformation is a map
+
+.. math::
+
+   T(z) = \frac{az + b}{cz + d}, \qquad ad - bc \neq 0
+
+represented by the matrix :math:`A = \begin{pmatrix} a & b \\ c & d \end{pmatrix}`.
+It sends :math:`-d/c` to :math:`\infty` and :math:`\infty` to :math:`a/c`
+(or fixes :math:`\infty` when c = 0), and maps clines to clines through the
+Hermitian congruence :math:`H \mapsto (A^{-1})^\dagger H A^{-1}`.
+
+As in :mod:`cline`, sympy coefficients give exact arithmetic and numbers give
+numeric arithmetic with tolerance 1e-10. Scalar points use ``sympy.zoo`` for
+:math:`\infty`. Point arrays use NaN, as in :meth:`cline.Cline.invert_points`.
+
+Reference:
+    Hitchman, *GCT*, Sections 3.4 and 3.5.
+    https://mphitchman.com/geometry/section3-4.html
+"""
+
+import numpy as np
+
+from cline import (
+    _BLOCK_SIZE, Cline, _abs_sq, _conjugate, _is_infinity, _is_sympy, _real, _simplify, sympy,
+)
+from cline_array import ClineArray
+
+
+def _moebius_points(a, b, c, d, zs, out=None):
+    r"""Evaluate :math:`(az + b)/(cz + d)` over an array of points.
+
+    NaN stands for :math:`\infty` in zs and in the result. The work is done
+    in blocks of ``_BLOCK_SIZE`` points with one block-sized scratch buffer,
+    so the passes over each block stay in cache.
+    """
+    zs = np.asarray(zs, dtype=complex)
+    if out is None:
+        out = np.empty(zs.shape, dtype=complex)
+    elif out.shape != zs.shape or out.dtype != np.complex128 or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous complex128 array of shape {zs.shape}")
+
+    z_flat = zs.reshape(-1)
+    out_flat = out.reshape(-1)
+    n = z_flat.size
+    scratch = np.empty(min(_BLOCK_SIZE, n), dtype=complex)
+    finite = np.empty(min(_BLOCK_SIZE, n), dtype=bool)
+    image_of_infinity = a / c if c != 0 else np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for start in range(0, n, _BLOCK_SIZE):
+            z = z_flat[start:start + _BLOCK_SIZE]
+            o = out_flat[start:start + _BLOCK_SIZE]
+            if c == 0:
+                np.multiply(z, a / d, out=o)
+                o += b / d
+            else:
+                t = scratch[:len(o)]
+                np.multiply(z, a, out=o)
+                o += b
+                np.multiply(z, c, out=t)
+                t += d
+                o /= t
+
+            # Non-finite results come from ∞ (NaN or inf) on input, or from
+            # the pole -d/c, which maps to ∞
+            f = finite[:len(o)]
+            np.isfinite(o, out=f)
+            if not f.all():
+                bad = ~f
+                o[bad] = np.where(np.isfinite(z[bad]), np.nan, image_of_infinity)
+    return out
+
+
+def _moebius_point(a, b, c, d, z):
+    """Evaluate (az + b)/(cz + d) at one numeric point, with sympy.zoo as ∞."""
+    if _is_infinity(z):
+        if abs(c) < 1e-10:
+            return sympy.zoo
+        return a / c
+    z = complex(z)
+    den = c * z + d
+    if abs(den) < 1e-15:
+        return sympy.zoo
+    return (a * z + b) / den
+
+
+def _congruence(p, q, r, s, c, alpha, d):
+    r"""Return the coefficients of :math:`B^\dagger H B` for B = [[p, q], [r, s]].
+
+    Works elementwise on numbers, sympy expressions and broadcastable arrays.
+    """
+    alpha_conj = _conjugate(alpha)
+    c_new = c * _abs_sq(p) + 2 * _real(alpha_conj * _conjugate(p) * r) + d * _abs_sq(r)
+    alpha_new = _conjugate(q) * (c * p + alpha_conj * r) + _conjugate(s) * (alpha * p + d * r)
+    d_new = c * _abs_sq(q) + 2 * _real(alpha_conj * _conjugate(q) * s) + d * _abs_sq(s)
+    return c_new, alpha_new, d_new
+
+
+def _format_coefficient(z, precision=4):
+    """Format a coefficient for display, like Cline does for its parameters."""
+    if _is_sympy(z):
+        return f"({z})"
+    z = complex(z)
+    real, imag = round(z.real, precision), round(z.imag, precision)
+    real = int(real) if real == int(real) else real
+    imag = int(imag) if imag == int(imag) else imag
+    if imag == 0:
+        return f"{real}"
+    if real == 0:
+        return f"{imag}j"
+    return f"({real}{'+' if imag > 0 else ''}{imag}j)"
+
+
+class MoebiusTransformation:
+    r"""A Möbius transformation :math:`T(z) = (az + b)/(cz + d)`.
+
+    Attributes:
+        a, b, c, d: The matrix entries (complex or sympy expressions).
+
+    Reference:
+        Hitchman, *GCT*, Section 3.4
+        https://mphitchman.com/geometry/section3-4.html
+    """
+
+    def __init__(self, a, b, c, d):
+        """Initialize from coefficients.
+
+        Args:
+            a, b, c, d: complex numbers or sympy expressions with ad - bc ≠ 0.
+
+        Raises:
+            ValueError: if ad - bc = 0 (within 1e-10 in numeric mode).
+        """
+        self._is_exact = any(_is_sympy(x) for x in (a, b, c, d))
+        if self._is_exact:
+            self.a, self.b, self.c, self.d = (sympy.sympify(x) for x in (a, b, c, d))
+            if _simplify(self.det) == 0:
+                raise ValueError("Degenerate transformation: ad - bc = 0")
+        else:
+            self.a, self.b, self.c, self.d = (complex(x) for x in (a, b, c, d))
+            if abs(self.det) < 1e-10:
+                raise ValueError("Degenerate transformation: ad - bc = 0")
+
+    @property
+    def matrix(self):
+        """Return the 2×2 matrix [[a, b], [c, d]].
+
+        Returns:
+            numpy.ndarray (numeric mode) or sympy.Matrix (exact mode).
+        """
+        if self._is_exact:
+            return sympy.Matrix([[self.a, self.b], [self.c, self.d]])
+        return np.array([[self.a, self.b], [self.c, self.d]])
+
+    @property
+    def det(self):
+        """Return ad - bc."""
+        return self.a * self.d - self.b * self.c
+
+    @property
+    def trace(self):
+        """Return tr(A) = a + d (defined up to sign and scale, see classification)."""
+        return self.a + self.d
+
+    def __call__(self, z, out=None):
+        r"""Apply T to a point or to an array of points.
+
+        Scalars follow the conventions of :meth:`cline.Cline.invert`:
+        ``sympy.zoo`` is :math:`\infty`, :math:`T(-d/c) = \infty`, and
+        :math:`T(\infty) = a/c` (or :math:`\infty` when c = 0).
+
+        A tuple is a single point (real, imag), as in
+        :meth:`cline.Cline.from_three_points`. NumPy arrays and lists are
+        evaluated in floating point in one vectorized pass, with NaN standing for :math:`\infty` on input and
+        output. There are no per-point Python objects.
+
+        Args:
+            z: complex number, tuple (real, imag), sympy expression,
+                ``sympy.zoo``, or array or list of complex points.
+            out (numpy.ndarray, optional): C-contiguous complex128 array of the
+                same shape as z to write array results into.
+
+        Returns:
+            The image point (complex, sympy expression or ``sympy.zoo``), or a
+            complex numpy.ndarray of the same shape as z.
+
+        Reference:
+            Hitchman, *GCT*, Section 3.3, Definition of Möbius transformation
+        """
+        if isinstance(z, (np.ndarray, list)):
+            return _moebius_points(
+                complex(self.a), complex(self.b), complex(self.c), complex(self.d), z, out
+            )
+        if isinstance(z, tuple):
+            if self._is_exact or any(_is_sympy(x) for x in z):
+                z = sympy.sympify(z[0]) + sympy.I * sympy.sympify(z[1])
+            else:
+                z = complex(z[0], z[1])
+
+        if self._is_exact or _is_sympy(z):
+            if _is_infinity(z):
+                if _simplify(self.c) == 0:
+                    return sympy.zoo
+                return _simplify(self.a / self.c)
+            z = sympy.sympify(z)
+            den = _simplify(self.c * z + self.d)
+            if den == 0:
+                return sympy.zoo
+            return _simplify((self.a * z + self.b) / den)
+
+        return _moebius_point(self.a, self.b, self.c, self.d, z)
+
+    def transform_cline(self, cline):
+        r"""Return the image of a Cline under this transformation.
+
+        Uses the Hermitian congruence :math:`H' = B^\dagger H B` with
+        :math:`B = \text{adj}(A) = \begin{pmatrix} d & -b \\ -c & a \end{pmatrix}`,
+        a positive multiple of :math:`A^{-1}`, so it describes the same cline.
+        With :math:`B = \begin{pmatrix} p & q \\ r & s \end{pmatrix}`, the entries are
+
+        .. math::
+
+            c' &= c|p|^2 + 2\text{Re}(\bar\alpha\bar p r) + d|r|^2 \\
+            \alpha' &= \bar q (c p + \bar\alpha r) + \bar s (\alpha p + d r) \\
+            d' &= c|q|^2 + 2\text{Re}(\bar\alpha\bar q s) + d|s|^2
+
+        Args:
+            cline (Cline): The cline to transform.
+
+        Returns:
+            Cline: The image cline.
+
+        Reference:
+            Hitchman, *GCT*, Theorem 3.4.8 (Möbius transformations map
+            clines to clines)
+        """
+        c_new, alpha_new, d_new = _congruence(
+            self.d, -self.b, -self.c, self.a, cline.c, cline.alpha, cline.d
+        )
+        if any(_is_sympy(x) for x in (c_new, alpha_new, d_new)):
+            c_new, alpha_new, d_new = (_simplify(x) for x in (c_new, alpha_new, d_new))
+        else:
+            c_new, d_new = float(np.real(c_new)), float(np.real(d_new))
+        return Cline(c=c_new, alpha=alpha_new, d=d_new)
+
+    def compose(self, other):
+        """Return the composition self ∘ other.
+
+        :math:`(T_1 \\circ T_2)(z) = T_1(T_2(z))`, with matrix :math:`A_1 A_2`.
+
+        Args:
+            other (MoebiusTransformation): The transformation applied first.
+
+        Returns:
+            MoebiusTransformation: The composition.
+        """
+        return MoebiusTransformation(
+            self.a * other.a + self.b * other.c,
+            self.a * other.b + self.b * other.d,
+            self.c * other.a + self.d * other.c,
+            self.c * other.b + self.d * other.d,
+        )
+
+    def inverse(self):
+        """Return the inverse transformation, with matrix [[d, -b], [-c, a]]."""
+        return MoebiusTransformation(self.d, -self.b, -self.c, self.a)
+
+    @staticmethod
+    def _to_standard(z1, z2, z3):
+        """Coefficients of the map sending (z1, z2, z3) to (1, 0, ∞).
+
+        This is the cross-ratio :math:`(z, z_1; z_2, z_3)` as a function of z,
+        with the factors containing an infinite point cancelled.
+        """
+        if _is_infinity(z1):
+            return 1, -z2, 1, -z3
+        if _is_infinity(z2):
+            return 0, z1 - z3, 1, -z3
+        if _is_infinity(z3):
+            return 1, -z2, 0, z1 - z2
+        return z1 - z3, -z2 * (z1 - z3), z1 - z2, -z3 * (z1 - z2)
+
+    @classmethod
+    def from_three_points(cls, z1, z2, z3, w1, w2, w3):
+        """Return the unique Möbius transformation sending z_i → w_i.
+
+        The transformation is :math:`S_w^{-1} \\circ S_z`, where :math:`S_z`
+        sends (z1, z2, z3) to (1, 0, ∞). Any of the points may be ``sympy.zoo``.
+
+        Args:
+            z1, z2, z3: Three distinct source points.
+            w1, w2, w3: Three distinct target points.
+
+        Returns:
+            MoebiusTransformation: The transformation.
+
+        Raises:
+            ValueError: if the source or target points are not distinct.
+
+        Reference:
+            Hitchman, *GCT*, Section 3.4, "tracking three points"
+        """
+        S_z = cls(*cls._to_standard(z1, z2, z3))
+        S_w = cls(*cls._to_standard(w1, w2, w3))
+        return S_w.inverse().compose(S_z)
+
+    # --- Standard generators ---
+
+    @classmethod
+    def identity(cls):
+        """z ↦ z. Matrix [[1, 0], [0, 1]]."""
+        return cls(1, 0, 0, 1)
+
+    @classmethod
+    def translation(cls, b):
+        """z ↦ z + b. Matrix [[1, b], [0, 1]]."""
+        return cls(1, b, 0, 1)
+
+    @classmethod
+    def rotation(cls, theta):
+        """z ↦ e^{iθ} z. Matrix [[e^{iθ}, 0], [0, 1]]."""
+        if _is_sympy(theta):
+            return cls(sympy.exp(sympy.I * theta), 0, 0, 1)
+        return cls(np.exp(1j * theta), 0, 0, 1)
+
+    @classmethod
+    def dilation(cls, r):
+        """z ↦ r z for real r > 0. Matrix [[r, 0], [0, 1]]."""
+        return cls(r, 0, 0, 1)
+
+    @classmethod
+    def inversion(cls):
+        """z ↦ 1/z. Matrix [[0, 1], [1, 0]]."""
+        return cls(0, 1, 1, 0)
+
+    # --- Classification ---
+
+    @property
+    def fixed_points(self):
+        r"""Return the fixed points of T, the solutions of :math:`T(z) = z`.
+
+        Solves :math:`cz^2 + (d - a)z - b = 0`. When c = 0 the point
+        :math:`\infty` is fixed as well and is returned as ``sympy.zoo``.
+
+        Returns:
+            list: One or two points. The identity fixes every point and
+            returns an empty list.
+        """
+        a, b, c, d = self.a, self.b, self.c, self.d
+        if self._is_exact:
+            is_zero = lambda x: _simplify(x) == 0  # noqa: E731
+            sqrt = sympy.sqrt
+        else:
+            is_zero = lambda x: abs(x) < 1e-10  # noqa: E731
+            sqrt = np.sqrt
+
+        if is_zero(c):
+            if is_zero(d - a):
+                return [] if is_zero(b) else [sympy.zoo]
+            return [b / (d - a), sympy.zoo]
+
+        disc = (a - d) ** 2 + 4 * b * c
+        if is_zero(disc):
+            return [(a - d) / (2 * c)]
+        root = sqrt(disc)
+        points = [(a - d + root) / (2 * c), (a - d - root) / (2 * c)]
+        if self._is_exact:
+            points = [_simplify(z) for z in points]
+        return points
+
+    def classification(self):
+        r"""Classify T as 'identity', 'parabolic', 'elliptic', 'hyperbolic' or 'loxodromic'.
+
+        After normalizing to det = 1, the classification depends only on
+        :math:`\tau = \text{tr}^2/\det`:
+
+        - :math:`\tau \in [0, 4)`: elliptic
+        - :math:`\tau = 4`: parabolic (or the identity)
+        - :math:`\tau \in (4, \infty)`: hyperbolic
+        - :math:`\tau \in \mathbb{C} \setminus [0, \infty)`: loxodromic
+
+        Returns:
+            str: The type of the transformation.
+
+        Reference:
+            Hitchman, *GCT*, Section 3.5
+            https://mphitchman.com/geometry/section3-5.html
+        """
+        a, b, c, d = self.a, self.b, self.c, self.d
+        tau = self.trace ** 2 / self.det
+
+        if self._is_exact:
+            if all(_simplify(x) == 0 for x in (b, c, a - d)):
+                return "identity"
+            tau = _simplify(tau)
+            if _simplify(sympy.im(tau)) != 0:
+                return "loxodromic"
+            tau = sympy.re(tau)
+            if _simplify(tau - 4) == 0:
+                return "parabolic"
+            if (tau - 4).is_positive:
+                return "hyperbolic"
+            if tau.is_nonnegative:
+                return "elliptic"
+            return "loxodromic"
+
+        if max(abs(b), abs(c), abs(a - d)) < 1e-10:
+            return "identity"
+        if abs(tau.imag) > 1e-10:
+            return "loxodromic"
+        if abs(tau.real - 4) < 1e-10:
+            return "parabolic"
+        if tau.real > 4:
+            return "hyperbolic"
+        if tau.real >= -1e-10:
+            return "elliptic"
+        return "loxodromic"
+
+    def __str__(self):
+        """Return 'T(z) = (az + b)/(cz + d)' with rounded coefficients."""
+        a, b, c, d = (_format_coefficient(x) for x in (self.a, self.b, self.c, self.d))
+        return f"T(z) = ({a}z + {b})/({c}z + {d})"
+
+    def __repr__(self):
+        """Return a string representation for debugging."""
+        return f"MoebiusTransformation({self.a!r}, {self.b!r}, {self.c!r}, {self.d!r})"
+
+
+def transform_clines(A, H):
+    r"""Apply a stack of Möbius transformations to a stack of clines.
+
+    Computes the congruence :math:`H' = B^\dagger H B` with
+    :math:`B = \text{adj}(A)`, as in :meth:`MoebiusTransformation.transform_cline`,
+    for all matrices at once. The leading dimensions of A and H broadcast
+    against each other. So one map can act on N clines, N maps can act on
+    N clines pairwise, and M maps can act on N clines with A of shape
+    (M, 1, 2, 2) and H of shape (N, 2, 2). The expanded formulas run
+    elementwise over the stacks, so no 2×2 matrix products are formed.
+
+    Args:
+        A (MoebiusTransformation or array_like): One transformation, or
+            Möbius matrices [[a, b], [c, d]] of shape (..., 2, 2).
+        H (array_like or ClineArray): Hermitian cline matrices of shape
+            (..., 2, 2), such as :attr:`cline_array.ClineArray.hermitian_matrix`.
+            A ClineArray is read from its coefficients directly.
+
+    Returns:
+        numpy.ndarray: Complex Hermitian matrices of the image clines, with
+        the broadcast shape of the stacks. Use
+        :meth:`cline_array.ClineArray.from_hermitian_matrix` to turn a
+        (N, 2, 2) result into a ClineArray.
+
+    Raises:
+        ValueError: if the trailing dimensions are not 2×2, if a matrix in A
+            is degenerate, or if a matrix in H is not Hermitian.
+    """
+    if isinstance(A, MoebiusTransformation):
+        A = A.matrix
+    A = np.asarray(A, dtype=complex)
+    if A.shape[-2:] != (2, 2):
+        raise ValueError(f"A must have shape (..., 2, 2), got {A.shape}")
+    a, b, c, d = A[..., 0, 0], A[..., 0, 1], A[..., 1, 0], A[..., 1, 1]
+    if (np.abs(a * d - b * c) < 1e-10).any():
+        raise ValueError("Degenerate transformation: ad - bc = 0")
+
+    if isinstance(H, ClineArray):
+        h_c, h_alpha, h_d = H.c, H.alpha, H.d
+    else:
+        H = np.asarray(H, dtype=complex)
+        if H.shape[-2:] != (2, 2):
+            raise ValueError(f"H must have shape (..., 2, 2), got {H.shape}")
+        h_c, h_alpha, h_d = H[..., 0, 0].real, H[..., 1, 0], H[..., 1, 1].real
+        if (np.abs(H[..., 0, 1] - np.conj(h_alpha)) > 1e-10).any():
+            raise ValueError("Matrix is not Hermitian: H[0,1] != conj(H[1,0])")
+
+    c_new, alpha_new, d_new = _congruence(d, -b, -c, a, h_c, h_alpha, h_d)
+    out = np.empty(alpha_new.shape + (2, 2), dtype=complex)
+    out[..., 0, 0] = c_new
+    out[..., 0, 1] = np.conj(alpha_new)
+    out[..., 1, 0] = alpha_new
+    out[..., 1, 1] = d_new
+    return out
+
+
+class TransformChain:
+    r"""A composition of Möbius transformations and inversions in clines.
+
+    Inversion in the cline :math:`(c, \alpha, d)` is the anti-Möbius map
+
+    .. math::
+
+        z \mapsto \frac{-\bar\alpha\,\bar z - d}{c\,\bar z + \alpha}
+
+    so every chain of steps is a map :math:`z \mapsto M z` or
+    :math:`z \mapsto M \bar z` for one 2×2 matrix M. The chain keeps only M
+    and the conjugation flag. Appending a step G with flag s replaces M by
+    :math:`G\bar M` (s set) or :math:`G M` and toggles the flag by s, which
+    is one 2×2 product per step. M is rescaled to unit Frobenius norm after
+    every step, so long chains neither overflow nor underflow. The chain
+    then acts on points or clines in a single evaluation.
+
+    The chain is numeric. Exact (sympy) steps are converted to floating point.
+
+    Attributes:
+        is_anti (bool): True if the chain reverses orientation (an odd
+            number of inversions).
+    """
+
+    def __init__(self, steps=()):
+        """Initialize a chain, by default the identity.
+
+        Args:
+            steps (iterable, optional): Steps to append in order, as accepted
+                by :meth:`then`.
+        """
+        self._matrix = np.eye(2, dtype=complex)
+        self.is_anti = False
+        self._steps = 0
+        for step in steps:
+            self.then(step)
+
+    def then(self, step):
+        """Append a step, applied after the steps already in the chain.
+
+        Args:
+            step (MoebiusTransformation, Cline or TransformChain): A Möbius
+                transformation, a cline to invert in, or another chain.
+
+        Returns:
+            TransformChain: This chain, to allow ``chain.then(A).then(B)``.
+
+        Raises:
+            ValueError: if step is a degenerate cline (point or invalid).
+            TypeError: if step is of another type.
+        """
+        if isinstance(step, MoebiusTransformation):
+            G = np.array([[step.a, step.b], [step.c, step.d]], dtype=complex)
+            anti, count = False, 1
+        elif isinstance(step, Cline):
+            if not (step.is_circle or step.is_line):
+                raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+            c, alpha, d = float(step.c), complex(step.alpha), float(step.d)
+            G = np.array([[-np.conj(alpha), -d], [c, alpha]])
+            anti, count = True, 1
+        elif isinstance(step, TransformChain):
+            G, anti, count = step._matrix, step.is_anti, step._steps
+        else:
+            raise TypeError(f"Cannot append a step of type {type(step).__name__}")
+
+        M = G @ (np.conj(self._matrix) if anti else self._matrix)
+        M /= np.linalg.norm(M)
+        self._matrix = M
+        self.is_anti ^= anti
+        self._steps += count
+        return self
+
+    def invert(self, cline):
+        """Append inversion in a cline. Same as ``then(cline)``."""
+        return self.then(cline)
+
+    @property
+    def matrix(self):
+        """The fused matrix M, normalized to unit Frobenius norm (a copy)."""
+        return self._matrix.copy()
+
+    def to_moebius(self):
+        """Return the chain as a MoebiusTransformation.
+
+        Raises:
+            ValueError: if the chain reverses orientation.
+        """
+        if self.is_anti:
+            raise ValueError("Chain contains an odd number of inversions and is not a Möbius map")
+        return MoebiusTransformation(*self._matrix.ravel())
+
+    def __call__(self, z, out=None):
+        """Apply the chain to a point or to an array of points.
+
+        Follows the conventions of :meth:`MoebiusTransformation.__call__`:
+        ``sympy.zoo`` is ∞ for scalars, NaN is ∞ in arrays, and a tuple is a
+        single point (real, imag).
+
+        Args:
+            z: complex number, tuple (real, imag), ``sympy.zoo``, or array or
+                list of complex points.
+            out (numpy.ndarray, optional): C-contiguous complex128 array of the
+                same shape as z for array results.
+
+        Returns:
+            The image point, or a complex numpy.ndarray of the same shape as z.
+        """
+        a, b, c, d = self._matrix.ravel()
+        if isinstance(z, (np.ndarray, list)):
+            z = np.asarray(z, dtype=complex)
+            if self.is_anti:
+                z = np.conj(z)
+            return _moebius_points(a, b, c, d, z, out)
+        if isinstance(z, tuple):
+            z = complex(z[0], z[1])
+        if self.is_anti and not _is_infinity(z):
+            z = np.conj(complex(z))
+        return _moebius_point(a, b, c, d, z)
+
+    def transform_cline(self, cline):
+        r"""Return the image of a Cline or ClineArray under the chain.
+
+        Conjugation sends :math:`(c, \alpha, d)` to :math:`(c, \bar\alpha, d)`,
+        after which M acts by the congruence of
+        :meth:`MoebiusTransformation.transform_cline`.
+
+        Args:
+            cline (Cline or ClineArray): The clines to transform.
+
+        Returns:
+            Cline or ClineArray: The image, of the same type as the input.
+        """
+        a, b, c, d = self._matrix.ravel()
+        if isinstance(cline, ClineArray):
+            alpha = np.conj(cline.alpha) if self.is_anti else cline.alpha
+            c_new, alpha_new, d_new = _congruence(d, -b, -c, a, cline.c, alpha, cline.d)
+            return ClineArray(c_new, alpha_new, d_new)
+        alpha = complex(cline.alpha)
+        if self.is_anti:
+            alpha = alpha.conjugate()
+        c_new, alpha_new, d_new = _congruence(d, -b, -c, a, float(cline.c), alpha, float(cline.d))
+        return Cline(c=float(c_new), alpha=complex(alpha_new), d=float(d_new))
+
+    def __len__(self):
+        """Return the number of steps fused into the chain."""
+        return self._steps
+
+    def __repr__(self):
+        """Return a string representation for debugging."""
+        kind = "anti-Möbius" if self.is_anti else "Möbius"
+        return f"TransformChain({self._steps} steps, {kind})"
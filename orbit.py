@@ -0,0 +1,149 @@
+r"""
+Orbits of clines under groups generated by inversions in mirror clines.
+
+Reflecting a set of seed clines again and again in a set of mirrors reaches
+the same image through many different words. In a dihedral group, for
+example, the words :math:`s t s` and :math:`t s t` give the same map. Without
+deduplication, the number of images after n steps grows like
+:math:`m(m - 1)^{n-1}` for m mirrors, even when the orbit itself is small.
+
+:func:`reflection_orbit` expands the orbit breadth first, one word length per
+level. Every level is deduplicated as soon as it is computed, so only new
+clines are reflected again. Two clines are considered equal when their
+quantized canonical keys (:meth:`cline_array.ClineArray.keys`) are, which
+is also what ``==`` on :class:`cline.Cline` compares.
+"""
+
+import numpy as np
+
+from cline import _KEY_TOLERANCE
+from cline_array import ClineArray
+
+
+class OrbitStats:
+    """Counts of the work done by :func:`reflection_orbit`.
+
+    Every image computed is either added to the orbit or counted as a
+    duplicate or as pruned, so ``generated == duplicates + pruned + added``
+    where added is the length of the orbit minus the number of unique seeds.
+
+    Attributes:
+        generated (int): Number of images computed.
+        duplicates (int): Images dropped because the orbit already contained
+            them (within the tolerance).
+        pruned (int): Images dropped by min_radius, by max_clines, or because
+            they were degenerate.
+        levels (list of int): Number of new clines at each word length,
+            starting with the unique seeds at length 0.
+    """
+
+    def __init__(self):
+        """Initialize all counts to zero."""
+        self.generated = 0
+        self.duplicates = 0
+        self.pruned = 0
+        self.levels = []
+
+    def __repr__(self):
+        """Return a summary of the counts."""
+        return (
+            f"OrbitStats(generated={self.generated}, duplicates={self.duplicates}, "
+            f"pruned={self.pruned}, levels={self.levels})"
+        )
+
+
+def reflection_orbit(
+    seeds, mirrors, max_length=None, min_radius=None, max_clines=None, tolerance=_KEY_TOLERANCE
+):
+    """Compute the orbit of clines under inversions in a set of mirrors.
+
+    The orbit is expanded breadth first: level n holds the new images of the
+    clines of level n - 1 under every mirror. A cline is never reflected
+    back in the mirror that produced it, since that gives its parent.
+
+    Args:
+        seeds (ClineArray or iterable of Cline): The starting clines.
+        mirrors (ClineArray or iterable of Cline): The circles and lines to
+            invert in.
+        max_length (int, optional): Maximum word length (number of
+            inversions).
+        min_radius (float, optional): Drop circles with a smaller radius,
+            without expanding them further.
+        max_clines (int, optional): Stop once the orbit has this many
+            clines. Images of the last level beyond this count are pruned.
+        tolerance (float, optional): Quantum of the canonical coefficients
+            used to detect duplicates. Defaults to 1e-9.
+
+    Returns:
+        tuple: ``(orbit, stats)``. orbit is a ClineArray of the unique seeds
+        followed by the new clines of each level, in order. stats is an
+        :class:`OrbitStats`.
+
+    Raises:
+        ValueError: if a mirror is degenerate (a point or invalid), or none
+            of max_length, min_radius and max_clines is given.
+
+    The expansion also stops when a level adds nothing new, so the orbit of
+    a finite group is complete whatever the cutoff.
+    """
+    if max_length is None and min_radius is None and max_clines is None:
+        raise ValueError("An orbit can be infinite: give max_length, min_radius or max_clines")
+    if not isinstance(seeds, ClineArray):
+        seeds = ClineArray.from_clines(seeds)
+    if not isinstance(mirrors, ClineArray):
+        mirrors = ClineArray.from_clines(mirrors)
+    if not (mirrors.is_circle | mirrors.is_line).all():
+        raise ValueError("Cannot invert in a degenerate cline (point or invalid)")
+    mirror_list = mirrors.to_clines()
+    max_length = np.inf if max_length is None else max_length
+    max_clines = np.inf if max_clines is None else max_clines
+
+    stats = OrbitStats()
+    seen = set()
+
+    def add_new(candidates):
+        """Return the candidates not seen yet, in order, and mark them as seen."""
+        keys = candidates.keys(tolerance)
+        _, first = candidates.unique(tolerance)
+        rows = map(tuple, keys[first].tolist())
+        is_new = np.fromiter((row not in seen for row in rows), dtype=bool, count=len(first))
+        new = first[is_new]
+        seen.update(map(tuple, keys[new].tolist()))
+        return new
+
+    frontier = seeds[add_new(seeds)][:int(min(len(seeds), max_clines))]
+    last_mirror = np.full(len(frontier), -1)
+    levels = [frontier]
+    stats.levels.append(len(frontier))
+    total = len(frontier)
+
+    length = 0
+    while len(frontier) and length < max_length and total < max_clines:
+        length += 1
+        images, image_mirror = [], []
+        for j, mirror in enumerate(mirror_list):
+            parents = frontier[last_mirror != j]
+            images.append(parents.invert_in(mirror))
+            image_mirror.append(np.full(len(parents), j))
+        images = ClineArray.concatenate(images)
+        image_mirror = np.concatenate(image_mirror)
+        stats.generated += len(images)
+
+        keep = images.is_circle | images.is_line
+        if min_radius is not None:
+            keep &= ~(images.radius < min_radius)
+        stats.pruned += len(images) - int(keep.sum())
+        images, image_mirror = images[keep], image_mirror[keep]
+
+        new = add_new(images)
+        stats.duplicates += len(images) - len(new)
+        room = int(min(len(new), max_clines - total))
+        stats.pruned += len(new) - room
+        new = new[:room]
+
+        frontier, last_mirror = images[new], image_mirror[new]
+        levels.append(frontier)
+        stats.levels.append(len(frontier))
+        total += len(frontier)
+
+    return ClineArray.concatenate(levels), stats
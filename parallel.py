@@ -0,0 +1,255 @@
+r"""
+Process-parallel generation of inversion trees.
+
+Apollonian gaskets and limit sets grow as trees in which the subtrees below
+a given depth are independent. The drivers here expand the tree serially up
+to ``split_depth``, then hand every frontier node to a worker process.
+Workers return compact coefficient arrays (a :class:`ClineArray` pickles as
+three NumPy arrays), never lists of :class:`cline.Cline` objects.
+
+Results are always merged in frontier order, whatever the number of
+processes or the order in which workers finish. The output is therefore
+identical to a serial run with ``processes=1``. Only a bounded window of
+tasks is in flight at a time, so finished subtrees do not pile up in memory
+while an earlier one is still running.
+
+Subtrees differ greatly in size. The gasket frontier is ordered largest gap
+first, so that the biggest subtrees start early and keep all workers busy
+until the end.
+
+Reflection orbits (:mod:`orbit`) are not split: every level is
+deduplicated against the whole orbit, so their subtrees are not
+independent.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from apollonian import (
+    _GASKET_CHUNK_SIZE,
+    _ORDERS,
+    _children,
+    _descartes_quadruple,
+    _fill,
+    _fill_gaps,
+    _root_gaps,
+    _to_cline_array,
+)
+from cline_array import ClineArray
+from limit_set import (
+    _LIMIT_SET_CHUNK_SIZE,
+    _OUTPUTS,
+    _alphabet,
+    _disks,
+    _extend,
+    _output,
+    _root_block,
+    _search,
+)
+
+
+def map_ordered(function, tasks, processes=None, window=None, mp_context=None):
+    """Apply a function to tasks in a process pool and yield results in task order.
+
+    Tasks are submitted in order, keeping at most window of them in flight.
+    A new task is submitted only after the result of the oldest one has
+    been yielded, so at most window results are held at any time.
+
+    Args:
+        function (callable): A picklable (module-level) function of one task.
+        tasks (iterable): The tasks. Each must be picklable. Consumed lazily.
+        processes (int, optional): Number of worker processes. Defaults to
+            os.cpu_count(). With 1, tasks run in the calling process.
+        window (int, optional): Maximum number of tasks in flight. Defaults
+            to twice the number of processes.
+        mp_context (multiprocessing.context.BaseContext, optional): Start
+            method context for the pool.
+
+    Yields:
+        The result of function(task) for each task, in order.
+    """
+    processes = (os.cpu_count() or 1) if processes is None else int(processes)
+    if processes <= 1:
+        for task in tasks:
+            yield function(task)
+        return
+    window = 2 * processes if window is None else max(int(window), 1)
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=mp_context)
+    try:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(function, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _gasket_subtree(task):
+    """Worker: generate every circle inside one gap of a gasket."""
+    gap, max_curvature, order, chunk_size = task
+    arrays = list(_fill_gaps(gap[None], max_curvature, np.inf, order, chunk_size))
+    return _to_cline_array(np.concatenate(arrays) if arrays else np.empty((0, 4)))
+
+
+def parallel_gasket(
+    clines,
+    min_radius,
+    split_depth=3,
+    processes=None,
+    order="depth",
+    chunk_size=_GASKET_CHUNK_SIZE,
+    mp_context=None,
+):
+    """Generate an Apollonian gasket with the subtrees split over processes.
+
+    Produces the same set of circles as
+    :func:`apollonian.apollonian_gasket` with the same min_radius. The
+    first chunk holds the roots and all circles created in the first
+    split_depth generations. After that comes one chunk per frontier gap,
+    largest gap first. Within a chunk, circles follow ``order``.
+
+    Args:
+        clines (ClineArray or iterable of Cline): Three mutually tangent
+            circles or lines.
+        min_radius (float): Skip circles with a smaller radius.
+        split_depth (int, optional): Number of generations expanded before
+            splitting. Gives up to 4·3^split_depth tasks. Defaults to 3
+            (108 tasks).
+        processes (int, optional): Number of worker processes. Defaults to
+            os.cpu_count(). With 1, everything runs in the calling process.
+        order (str, optional): ``"largest"`` or ``"depth"`` (depth first),
+            applied within each subtree. Defaults to ``"depth"``, the
+            cheaper one in memory: a global largest-first order is lost
+            anyway when subtrees are split.
+        chunk_size (int, optional): Batch size of the workers' work queues.
+        mp_context (multiprocessing.context.BaseContext, optional): Start
+            method context for the pool.
+
+    Yields:
+        ClineArray: The shallow circles, then the circles of each subtree.
+
+    Raises:
+        ValueError: if the clines are not mutually tangent, order is
+            unknown, min_radius is not positive or split_depth is negative.
+    """
+    if order not in _ORDERS:
+        raise ValueError(f"order must be one of {_ORDERS}, got {order!r}")
+    if not min_radius > 0:
+        raise ValueError("min_radius must be positive")
+    if split_depth < 0:
+        raise ValueError("split_depth must be nonnegative")
+    max_curvature = 1 / min_radius
+
+    quadruple = _descartes_quadruple(clines)
+    shallow = [quadruple]
+    gaps = _root_gaps(quadruple)
+    for _ in range(split_depth):
+        new = _fill(gaps)
+        keep = new[:, 0] <= max_curvature
+        gaps, new = gaps[keep], new[keep]
+        shallow.append(new)
+        gaps = _children(gaps, new).reshape(-1, 4, 4)
+    yield _to_cline_array(np.concatenate(shallow))
+
+    # Bigger gaps hold more circles, so they go first
+    curvatures = _fill(gaps)[:, 0]
+    gaps = gaps[curvatures <= max_curvature]
+    gaps = gaps[np.argsort(curvatures[curvatures <= max_curvature], kind="stable")]
+    tasks = ((gap, max_curvature, order, chunk_size) for gap in gaps)
+    results = map_ordered(_gasket_subtree, tasks, processes, mp_context=mp_context)
+    yield from (A for A in results if len(A))
+
+
+def _limit_set_subtree(task):
+    """Worker: run the limit set search below one block of words."""
+    alphabet, block, min_radius, max_depth, output, chunk_size = task
+    finals = [
+        _output(c, alpha, d, output)
+        for c, alpha, d in _search([block], alphabet, min_radius, max_depth, chunk_size)
+    ]
+    return _concatenate(finals, output)
+
+
+def _concatenate(finals, output):
+    if output == "points":
+        return np.concatenate(finals) if finals else np.empty(0, dtype=complex)
+    return ClineArray.concatenate(finals) if finals else ClineArray([], [], [])
+
+
+def parallel_limit_set(
+    generators,
+    min_radius,
+    max_depth=64,
+    output="points",
+    split_depth=2,
+    processes=None,
+    chunk_size=_LIMIT_SET_CHUNK_SIZE,
+    mp_context=None,
+):
+    """Generate a limit set with the subtrees of the word tree split over processes.
+
+    Produces the same set of points or disks as :func:`limit_set.limit_set`
+    with the same arguments. The first chunk holds the words that finished
+    with fewer than split_depth letters. After that comes one chunk per
+    remaining word of length split_depth, in a fixed order.
+
+    Args:
+        generators (iterable): The group generators, as for
+            :func:`limit_set.limit_set`.
+        min_radius (float): Stop refining disks smaller than this.
+        max_depth (int, optional): Maximum word length. Defaults to 64.
+        output (str, optional): ``"points"`` or ``"clines"``, as for
+            :func:`limit_set.limit_set`.
+        split_depth (int, optional): Length of the words handed to the
+            workers. Gives up to K·(K - 1)^(split_depth - 1) tasks for K
+            letters. Defaults to 2.
+        processes (int, optional): Number of worker processes. Defaults to
+            os.cpu_count(). With 1, everything runs in the calling process.
+        chunk_size (int, optional): Block size of the workers' searches.
+        mp_context (multiprocessing.context.BaseContext, optional): Start
+            method context for the pool.
+
+    Yields:
+        numpy.ndarray or ClineArray: The shallow limit points or disks, then
+        those of each subtree.
+
+    Raises:
+        ValueError: if a generator is invalid, min_radius is not positive,
+            max_depth or split_depth is less than 1, or output is unknown.
+    """
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS}, got {output!r}")
+    if not min_radius > 0:
+        raise ValueError(f"min_radius must be positive, got {min_radius}")
+    if max_depth < 1:
+        raise ValueError(f"max_depth must be at least 1, got {max_depth}")
+    if split_depth < 1:
+        raise ValueError(f"split_depth must be at least 1, got {split_depth}")
+    alphabet = _alphabet(generators)
+
+    shallow = []
+    M, det, is_anti, last, depth = _root_block(alphabet)
+    while depth < min(split_depth, max_depth):
+        c, alpha, d = _disks(alphabet, M, det, is_anti, last)
+        done = c > 1 / min_radius
+        if done.any():
+            shallow.append(_output(c[done], alpha[done], d[done], output))
+        keep = ~done
+        M, det, is_anti, last = _extend(alphabet, M[keep], det[keep], is_anti[keep], last[keep])
+        depth += 1
+    if shallow:
+        yield _concatenate(shallow, output)
+
+    tasks = (
+        (alphabet, (M[k:k + 1], det[k:k + 1], is_anti[k:k + 1], last[k:k + 1], depth),
+         min_radius, max_depth, output, chunk_size)
+        for k in range(len(M))
+    )
+    results = map_ordered(_limit_set_subtree, tasks, processes, mp_context=mp_context)
+    yield from (A for A in results if len(A))
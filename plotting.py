@@ -0,0 +1,338 @@
+r"""
+Batch plotting of many clines with matplotlib collections.
+
+:meth:`cline.Cline.plot` is meant for inspecting a single cline. It draws
+sampled curves, markers, labels and a title, and resets the axes on every
+call. :func:`plot_clines` instead draws a whole scene as a few artists:
+
+- one :class:`~matplotlib.collections.EllipseCollection` for all circles
+- one :class:`~matplotlib.collections.LineCollection` for all lines, each
+  clipped analytically to the view box
+- one scatter for all point clines (and, optionally, one for circle centers)
+
+The cost of drawing is then dominated by the renderer rather than by Python
+overhead per cline, so 10^4 clines draw in a fraction of a second. Labels are
+the exception: every label is a separate text artist, so they are off by
+default.
+"""
+
+import numpy as np
+
+from cline_array import ClineArray
+
+# Fraction of the data extent added around automatically computed limits
+_MARGIN = 0.05
+
+
+def _as_cline_array(clines):
+    if isinstance(clines, ClineArray):
+        return clines
+    return ClineArray.from_clines(clines)
+
+
+def _per_cline_colors(color, n):
+    """Return an (n, 4) RGBA array for a single color or a sequence of n colors."""
+    from matplotlib.colors import to_rgba_array
+
+    rgba = to_rgba_array(color)
+    if len(rgba) == 1:
+        return np.broadcast_to(rgba, (n, 4))
+    if len(rgba) != n:
+        raise ValueError(f"Expected 1 or {n} colors, got {len(rgba)}")
+    return rgba
+
+
+def _clip_lines(alpha, d, xlim, ylim):
+    r"""Clip lines :math:`\alpha z + \bar\alpha\bar z + d = 0` to a box.
+
+    Each line is written as :math:`p_0 + t u` with the unit direction
+    :math:`u = i\bar\alpha/|\alpha|` and the foot point
+    :math:`p_0 = -d\bar\alpha / (2|\alpha|^2)`, then cut against the x and y
+    slabs of the box (Liang-Barsky).
+
+    Args:
+        alpha (numpy.ndarray): Complex coefficients of the lines, shape (N,)
+        d (numpy.ndarray): Real constant terms, shape (N,)
+        xlim (tuple): (xmin, xmax) of the box.
+        ylim (tuple): (ymin, ymax) of the box.
+
+    Returns:
+        tuple: ``(segments, visible)``. segments has shape (M, 2, 2) and holds
+        the endpoints (x, y) of the M lines that cross the box. visible is a
+        boolean mask of shape (N,) selecting those lines.
+    """
+    alpha = np.asarray(alpha, dtype=complex)
+    d = np.asarray(d, dtype=float)
+    norm_sq = alpha.real ** 2 + alpha.imag ** 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        p0 = -d * np.conj(alpha) / (2 * norm_sq)
+        u = 1j * np.conj(alpha) / np.sqrt(norm_sq)
+
+        t_lo = np.full(len(alpha), -np.inf)
+        t_hi = np.full(len(alpha), np.inf)
+        for start, step, (lo, hi) in ((p0.real, u.real, xlim), (p0.imag, u.imag, ylim)):
+            parallel = np.abs(step) < 1e-15
+            t1 = (lo - start) / step
+            t2 = (hi - start) / step
+            t_lo = np.maximum(t_lo, np.where(parallel, -np.inf, np.minimum(t1, t2)))
+            t_hi = np.minimum(t_hi, np.where(parallel, np.inf, np.maximum(t1, t2)))
+            # A line parallel to the slab is either inside it or misses the box
+            outside = parallel & ((start < lo) | (start > hi))
+            t_hi = np.where(outside, -np.inf, t_hi)
+
+    visible = t_lo < t_hi
+    ends = p0[visible, None] + np.stack([t_lo[visible], t_hi[visible]], axis=1) * u[visible, None]
+    segments = np.stack([ends.real, ends.imag], axis=-1)
+    return segments, visible
+
+
+def _visible_arcs(center, radius, xlim, ylim):
+    """Return the angular intervals of a circle that lie inside a box.
+
+    The circle is cut at its crossings with the four box edges. Each piece
+    between consecutive crossings is kept if its midpoint is inside the box.
+
+    Args:
+        center (complex): Center of the circle.
+        radius (float): Radius of the circle.
+        xlim (tuple): (xmin, xmax) of the box.
+        ylim (tuple): (ymin, ymax) of the box.
+
+    Returns:
+        list of tuple: Intervals (theta0, theta1) with theta0 < theta1,
+        in increasing order. The whole circle is [(0, 2*pi)].
+    """
+    cx, cy = center.real, center.imag
+    (x0, x1), (y0, y1) = xlim, ylim
+
+    def inside(theta):
+        x = cx + radius * np.cos(theta)
+        y = cy + radius * np.sin(theta)
+        return x0 <= x <= x1 and y0 <= y <= y1
+
+    cuts = []
+    for edge, offset, vertical in ((x0, cx, True), (x1, cx, True), (y0, cy, False), (y1, cy, False)):
+        ratio = (edge - offset) / radius
+        if abs(ratio) > 1:
+            continue
+        base = np.arccos(ratio) if vertical else np.arcsin(ratio)
+        candidates = (base, -base) if vertical else (base, np.pi - base)
+        cuts.extend(theta % (2 * np.pi) for theta in candidates)
+    if not cuts:
+        return [(0.0, 2 * np.pi)] if inside(0.0) else []
+
+    cuts = sorted(set(cuts))
+    cuts.append(cuts[0] + 2 * np.pi)
+    arcs = []
+    for start, end in zip(cuts[:-1], cuts[1:]):
+        if end - start > 1e-12 and inside((start + end) / 2):
+            if arcs and abs(arcs[-1][1] - start) < 1e-12:
+                arcs[-1] = (arcs[-1][0], end)
+            else:
+                arcs.append((start, end))
+    return arcs
+
+
+def _arc_sample_count(radius_px, span, tol_px=0.25):
+    r"""Number of chords needed to draw an arc of a circle within tol_px pixels.
+
+    A chord spanning the angle :math:`h` deviates from the arc by the sagitta
+    :math:`r(1 - \cos(h/2)) \approx r h^2 / 8`. Keeping that below tol_px
+    gives :math:`h = \sqrt{8\,\text{tol}/r}`.
+    """
+    step = np.sqrt(8 * tol_px / max(radius_px, tol_px))
+    return int(min(max(np.ceil(span / step), 8 * span / (2 * np.pi), 2), 1 << 16))
+
+
+def _circle_polyline(center, radius, xlim, ylim, pixels_per_unit):
+    """Sample the visible arcs of a circle for drawing.
+
+    Returns:
+        tuple: ``(x, y)`` arrays, with NaN separating disjoint arcs. Both are
+        empty if no part of the circle is inside the box.
+    """
+    xs, ys = [], []
+    for start, end in _visible_arcs(center, radius, xlim, ylim):
+        n = _arc_sample_count(radius * pixels_per_unit, end - start)
+        theta = np.linspace(start, end, n + 1)
+        if xs:
+            xs.append([np.nan])
+            ys.append([np.nan])
+        xs.append(center.real + radius * np.cos(theta))
+        ys.append(center.imag + radius * np.sin(theta))
+    if not xs:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def _follow_limits(ax, artist, sample):
+    """Set the data of an artist for the current view of ax, and again whenever it changes.
+
+    sample(xlim, ylim, pixels_per_unit) returns the (x, y) data of a Line2D,
+    or the segments of a LineCollection. The callbacks are disconnected once
+    the artist is removed from ax.
+    """
+    def update(ax):
+        if artist.axes is None:
+            for cid in cids:
+                ax.callbacks.disconnect(cid)
+            return
+        data = sample(ax.get_xlim(), ax.get_ylim(), _pixels_per_unit(ax))
+        if hasattr(artist, "set_segments"):
+            artist.set_segments(data)
+        else:
+            artist.set_data(*data)
+
+    cids = [ax.callbacks.connect(name, update) for name in ("xlim_changed", "ylim_changed")]
+    update(ax)
+
+
+def _pixels_per_unit(ax):
+    """Screen pixels per data unit of ax, for equal aspect."""
+    bbox = ax.get_window_extent()
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    return min(bbox.width / abs(x1 - x0), bbox.height / abs(y1 - y0))
+
+
+def _auto_limits(centers, radii, points):
+    """Return (xlim, ylim) covering the circles and points, or None if there are none."""
+    xs_lo = np.concatenate([centers.real - radii, points.real])
+    xs_hi = np.concatenate([centers.real + radii, points.real])
+    ys_lo = np.concatenate([centers.imag - radii, points.imag])
+    ys_hi = np.concatenate([centers.imag + radii, points.imag])
+    if len(xs_lo) == 0:
+        return None
+    x0, x1 = xs_lo.min(), xs_hi.max()
+    y0, y1 = ys_lo.min(), ys_hi.max()
+    pad = _MARGIN * max(x1 - x0, y1 - y0, 1e-12)
+    return (x0 - pad, x1 + pad), (y0 - pad, y1 + pad)
+
+
+def plot_clines(
+    clines,
+    ax=None,
+    color="blue",
+    linewidth=1.0,
+    xlim=None,
+    ylim=None,
+    figsize=(8, 8),
+    show_centers=False,
+    point_size=20,
+    labels=None,
+    **kwargs,
+):
+    """Draw many clines at once using matplotlib collections.
+
+    Circles become one EllipseCollection, lines one LineCollection clipped to
+    the view box, and point clines one scatter. Invalid clines are skipped.
+
+    Lines are clipped to the axis limits and clipped again whenever the
+    limits change, like the lines of :meth:`cline.Cline.plot`. If xlim or
+    ylim is None it is computed from the circles and points, with a 5%
+    margin. Without circles or points the current limits of ax are kept.
+    Line labels stay at the midpoint of the first view.
+
+    Args:
+        clines (ClineArray or iterable of Cline): The clines to draw.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. If None, a new
+            figure is created.
+        color: A matplotlib color, or one color per cline.
+        linewidth (float, optional): Width of circles and lines. Defaults to 1.0.
+        xlim (tuple, optional): x-axis limits. If None, automatically calculated.
+        ylim (tuple, optional): y-axis limits. If None, automatically calculated.
+        figsize (tuple, optional): Figure size if creating a new figure.
+            Defaults to (8, 8).
+        show_centers (bool, optional): Mark the circle centers. Defaults to False.
+        point_size (float, optional): Marker area of point clines and centers.
+            Defaults to 20.
+        labels (sequence of str, optional): One label per cline, drawn at the
+            center of a circle, at a point cline, or at the midpoint of the
+            visible part of a line. Each label is a separate text artist.
+        **kwargs: Additional keyword arguments passed to the circle and line
+            collections (e.g. linestyle, alpha, zorder).
+
+    Returns:
+        matplotlib.axes.Axes: The axes containing the plot.
+
+    Raises:
+        ValueError: if color or labels do not match the number of clines.
+    """
+    from matplotlib.collections import EllipseCollection, LineCollection
+
+    A = _as_cline_array(clines)
+    n = len(A)
+    colors = _per_cline_colors(color, n)
+    if labels is not None and len(labels) != n:
+        raise ValueError(f"Expected {n} labels, got {len(labels)}")
+
+    if ax is None:
+        import matplotlib.pyplot as plt
+
+        _, ax = plt.subplots(figsize=figsize)
+    ax.set_aspect("equal")
+
+    circles = np.flatnonzero(A.is_circle)
+    points = np.flatnonzero(A.is_point)
+    lines = np.flatnonzero(A.is_line)
+    centers = A.center[circles]
+    radii = A.radius[circles]
+    point_values = A.point[points]
+
+    limits = _auto_limits(centers, radii, point_values)
+    if limits is not None:
+        if xlim is None:
+            xlim = limits[0]
+        if ylim is None:
+            ylim = limits[1]
+    xlim = tuple(xlim) if xlim is not None else ax.get_xlim()
+    ylim = tuple(ylim) if ylim is not None else ax.get_ylim()
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+
+    if len(circles):
+        diameters = 2 * radii
+        ax.add_collection(EllipseCollection(
+            diameters,
+            diameters,
+            np.zeros(len(circles)),
+            units="xy",
+            offsets=np.column_stack([centers.real, centers.imag]),
+            offset_transform=ax.transData,
+            facecolors="none",
+            edgecolors=colors[circles],
+            linewidths=linewidth,
+            **kwargs,
+        ), autolim=False)
+        if show_centers:
+            ax.scatter(centers.real, centers.imag, s=point_size, c=colors[circles])
+
+    if len(lines):
+        alpha, d = A.alpha[lines], A.d[lines]
+
+        def clip(xlim, ylim, scale):
+            # One segment per line, empty while it is outside the view
+            segments = [np.empty((0, 2))] * len(lines)
+            clipped, visible = _clip_lines(alpha, d, xlim, ylim)
+            for k, segment in zip(np.flatnonzero(visible).tolist(), clipped):
+                segments[k] = segment
+            return segments
+
+        collection = LineCollection([], colors=colors[lines], linewidths=linewidth, **kwargs)
+        ax.add_collection(collection, autolim=False)
+        _follow_limits(ax, collection, clip)
+
+    if len(points):
+        ax.scatter(point_values.real, point_values.imag, s=point_size, c=colors[points])
+
+    if labels is not None:
+        segments, visible = _clip_lines(A.alpha[lines], A.d[lines], xlim, ylim)
+        anchors = [
+            (circles, centers),
+            (points, point_values),
+            (lines[visible], segments.mean(axis=1) @ np.array([1, 1j])),
+        ]
+        for indices, positions in anchors:
+            for k, z in zip(indices.tolist(), positions.tolist()):
+                ax.text(z.real, z.imag, f" {labels[k]}", color=colors[k], fontsize=8,
+                        verticalalignment="bottom")
+    return ax
@@ -0,0 +1,322 @@
+r"""
+Spatial index over a set of clines for broad-phase pruning.
+
+Circles are bucketed by their axis-aligned bounding boxes
+
+.. math::
+
+   [x_0 - r, x_0 + r] \times [y_0 - r, y_0 + r]
+
+on a uniform grid. Two circles can only meet if their boxes overlap, and two
+boxes can only overlap if they share a grid cell, so pairing the circles
+cell by cell finds every candidate pair while the work grows with the number
+of nearby pairs rather than with :math:`N^2`.
+
+Lines are unbounded and never go into the grid. A line is tested against the
+circles directly by the distance from each center, and every pair of lines is
+a candidate. Circles that would cover too many cells are also kept aside and
+tested directly, so one huge circle cannot fill the grid.
+
+The index only prunes. The exact intersection test is left to
+:meth:`cline_array.ClineArray.pairwise_intersections`.
+"""
+
+import numpy as np
+
+from cline_array import ClineArray, _PAIR_CHUNK_SIZE, _tangency_reach
+
+
+class ClineIndex:
+    """Uniform-grid index over the circles and lines of a ClineArray.
+
+    Points and invalid clines never intersect anything and are not indexed.
+
+    Attributes:
+        clines (ClineArray): The indexed clines. All indices returned by the
+            queries refer to positions in this array.
+        cell_size (float): Side length of a grid cell.
+    """
+
+    def __init__(self, clines, cell_size=None, max_cells_per_circle=64, slack=0.0):
+        """Build the index.
+
+        Args:
+            clines (ClineArray or iterable of Cline): The clines to index.
+            cell_size (float, optional): Side length of a grid cell. Defaults
+                to the median circle diameter.
+            max_cells_per_circle (int, optional): Circles whose bounding box
+                covers more cells than this are kept out of the grid and
+                checked against everything directly. Defaults to 64.
+            slack (float, optional): Extra reach given to every circle, as a
+                fraction of its radius, for callers whose test is looser than
+                the intersection engine's. Defaults to 0.
+
+        Raises:
+            ValueError: if cell_size is not positive.
+        """
+        if not isinstance(clines, ClineArray):
+            clines = ClineArray.from_clines(clines)
+        self.clines = clines
+        self._slack = slack
+
+        self._circles = np.flatnonzero(clines.is_circle)
+        self._lines = np.flatnonzero(clines.is_line)
+
+        # Bounding boxes of all clines, padded so near-tangent pairs are never pruned
+        radius = clines.radius
+        self._reach = self._padded(radius)
+        self._xmin = clines.center.real - self._reach
+        self._xmax = clines.center.real + self._reach
+        self._ymin = clines.center.imag - self._reach
+        self._ymax = clines.center.imag + self._reach
+
+        if cell_size is None:
+            cell_size = 2 * float(np.median(radius[self._circles])) if len(self._circles) else 1.0
+        if not cell_size > 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+
+        ids = self._circles
+        if len(ids):
+            self._origin = (self._xmin[ids].min(), self._ymin[ids].min())
+        else:
+            self._origin = (0.0, 0.0)
+        ix0, iy0 = self._cell_of(self._xmin[ids], self._ymin[ids])
+        ix1, iy1 = self._cell_of(self._xmax[ids], self._ymax[ids])
+        n_cells = (ix1 - ix0 + 1) * (iy1 - iy0 + 1)
+        large = n_cells > max_cells_per_circle
+        self._large = ids[large]
+
+        ids, ix0, iy0, ix1, iy1, n_cells = (
+            a[~large] for a in (ids, ix0, iy0, ix1, iy1, n_cells)
+        )
+        self._ny = int(iy1.max()) + 1 if len(ids) else 1
+        self._nx = int(ix1.max()) + 1 if len(ids) else 1
+
+        # One entry per (cell, circle), sorted by cell
+        owner = np.repeat(np.arange(len(ids)), n_cells)
+        k = np.arange(len(owner)) - np.repeat(np.cumsum(n_cells) - n_cells, n_cells)
+        width = (iy1 - iy0 + 1)[owner]
+        entry_ix = ix0[owner] + k // width
+        entry_iy = iy0[owner] + k % width
+        keys = entry_ix * self._ny + entry_iy
+        order = np.argsort(keys, kind="stable")
+
+        self._members = ids[owner[order]]
+        self._entry_ix = entry_ix[order]
+        self._entry_iy = entry_iy[order]
+        self._cell_keys, self._cell_starts = np.unique(keys[order], return_index=True)
+        self._cell_ends = np.append(self._cell_starts[1:], len(order))
+
+    def _padded(self, radius):
+        """Return the radius grown by the engine's tangency reach and the slack.
+
+        The small extra margin absorbs rounding in the centers and radii.
+        """
+        return radius + _tangency_reach(radius) + 1e-9 * (1 + radius) + self._slack * radius
+
+    def _cell_of(self, x, y):
+        """Return the integer grid coordinates of the cells containing (x, y)."""
+        ix = np.floor((np.asarray(x) - self._origin[0]) / self.cell_size).astype(np.int64)
+        iy = np.floor((np.asarray(y) - self._origin[1]) / self.cell_size).astype(np.int64)
+        return ix, iy
+
+    def _boxes_overlap(self, i, j):
+        """Elementwise test whether the bounding boxes of clines i and j overlap."""
+        return (
+            (self._xmin[i] <= self._xmax[j]) & (self._xmin[j] <= self._xmax[i])
+            & (self._ymin[i] <= self._ymax[j]) & (self._ymin[j] <= self._ymax[i])
+        )
+
+    def _line_distances(self, line, points):
+        """Signed distances from points to the line with index ``line``."""
+        alpha = self.clines.alpha[line]
+        return (2 * (alpha * points).real + self.clines.d[line]) / (2 * abs(alpha))
+
+    def iter_candidate_pairs(self, chunk_size=_PAIR_CHUNK_SIZE):
+        """Yield the pairs of clines that may intersect, in chunks.
+
+        Every pair that :meth:`cline_array.ClineArray.pairwise_intersections`
+        would report is yielded exactly once, as ``i < j``. Chunks from the
+        grid hold about ``chunk_size`` pairs before pruning.
+
+        Args:
+            chunk_size (int, optional): Target number of pairs per chunk.
+
+        Yields:
+            tuple of numpy.ndarray: Index arrays (ii, jj) into :attr:`clines`.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        # Circle pairs sharing a grid cell. A pair sharing several cells is
+        # only reported from the cell holding the low corner of the overlap of
+        # the two boxes.
+        sizes = self._cell_ends - self._cell_starts
+        pair_counts = np.cumsum(sizes * (sizes - 1) // 2)
+        cell = 0
+        while cell < len(sizes):
+            done = pair_counts[cell - 1] if cell else 0
+            stop = int(np.searchsorted(pair_counts, done + chunk_size, side="right"))
+            stop = max(stop, cell + 1)
+            start_entry, stop_entry = self._cell_starts[cell], self._cell_ends[stop - 1]
+            pos = np.arange(start_entry, stop_entry)
+            ends = np.repeat(self._cell_ends[cell:stop], sizes[cell:stop])
+            counts = ends - pos - 1
+            first = np.repeat(pos, counts)
+            second = first + 1 + (
+                np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+            )
+            a, b = self._members[first], self._members[second]
+            corner_ix, corner_iy = self._cell_of(
+                np.maximum(self._xmin[a], self._xmin[b]),
+                np.maximum(self._ymin[a], self._ymin[b]),
+            )
+            keep = (
+                self._boxes_overlap(a, b)
+                & (corner_ix == self._entry_ix[first])
+                & (corner_iy == self._entry_iy[first])
+            )
+            a, b = a[keep], b[keep]
+            yield np.minimum(a, b), np.maximum(a, b)
+            cell = stop
+
+        # Oversized circles against all circles
+        for big in self._large:
+            others = self._circles[self._circles != big]
+            others = others[self._boxes_overlap(big, others)]
+            others = others[~np.isin(others, self._large) | (others > big)]
+            yield np.minimum(big, others), np.maximum(big, others)
+
+        # Lines against circles and against each other
+        centers = self.clines.center[self._circles]
+        for line in self._lines:
+            near = np.abs(self._line_distances(line, centers)) <= self._reach[self._circles]
+            others = self._circles[near]
+            yield np.minimum(line, others), np.maximum(line, others)
+        n_lines = len(self._lines)
+        rows_per_chunk = max(1, chunk_size // max(n_lines, 1))
+        for start in range(0, n_lines, rows_per_chunk):
+            rows = np.arange(start, min(start + rows_per_chunk, n_lines))
+            ii, jj = np.nonzero(np.arange(n_lines)[None, :] > rows[:, None])
+            yield self._lines[rows[ii]], self._lines[jj]
+
+    def candidate_pairs(self):
+        """Return all pairs of clines that may intersect.
+
+        Returns:
+            tuple of numpy.ndarray: Index arrays (ii, jj) with ii < jj, sorted
+            lexicographically.
+        """
+        chunks = list(self.iter_candidate_pairs())
+        ii = np.concatenate([c[0] for c in chunks]) if chunks else np.empty(0, dtype=np.intp)
+        jj = np.concatenate([c[1] for c in chunks]) if chunks else np.empty(0, dtype=np.intp)
+        order = np.lexsort((jj, ii))
+        return ii[order].astype(np.intp), jj[order].astype(np.intp)
+
+    def _grid_members(self, xmin, xmax, ymin, ymax):
+        """Return the gridded circles in cells overlapping a box, with duplicates."""
+        ix0, iy0 = self._cell_of(xmin, ymin)
+        ix1, iy1 = self._cell_of(xmax, ymax)
+        ix0, iy0 = max(int(ix0), 0), max(int(iy0), 0)
+        ix1, iy1 = min(int(ix1), self._nx - 1), min(int(iy1), self._ny - 1)
+        if ix1 < ix0 or iy1 < iy0:
+            return np.empty(0, dtype=np.intp)
+        if (ix1 - ix0 + 1) * (iy1 - iy0 + 1) > len(self._cell_keys):
+            return self._members
+        gx, gy = np.meshgrid(np.arange(ix0, ix1 + 1), np.arange(iy0, iy1 + 1), indexing="ij")
+        keys = (gx * self._ny + gy).ravel()
+        slots = np.searchsorted(self._cell_keys, keys)
+        slots = slots[slots < len(self._cell_keys)]
+        slots = slots[np.isin(self._cell_keys[slots], keys)]
+        if not len(slots):
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(
+            [self._members[s:e] for s, e in zip(self._cell_starts[slots], self._cell_ends[slots])]
+        )
+
+    def query_cline(self, cline):
+        """Return the indexed clines that may intersect a given cline.
+
+        Args:
+            cline (Cline): A circle or line. If it is itself in the index, its
+                own position is included in the result.
+
+        Returns:
+            numpy.ndarray: Sorted indices into :attr:`clines`.
+
+        Raises:
+            ValueError: if cline is a point or invalid.
+        """
+        query = ClineArray.from_clines([cline])
+        if query.is_circle[0]:
+            center, radius = query.center[0], query.radius[0]
+            reach = self._padded(radius)
+            xmin, xmax = center.real - reach, center.real + reach
+            ymin, ymax = center.imag - reach, center.imag + reach
+            circles = np.concatenate([self._grid_members(xmin, xmax, ymin, ymax), self._large])
+            circles = circles[
+                (self._xmin[circles] <= xmax) & (xmin <= self._xmax[circles])
+                & (self._ymin[circles] <= ymax) & (ymin <= self._ymax[circles])
+            ]
+            alpha = self.clines.alpha[self._lines]
+            distance = (2 * (alpha * center).real + self.clines.d[self._lines]) / (2 * np.abs(alpha))
+            lines = self._lines[np.abs(distance) <= reach]
+        elif query.is_line[0]:
+            alpha, d = query.alpha[0], query.d[0]
+            centers = self.clines.center[self._circles]
+            distance = (2 * (alpha * centers).real + d) / (2 * abs(alpha))
+            circles = self._circles[np.abs(distance) <= self._reach[self._circles]]
+            lines = self._lines
+        else:
+            raise ValueError("Cannot query with a degenerate cline (point or invalid)")
+        return np.unique(np.concatenate([circles, lines])).astype(np.intp)
+
+    def query_region(self, xlim, ylim, margin=0.0):
+        """Return the indexed clines that pass through or near a rectangle.
+
+        A circle is reported when its curve comes within ``margin`` of the
+        rectangle. A circle that lies entirely inside the rectangle counts,
+        but one that encloses the rectangle without touching it does not.
+
+        Args:
+            xlim (tuple): (xmin, xmax) of the rectangle.
+            ylim (tuple): (ymin, ymax) of the rectangle.
+            margin (float, optional): Extra distance around the rectangle.
+                Defaults to 0.
+
+        Returns:
+            numpy.ndarray: Sorted indices into :attr:`clines`.
+        """
+        xmin, xmax = xlim[0] - margin, xlim[1] + margin
+        ymin, ymax = ylim[0] - margin, ylim[1] + margin
+
+        circles = np.concatenate([self._grid_members(xmin, xmax, ymin, ymax), self._large])
+        circles = np.unique(circles)
+        center = self.clines.center[circles]
+        radius = self.clines.radius[circles]
+        cx, cy = center.real, center.imag
+        nearest = np.hypot(np.clip(cx, xmin, xmax) - cx, np.clip(cy, ymin, ymax) - cy)
+        farthest = np.hypot(np.maximum(cx - xmin, xmax - cx), np.maximum(cy - ymin, ymax - cy))
+        circles = circles[(nearest <= radius) & (radius <= farthest)]
+
+        corners = np.array([complex(xmin, ymin), complex(xmin, ymax),
+                            complex(xmax, ymin), complex(xmax, ymax)])
+        lines = []
+        for line in self._lines:
+            distance = self._line_distances(line, corners)
+            if distance.min() <= 0 <= distance.max():
+                lines.append(line)
+        return np.unique(np.concatenate([circles, np.array(lines, dtype=np.intp)])).astype(np.intp)
+
+    def __len__(self):
+        """Return the number of indexed clines (circles and lines)."""
+        return len(self._circles) + len(self._lines)
+
+    def __repr__(self):
+        """Return a short summary of the index."""
+        return (
+            f"ClineIndex({len(self._circles)} circles in {len(self._cell_keys)} cells, "
+            f"{len(self._large)} oversized, {len(self._lines)} lines, "
+            f"cell size {self.cell_size:.4g})"
+        )
@@ -0,0 +1,114 @@
+"""Tests for the Apollonian gasket generator."""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from apollonian import apollonian_gasket
+from cline import Cline
+from cline_array import ClineArray
+from inversive import inversive_gram
+
+
+def _unit_gasket():
+    # Curvatures (-1, 2, 2, 3): an integral gasket
+    return [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=0.5, radius=0.5),
+        Cline.from_circle(center=-0.5, radius=0.5),
+    ]
+
+
+def _external_triple():
+    r1, r2, r3 = 1.0, 1.5, 0.8
+    x3 = ((r1 + r3) ** 2 - (r2 + r3) ** 2 + (r1 + r2) ** 2) / (2 * (r1 + r2))
+    c3 = complex(x3, np.sqrt((r1 + r3) ** 2 - x3 ** 2))
+    return [
+        Cline.from_circle(center=0, radius=r1),
+        Cline.from_circle(center=r1 + r2, radius=r2),
+        Cline.from_circle(center=c3, radius=r3),
+    ]
+
+
+def _gasket(clines, **kwargs):
+    return ClineArray.concatenate(apollonian_gasket(clines, **kwargs))
+
+
+class TestApollonianGasket:
+    """Tests for apollonian_gasket."""
+
+    def test_integral_curvatures(self):
+        A = _gasket(_unit_gasket(), max_circles=500)
+        assert len(A) == 500
+        assert np.allclose(A.c[:4], [-1, 2, 2, 3])
+        assert np.allclose(A.c, np.round(A.c), atol=1e-6)
+        assert np.allclose(A.discriminant, 1)
+
+    def test_every_circle_touches_three_others(self):
+        A = _gasket(_external_triple(), max_circles=200)
+        G = inversive_gram(A)
+        np.fill_diagonal(G, 0)
+        tangent = np.abs(np.abs(G) - 1) < 1e-6
+        assert (tangent.sum(axis=1) >= 3).all()
+        # No two circles overlap: every product is at least 1 in absolute value
+        off_diagonal = ~np.eye(len(A), dtype=bool)
+        assert (np.abs(G[off_diagonal]) > 1 - 1e-6).all()
+
+    def test_largest_first(self):
+        chunks = list(apollonian_gasket(_unit_gasket(), max_circles=5000, chunk_size=256))
+        curvatures = np.concatenate([A.c for A in chunks[1:]])
+        assert (np.diff(curvatures) >= -1e-9).all()
+        assert all(len(A) <= 256 for A in chunks)
+
+    def test_depth_order(self):
+        A = _gasket(_unit_gasket(), max_circles=4 + 4 + 12, order="depth")
+        # Roots, then the four circles of the first generation, then their children
+        assert sorted(np.round(A.c[4:8]).tolist()) == [3, 6, 6, 15]
+        assert (A.c[8:] > 6 - 1e-9).all()
+
+    def test_depth_first(self):
+        # One gap at a time: the path dives into the gap of the previous circle
+        A = _gasket(_unit_gasket(), max_circles=4 + 10, order="depth", chunk_size=1)
+        assert (np.diff(A.c[4:]) > 0).all()
+
+    def test_depth_memory_does_not_grow_with_output(self):
+        peaks = {}
+        for order in ("largest", "depth"):
+            tracemalloc.start()
+            for _ in apollonian_gasket(_unit_gasket(), min_radius=2e-4, order=order, chunk_size=256):
+                pass
+            peaks[order] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        # About 27,000 circles: the largest-first queue holds two gaps per circle
+        assert peaks["largest"] > 4e6
+        assert peaks["depth"] < 1e6
+
+    def test_min_radius(self):
+        largest = _gasket(_unit_gasket(), min_radius=0.01)
+        depth = _gasket(_unit_gasket(), min_radius=0.01, order="depth")
+        assert np.nanmin(largest.radius) >= 0.01
+        assert np.allclose(np.sort(largest.c), np.sort(depth.c))
+
+    def test_lines(self):
+        # Two parallel lines and a circle between them: a strip of unit circles
+        strip = [Cline(c=0, alpha=1j, d=1), Cline(c=0, alpha=1j, d=-1),
+                 Cline.from_circle(center=0, radius=0.5)]
+        A = _gasket(strip, max_circles=12)
+        circles = A[A.is_circle]
+        assert np.allclose(circles.radius, 0.5)
+        assert np.allclose(np.sort(circles.center.real), np.arange(-4, 6))
+
+    def test_max_circles_below_roots(self):
+        assert len(_gasket(_unit_gasket(), max_circles=2)) == 2
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            next(apollonian_gasket(_unit_gasket()))
+        with pytest.raises(ValueError):
+            next(apollonian_gasket(_unit_gasket(), max_circles=10, order="random"))
+        with pytest.raises(ValueError):
+            next(apollonian_gasket(_unit_gasket()[:2], max_circles=10))
+        not_tangent = _unit_gasket()[:2] + [Cline.from_circle(center=-0.5, radius=0.4)]
+        with pytest.raises(ValueError):
+            next(apollonian_gasket(not_tangent, max_circles=10))
@@ -0,0 +1,65 @@
+"""Smoke tests for the benchmark harness."""
+
+import json
+
+from benchmarks.__main__ import main, select
+from benchmarks.harness import Benchmark, compare, measure
+from benchmarks.workloads import BENCHMARKS
+
+
+def _fast_benchmarks():
+    return select(BENCHMARKS, ["construct.direct", "workload.grid_inversion"])
+
+
+class TestHarness:
+    """Tests for measure and compare."""
+
+    def test_names_unique(self):
+        names = [b.name for b in BENCHMARKS]
+        assert len(names) == len(set(names))
+
+    def test_measure(self):
+        result = measure(_fast_benchmarks()[0], 10, repeat=2, min_time=0)
+        assert result["runs"] >= 2
+        assert 0 < result["best"] <= result["median"]
+        assert result["throughput"] > 0
+        assert result["peak_bytes"] > 0
+
+    def test_inputs_are_seeded(self):
+        seen = []
+        bench = Benchmark("seeded", lambda rng, n: rng.normal(size=n), seen.append, (4,))
+        measure(bench, 4, repeat=1, min_time=0)
+        again = []
+        measure(Benchmark("seeded", bench.setup, again.append, (4,)), 4, repeat=1, min_time=0)
+        assert (seen[0] == again[0]).all()
+
+    def test_missing_requirement_skipped(self):
+        bench = Benchmark("needs.nothing", lambda rng, n: n, lambda s: None, (1,),
+                          requires=("module_that_does_not_exist",))
+        assert "skipped" in measure(bench, 1)
+
+    def test_compare_flags_regressions(self):
+        results = [{"name": "a", "size": 1, "median": 2.0, "peak_bytes": 1000},
+                   {"name": "b", "size": 1, "median": 1.0, "peak_bytes": 1000}]
+        baseline = {"results": {"a[1]": {"median": 1.0, "peak_bytes": 1000},
+                                "b[1]": {"median": 1.0, "peak_bytes": 10}}}
+        rows = {row["key"]: row for row in compare(results, baseline)}
+        assert rows["a[1]"]["regression"]
+        assert not rows["b[1]"]["regression"]  # memory growth below the floor
+
+
+class TestCommandLine:
+    """Tests for python -m benchmarks."""
+
+    def test_baseline_round_trip(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        args = ["--quick", "--filter", "construct.direct", "workload.grid_inversion"]
+        assert main(args + ["--save-baseline", str(path)]) == 0
+        data = json.loads(path.read_text())
+        assert set(data["results"]) == {"construct.direct[100]", "workload.grid_inversion[3]"}
+
+        for entry in data["results"].values():
+            entry["median"] /= 1000
+        path.write_text(json.dumps(data))
+        assert main(args + ["--compare", str(path)]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
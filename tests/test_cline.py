@@ -1,10 +1,14 @@
 """Tests for the Cline class."""
 
+from fractions import Fraction
+
 import numpy as np
 import pytest
 import sympy
 
+import cline
 from cline import Cline
+from gaussian import GaussianRational
 
 
 TOL = 1e-10
@@ -121,6 +125,11 @@ class TestFromThreePoints:
         C = Cline.from_three_points(0, 1, 2)
         assert C.is_line
 
+    def test_coincident_points_give_point(self):
+        C = Cline.from_three_points(1 + 2j, 1 + 2j, 1 + 2j)
+        assert C.is_point
+        assert abs(C.point - (1 + 2j)) < TOL
+
     def test_agrees_with_from_circle(self):
         """from_three_points on a known circle should match from_circle."""
         center = 2 + 3j
@@ -598,3 +607,356 @@ class TestAngleAndOrthogonality:
         theta = C1.angle(C2)
         # cos(theta) = (1 - 1 - 1) / (2*1*1) = -1/2, so theta = 2pi/3
         assert abs(theta - 2 * np.pi / 3) < TOL
+
+    def test_angle_circle_and_line(self):
+        S = Cline.from_circle(center=0, radius=1)
+        assert abs(S.angle(Cline.from_line(-1, 1)) - np.pi / 2) < TOL    # diameter
+        assert abs(S.angle(Cline.from_line(1, 1j)) - np.pi / 4) < TOL    # chord
+        assert abs(Cline.from_line(1, 1j).angle(S) - np.pi / 4) < TOL
+        assert abs(S.angle(Cline.from_line(1, 1 + 1j))) < 1e-7           # tangent
+        with pytest.raises(ValueError):
+            S.angle(Cline.from_line(2, 2 + 1j))
+
+    def test_symbolic_angle_circle_and_line(self):
+        S = Cline.from_circle(center=sympy.Integer(0), radius=sympy.Integer(1))
+        L = Cline.from_line(sympy.Rational(1, 2), sympy.Rational(1, 2) + sympy.I)  # x = 1/2
+        assert sympy.simplify(S.angle(L) - sympy.pi / 3) == 0
+
+
+class TestEvaluate:
+    """Tests for the batched evaluate, contains_many and classify_points."""
+
+    def test_matches_equation(self):
+        C = Cline(c=2, alpha=1 - 3j, d=-4)
+        rng = np.random.default_rng(1)
+        zs = rng.normal(size=50) + 1j * rng.normal(size=50)
+        vals = C.evaluate(zs)
+        expected = C.c * abs(zs) ** 2 + C.alpha * zs + np.conj(C.alpha) * np.conj(zs) + C.d
+        assert np.allclose(vals, expected.real)
+
+    def test_shape_preserved(self):
+        C = Cline.from_circle(center=0, radius=1)
+        zs = np.zeros((3, 4), dtype=complex)
+        assert C.evaluate(zs).shape == (3, 4)
+        assert C.evaluate(0.5).shape == ()
+
+    def test_out_buffer(self):
+        C = Cline.from_circle(center=1j, radius=2)
+        zs = np.linspace(-3, 3, 40000) + 0.5j
+        out = np.empty(zs.shape)
+        res = C.evaluate(zs, out=out)
+        assert res is out
+        assert np.allclose(out, abs(zs - 1j) ** 2 - 4)
+
+    def test_out_wrong_shape_raises(self):
+        C = Cline.from_circle(center=0, radius=1)
+        with pytest.raises(ValueError):
+            C.evaluate(np.zeros(3, dtype=complex), out=np.empty(4))
+
+    def test_contains_many_agrees_with_contains(self):
+        C = Cline.from_circle(center=1 + 1j, radius=2)
+        zs = np.array([3 + 1j, 1 + 3j, 1 + 1j, -1 + 1j, 5])
+        mask = C.contains_many(zs)
+        assert list(mask) == [C.contains(z) for z in zs]
+
+    def test_contains_many_line(self):
+        L = Cline.from_line(0, 1)
+        mask = L.contains_many(np.array([2.0, 1j, -7.5]))
+        assert list(mask) == [True, False, True]
+
+    def test_classify_points_circle(self):
+        for C in (Cline.from_circle(center=0, radius=1), Cline(c=-1, alpha=0, d=1)):
+            on, inside, outside = C.classify_points(np.array([1, 0.5, 2]))
+            assert list(on) == [True, False, False]
+            assert list(inside) == [False, True, False]
+            assert list(outside) == [False, False, True]
+
+    def test_classify_points_line(self):
+        L = Cline(c=0, alpha=1, d=-2)  # x = 1
+        on, inside, outside = L.classify_points(np.array([1 + 5j, 0, 3]))
+        assert list(on) == [True, False, False]
+        assert list(inside) == [False, True, False]
+        assert list(outside) == [False, False, True]
+
+
+class TestInvertPoints:
+    """Tests for the batched Cline.invert_points."""
+
+    def test_matches_scalar_circle(self):
+        C = Cline.from_circle(center=1 + 1j, radius=3)
+        zs = np.array([3 + 2j, -1, 2j, 10 - 4j])
+        img = C.invert_points(zs)
+        for z, w in zip(zs, img):
+            assert abs(w - C.invert(z)) < TOL
+
+    def test_matches_scalar_line(self):
+        L = Cline.from_line(0, 1 + 1j)
+        zs = np.array([3 + 2j, -1, 2j])
+        img = L.invert_points(zs)
+        for z, w in zip(zs, img):
+            assert abs(w - L.invert(z)) < TOL
+
+    def test_center_maps_to_nan(self):
+        S = Cline.from_circle(center=2j, radius=1)
+        img = S.invert_points(np.array([2j, 1]))
+        assert np.isnan(img[0])
+        assert np.isfinite(img[1])
+
+    def test_nan_maps_to_center(self):
+        S = Cline.from_circle(center=2j, radius=1)
+        img = S.invert_points(np.array([complex(np.nan, np.nan)]))
+        assert abs(img[0] - 2j) < TOL
+
+    def test_line_keeps_infinity(self):
+        L = Cline.from_line(-1, 1)
+        assert np.isnan(L.invert_points(np.array([complex(np.nan, np.nan)]))[0])
+
+    def test_involution(self):
+        C = Cline.from_circle(center=0.5 - 1j, radius=2)
+        rng = np.random.default_rng(2)
+        zs = rng.normal(size=1000) + 1j * rng.normal(size=1000)
+        back = C.invert_points(C.invert_points(zs))
+        assert np.allclose(back, zs)
+
+    def test_out_buffer(self):
+        S = Cline.from_circle(center=0, radius=1)
+        zs = np.array([2, 0.5j])
+        out = np.empty(2, dtype=complex)
+        assert S.invert_points(zs, out=out) is out
+        assert np.allclose(out, [0.5, 2j])
+
+    def test_degenerate_raises(self):
+        P = Cline(c=1, alpha=0, d=0)
+        with pytest.raises(ValueError):
+            P.invert_points(np.array([1]))
+
+
+class TestInvertClineClosedForm:
+    """The closed-form cline inversion agrees with inverting points."""
+
+    def test_random_clines(self):
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            J = Cline.from_circle(center=complex(*rng.normal(size=2)), radius=rng.uniform(0.5, 2))
+            C = Cline.from_circle(center=complex(*rng.normal(size=2) * 3), radius=rng.uniform(0.1, 2))
+            img = J.invert(C)
+            for t in np.linspace(0, 2 * np.pi, 5, endpoint=False):
+                z = C.center + C.radius * np.exp(1j * t)
+                w = J.invert(z)
+                if not _is_inf(w):
+                    assert abs(img.evaluate(w)) < 1e-6 * max(1, abs(img.c) * abs(w) ** 2)
+
+    def test_line_in_line_is_reflection(self):
+        L = Cline.from_line(-1, 1)   # real axis
+        M = Cline.from_line(1j, 2 + 1j)  # y = 1
+        img = L.invert(M)
+        assert img.is_line
+        assert img.contains(-1j) and img.contains(3 - 1j)
+
+    def test_nearly_line_image(self):
+        """A circle passing very close to the inversion center maps to a huge circle."""
+        S = Cline.from_circle(center=0, radius=1)
+        C = Cline.from_circle(center=1 + 1e-9, radius=1)
+        img = S.invert(C)
+        for z in [2 + 1e-9, 1 + 1e-9 + 1j]:
+            w = S.invert(z)
+            assert abs(img.evaluate(w)) < 1e-9 * abs(img.c) * abs(w) ** 2 + 1e-9
+
+    def test_mirror_fixed(self):
+        J = Cline.from_circle(center=1 - 2j, radius=3)
+        img = J.invert(J)
+        assert abs(img.center - J.center) < TOL
+        assert abs(img.radius - J.radius) < TOL
+
+    def test_orthogonal_cline_fixed(self):
+        S = Cline.from_circle(center=0, radius=1)
+        C = Cline.from_circle(center=2, radius=3 ** 0.5)
+        img = S.invert(C)
+        assert abs(img.center - 2) < TOL
+        assert abs(img.radius - 3 ** 0.5) < TOL
+
+    def test_symbolic_line_to_circle(self):
+        S = Cline.from_circle(center=sympy.Integer(0), radius=sympy.Integer(1))
+        L = Cline(c=sympy.Integer(0), alpha=sympy.Integer(1), d=sympy.Integer(-2))  # x = 1
+        img = S.invert(L)
+        assert img._is_exact
+        assert img.is_circle
+        assert sympy.simplify(img.center - sympy.Rational(1, 2)) == 0
+        assert sympy.simplify(img.radius - sympy.Rational(1, 2)) == 0
+
+    def test_image_circle_scaled_to_unit_c(self):
+        J = Cline.from_circle(center=1 - 2j, radius=3)
+        img = J.invert(Cline.from_circle(center=2, radius=0.5))
+        assert img.c == 1 and img.points is None
+        G = Cline(c=Fraction(2), alpha=GaussianRational(0), d=Fraction(-2))
+        img = G.invert(Cline(c=Fraction(0), alpha=GaussianRational(1), d=Fraction(-3)))
+        assert img.c == 1 and img.alpha == GaussianRational(Fraction(-1, 3)) and img.d == 0
+        S = Cline.from_circle(center=sympy.Integer(0), radius=sympy.Integer(2))
+        assert S.invert(Cline.from_line(sympy.Integer(3), 3 + sympy.I)).c == 1
+
+    def test_degenerate_raises(self):
+        S = Cline.from_circle(center=0, radius=1)
+        with pytest.raises(ValueError):
+            S.invert(Cline(c=1, alpha=0, d=0))
+        with pytest.raises(ValueError):
+            Cline(c=1, alpha=0, d=0).invert(S)
+
+
+def _is_inf(w):
+    return w is sympy.zoo
+
+
+class TestLazyAttributes:
+    """Derived attributes are computed on first access and cached in slots."""
+
+    def test_no_instance_dict(self):
+        C = Cline.from_circle(center=1, radius=2)
+        assert not hasattr(C, "__dict__")
+
+    def test_circle_attributes_cached(self):
+        C = Cline(c=2, alpha=-2 - 4j, d=-8)
+        assert abs(C.center - (1 - 2j)) < TOL
+        assert C.center is C.center
+        assert abs(C.radius - 3) < TOL
+
+    def test_not_applicable_raises(self):
+        L = Cline.from_line(0, 1 + 1j)
+        assert not hasattr(L, "center")
+        assert not hasattr(L, "radius")
+        C = Cline.from_circle(center=0, radius=1)
+        assert not hasattr(C, "normal_vector")
+        assert not hasattr(C, "point")
+
+    def test_line_attributes(self):
+        L = Cline.from_line(1j, 1 + 1j)  # y = 1
+        assert abs(L.distance_from_origin - 1) < TOL
+        assert abs(L.evaluate(L.point_on_line)) < TOL
+        assert abs(L.direction_vector.imag) < TOL
+
+    def test_points_assignable(self):
+        C = Cline.from_three_points(1, 1j, -1)
+        assert C.points == [1, 1j, -1]
+        C.points = None
+        assert C.points is None
+
+
+class TestEquality:
+    """Tests for canonical scaling, equality and hashing."""
+
+    def test_canonical_scaling(self):
+        C = Cline(c=-2, alpha=4 - 2j, d=1).canonical()
+        assert C.c == 1 and C.alpha == -2 + 1j and C.d == -0.5
+        L = Cline(c=0, alpha=-3 + 4j, d=10).canonical()
+        assert L.alpha == pytest.approx(0.6 - 0.8j) and L.d == pytest.approx(-2)
+        assert Cline(c=0, alpha=-2j, d=1).canonical().alpha == 1j
+
+    def test_canonical_exact_modes(self):
+        L = Cline(c=0, alpha=-1 - sympy.I, d=sympy.Integer(4)).canonical()
+        assert sympy.simplify(L.alpha - (1 + sympy.I) / sympy.sqrt(2)) == 0
+        G = Cline(c=Fraction(0), alpha=GaussianRational(-2, 4), d=Fraction(3)).canonical()
+        assert G.alpha == GaussianRational(1, -2) and G.d == Fraction(-3, 2)
+
+    def test_numeric_scale_invariant(self):
+        C = Cline.from_circle(center=1 + 2j, radius=3)
+        D = Cline(c=-2 * C.c, alpha=-2 * C.alpha, d=-2 * C.d)
+        assert C == D and hash(C) == hash(D)
+        assert len({C, D, Cline.from_circle(center=1 + 2j, radius=3.5)}) == 2
+        assert C != Cline.from_line(0, 1)
+        assert C != "circle"
+
+    def test_roundoff_is_equal(self):
+        C = Cline.from_circle(center=0.1 + 0.2j, radius=0.3)
+        D = Cline.from_three_points(*(0.1 + 0.2j + 0.3 * np.exp(1j * t) for t in (0.3, 2, 4)))
+        assert C.isclose(D)
+        assert C == D
+
+    def test_exact_equality(self):
+        S = Cline(c=sympy.Integer(2), alpha=2 + 2 * sympy.I, d=sympy.Integer(-4))
+        T = Cline.from_circle(center=-1 + sympy.I, radius=2)
+        G = Cline(c=Fraction(-1), alpha=GaussianRational(-1, -1), d=Fraction(2))
+        assert S == T == G
+        assert hash(S) == hash(T) == hash(G)
+        assert len({S, T, G}) == 1
+        assert S != Cline(c=1, alpha=1 + 1j, d=-2)
+        assert S.isclose(Cline(c=1, alpha=1 + 1j, d=-2))
+        assert S != Cline.from_circle(center=-1 + sympy.I, radius=sympy.sqrt(5))
+
+    def test_symbolic_hash(self):
+        x = sympy.Symbol("x", positive=True)
+        C = Cline(c=x, alpha=0, d=-1)
+        assert C == Cline(c=2 * x, alpha=0, d=-2)
+        assert C.canonical_key is None
+        assert hash(C) == hash(Cline(c=2 * x, alpha=0, d=-2))
+
+    def test_symbolic_set_membership(self):
+        x = sympy.Symbol("x", positive=True)
+        C = Cline(c=(x + 1) ** 2, alpha=0, d=-1)
+        D = Cline(c=x ** 2 + 2 * x + 1, alpha=0, d=-1)
+        assert C == D and hash(C) == hash(D)
+        assert len({C, D}) == 1
+
+    def test_exact_line_hash(self):
+        S = Cline(c=0, alpha=sympy.sqrt(2) * (1 - 2 * sympy.I), d=3 * sympy.sqrt(2))
+        G = Cline(c=Fraction(0), alpha=GaussianRational(-2, 4), d=Fraction(-6))
+        assert S == G and hash(S) == hash(G)
+
+    def test_isclose_tolerance(self):
+        C = Cline.from_circle(center=0, radius=1)
+        assert C.isclose(Cline.from_circle(center=1e-7, radius=1), tolerance=1e-6)
+        assert not C.isclose(Cline.from_circle(center=1e-7, radius=1))
+
+
+class TestSimplifyCache:
+    """Tests for the LRU cache in front of sympy.simplify."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        cline.clear_simplify_cache()
+        yield
+        cline.set_simplify_cache_size(cline._SIMPLIFY_CACHE_SIZE)
+
+    def test_repeated_construction_hits(self):
+        Cline.from_circle(center=1 + 2 * sympy.I, radius=sympy.Rational(3, 2))
+        misses = cline.simplify_cache_info().misses
+        Cline.from_circle(center=1 + 2 * sympy.I, radius=sympy.Rational(3, 2))
+        info = cline.simplify_cache_info()
+        assert info.misses == misses
+        assert info.hits > 0
+
+    def test_repeated_inversion_hits(self):
+        S = Cline.from_circle(center=sympy.Integer(0), radius=1)
+        C = Cline.from_circle(center=sympy.Integer(3), radius=1)
+        first = S.invert(C)
+        hits = cline.simplify_cache_info().hits
+        second = S.invert(C)
+        assert cline.simplify_cache_info().hits > hits
+        assert first.center == second.center == sympy.Rational(3, 8)
+
+    def test_results_unchanged(self):
+        x = sympy.Symbol("x")
+        expr = sympy.sin(x) ** 2 + sympy.cos(x) ** 2
+        assert cline._simplify(expr) == 1
+        assert cline._simplify(expr) == 1
+
+    def test_exact_and_float_kept_apart(self):
+        assert isinstance(cline._simplify(sympy.Integer(2)), sympy.Integer)
+        assert isinstance(cline._simplify(sympy.Float(2)), sympy.Float)
+
+    def test_size_is_bounded(self):
+        cline.set_simplify_cache_size(4)
+        for k in range(10):
+            cline._simplify(sympy.Integer(k) + sympy.Symbol("x"))
+        info = cline.simplify_cache_info()
+        assert info.maxsize == 4
+        assert info.currsize == 4
+
+    def test_disabled(self):
+        cline.set_simplify_cache_size(0)
+        cline._simplify(sympy.Integer(1))
+        cline._simplify(sympy.Integer(1))
+        assert cline.simplify_cache_info().hits == 0
+
+    def test_clear(self):
+        cline._simplify(sympy.Integer(1))
+        cline.clear_simplify_cache()
+        assert cline.simplify_cache_info().currsize == 0
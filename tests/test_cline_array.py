@@ -0,0 +1,522 @@
+"""Tests for the ClineArray class."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from cline_array import CLINE_DTYPE, INTERSECTION_DTYPE, ClineArray, cross_intersections
+
+
+TOL = 1e-10
+
+
+def _sample_clines():
+    return [
+        Cline.from_circle(center=1 + 2j, radius=3),
+        Cline.from_line(0, 1 + 1j),
+        Cline(c=1, alpha=0, d=0),        # point
+        Cline(c=1, alpha=0, d=1),        # invalid
+        Cline(c=-2, alpha=4 - 2j, d=1),  # circle with negative c
+    ]
+
+
+class TestClineArrayConstruction:
+    """Tests for building ClineArrays and converting to and from Cline lists."""
+
+    def test_arrays_are_contiguous(self):
+        A = ClineArray([1, 0], [0, 1j], [-1, 0])
+        for arr in (A.c, A.alpha, A.d):
+            assert arr.flags.c_contiguous
+        assert A.c.dtype == float
+        assert A.alpha.dtype == complex
+        assert A.d.dtype == float
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            ClineArray([1, 0], [0], [-1, 0])
+
+    def test_not_one_dimensional_raises(self):
+        with pytest.raises(ValueError):
+            ClineArray([[1]], [[0]], [[-1]])
+
+    def test_round_trip(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines)
+        back = A.to_clines()
+        assert len(back) == len(clines)
+        for C1, C2 in zip(clines, back):
+            assert abs(C1.c - C2.c) < TOL
+            assert abs(C1.alpha - C2.alpha) < TOL
+            assert abs(C1.d - C2.d) < TOL
+
+    def test_getitem(self):
+        A = ClineArray.from_clines(_sample_clines())
+        C = A[0]
+        assert isinstance(C, Cline)
+        assert abs(C.center - (1 + 2j)) < TOL
+        sub = A[1:3]
+        assert isinstance(sub, ClineArray)
+        assert len(sub) == 2
+        assert len(A[A.is_circle]) == 2
+
+    def test_concatenate(self):
+        A = ClineArray.from_clines(_sample_clines())
+        B = ClineArray.concatenate([A, A[:2]])
+        assert len(B) == len(A) + 2
+        assert np.allclose(B.c[len(A):], A.c[:2])
+
+    def test_empty(self):
+        A = ClineArray.from_clines([])
+        assert len(A) == 0
+        assert A.is_circle.shape == (0,)
+
+    def test_views_are_kept(self):
+        records = np.zeros(10, dtype=CLINE_DTYPE)
+        A = ClineArray(records["c"], records["alpha"], records["d"])
+        assert np.shares_memory(A.c, records)
+        assert not A.alpha.flags.c_contiguous
+
+    def test_records_round_trip(self):
+        A = ClineArray.from_clines(_sample_clines())
+        records = A.to_records()
+        assert records.dtype == CLINE_DTYPE
+        B = ClineArray.from_records(records)
+        assert np.shares_memory(B.alpha, records)
+        assert np.array_equal(B.d, A.d)
+        assert B.is_circle.tolist() == A.is_circle.tolist()
+
+    def test_records_missing_field_raises(self):
+        with pytest.raises(ValueError):
+            ClineArray.from_records(np.zeros(3, dtype=[("c", float), ("d", float)]))
+
+    def test_pickle_drops_cached_attributes(self):
+        A = ClineArray.from_clines(_sample_clines())
+        A.center, A.radius  # populate the caches
+        clone = pickle.loads(pickle.dumps(A))
+        assert set(vars(clone)) == {"c", "alpha", "d"}
+        assert np.array_equal(clone.alpha, A.alpha)
+        assert np.array_equal(clone.radius, A.radius, equal_nan=True)
+
+
+class TestClineArrayHermitianMatrix:
+    """Tests for stacked Hermitian matrices."""
+
+    def test_matches_scalar(self):
+        clines = _sample_clines()
+        H = ClineArray.from_clines(clines).hermitian_matrix
+        assert H.shape == (len(clines), 2, 2)
+        for k, C in enumerate(clines):
+            assert np.allclose(H[k], C.hermitian_matrix.astype(complex))
+
+    def test_round_trip(self):
+        A = ClineArray.from_clines(_sample_clines())
+        B = ClineArray.from_hermitian_matrix(A.hermitian_matrix)
+        assert np.array_equal(B.c, A.c)
+        assert np.array_equal(B.alpha, A.alpha)
+        assert np.array_equal(B.d, A.d)
+
+    def test_cline_dispatches_stacks(self):
+        A = ClineArray.from_clines(_sample_clines())
+        B = Cline.from_hermitian_matrix(A.hermitian_matrix)
+        assert isinstance(B, ClineArray)
+        assert len(B) == len(A)
+
+    def test_not_hermitian_raises(self):
+        H = ClineArray.from_clines(_sample_clines()).hermitian_matrix
+        H[1, 0, 1] += 1
+        with pytest.raises(ValueError):
+            ClineArray.from_hermitian_matrix(H)
+
+    def test_wrong_shape_raises(self):
+        with pytest.raises(ValueError):
+            ClineArray.from_hermitian_matrix(np.eye(2))
+
+
+class TestClineArrayFromThreePoints:
+    """Tests for the batched three-point constructor."""
+
+    def _assert_matches_scalar(self, zs):
+        A = ClineArray.from_three_points(zs)
+        expected = ClineArray.from_clines([Cline.from_three_points(*row) for row in zs])
+        assert np.allclose(A.c, expected.c, atol=1e-9)
+        assert np.allclose(A.alpha, expected.alpha, atol=1e-9)
+        assert np.allclose(A.d, expected.d, atol=1e-9)
+
+    def test_random_triples_match_scalar(self):
+        rng = np.random.default_rng(0)
+        zs = rng.normal(size=(200, 3)) + 1j * rng.normal(size=(200, 3))
+        self._assert_matches_scalar(zs)
+
+    def test_degenerate_triples_match_scalar(self):
+        zs = np.array([
+            [0, 1 + 1j, 2 + 2j],    # collinear
+            [1j, 1j, 3 + 1j],       # z0 = z1
+            [1, 2, 2],              # z1 = z2
+            [2 - 1j, 2 - 1j, 2 - 1j],  # all coincide
+        ])
+        A = ClineArray.from_three_points(zs)
+        assert A.is_line.tolist() == [True, True, True, False]
+        assert A.is_point[3]
+        assert A.point[3] == 2 - 1j
+        self._assert_matches_scalar(zs)
+
+    def test_points_lie_on_clines(self):
+        rng = np.random.default_rng(1)
+        zs = rng.normal(size=(100, 3)) + 1j * rng.normal(size=(100, 3))
+        A = ClineArray.from_three_points(zs)
+        for k in range(3):
+            values = np.array([A[i].evaluate(zs[i, k]) for i in range(len(A))])
+            assert np.abs(values).max() < 1e-9
+
+    def test_point_at_infinity(self):
+        zs = np.array([
+            [np.inf, 0, 1j],
+            [0, np.nan, 1],
+            [1, 1j, complex(np.inf, 0)],
+        ])
+        A = ClineArray.from_three_points(zs)
+        assert A.is_line.all()
+        expected = [Cline.from_line(0, 1j), Cline.from_line(0, 1), Cline.from_line(1, 1j)]
+        for k, L in enumerate(expected):
+            assert A.c[k] == 0
+            assert A.alpha[k] == pytest.approx(complex(L.alpha))
+            assert A.d[k] == pytest.approx(float(L.d))
+
+    def test_undefined_rows_are_nan(self):
+        zs = np.array([[np.inf, np.inf, 0], [np.inf, 1, 1], [0, 1, 1j]])
+        A = ClineArray.from_three_points(zs)
+        assert np.isnan(A.c[:2]).all() and np.isnan(A.alpha[:2]).all()
+        assert not (A.is_line[:2] | A.is_circle[:2] | A.is_point[:2]).any()
+        assert A.is_circle[2]
+
+    def test_wrong_shape_raises(self):
+        with pytest.raises(ValueError):
+            ClineArray.from_three_points(np.zeros((4, 2), dtype=complex))
+
+
+class TestClineArrayClassification:
+    """Vectorized classification must agree with Cline.__init__."""
+
+    def test_masks_match_cline(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines)
+        for k, C in enumerate(clines):
+            assert A.is_circle[k] == C.is_circle
+            assert A.is_line[k] == C.is_line
+            assert A.is_point[k] == C.is_point
+            assert abs(A.discriminant[k] - C.discriminant) < TOL
+
+    def test_tolerance_boundaries(self):
+        # c just below and above the 1e-10 threshold
+        A = ClineArray([5e-11, 2e-10], [1, 1], [0, 0])
+        assert A.is_line[0] and not A.is_line[1]
+        for k in range(2):
+            C = Cline(c=A.c[k], alpha=A.alpha[k], d=A.d[k])
+            assert A.is_line[k] == C.is_line
+            assert A.is_circle[k] == C.is_circle
+
+    def test_center_and_radius(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines)
+        for k, C in enumerate(clines):
+            if C.is_circle:
+                assert abs(A.center[k] - C.center) < TOL
+                assert abs(A.radius[k] - C.radius) < TOL
+            else:
+                assert np.isnan(A.center[k])
+                assert np.isnan(A.radius[k])
+
+    def test_point_location(self):
+        A = ClineArray.from_clines(_sample_clines())
+        assert abs(A.point[2]) < TOL
+        assert np.isnan(A.point[0])
+
+    def test_random_agreement(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        c = rng.choice([0.0, 1.0, -0.5], size=n)
+        alpha = rng.normal(size=n) + 1j * rng.normal(size=n)
+        d = rng.normal(size=n)
+        A = ClineArray(c, alpha, d)
+        for k, C in enumerate(A.to_clines()):
+            assert A.is_circle[k] == C.is_circle
+            assert A.is_line[k] == C.is_line
+            assert A.is_point[k] == C.is_point
+
+
+class TestClineArrayEvaluate:
+    """Tests for the batched Hermitian-form evaluation."""
+
+    def test_pairwise_points(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines)
+        zs = np.array([4 + 2j, 1 + 1j, 0.1, 2, -1j])
+        vals = A.evaluate(zs)
+        for k, C in enumerate(clines):
+            assert abs(vals[k] - C.evaluate(zs[k])) < TOL
+
+    def test_all_pairs_broadcast(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines)
+        zs = np.linspace(-2, 2, 7) + 0.3j
+        vals = A.evaluate(zs[:, None])
+        assert vals.shape == (7, len(clines))
+        for k, C in enumerate(clines):
+            assert np.allclose(vals[:, k], C.evaluate(zs))
+
+    def test_out_buffer(self):
+        A = ClineArray.from_clines(_sample_clines())
+        zs = np.zeros((100, 1), dtype=complex)
+        out = np.empty((100, len(A)))
+        assert A.evaluate(zs, out=out) is out
+
+    def test_contains_and_classify(self):
+        A = ClineArray.from_clines([Cline.from_circle(center=0, radius=1),
+                                    Cline(c=-1, alpha=0, d=1)])
+        zs = np.array([[1], [0.5], [2]])
+        assert A.contains_many(zs)[:, 0].tolist() == [True, False, False]
+        on, inside, outside = A.classify_points(zs)
+        assert inside[1].tolist() == [True, True]
+        assert outside[2].tolist() == [True, True]
+
+
+class TestClineArrayInvertPoints:
+    """Tests for ClineArray.invert_points."""
+
+    def test_all_pairs_matches_scalar(self):
+        clines = [Cline.from_circle(center=1j, radius=2), Cline.from_line(0, 1 + 2j)]
+        A = ClineArray.from_clines(clines)
+        zs = np.array([1, 2 + 1j, -3j])
+        img = A.invert_points(zs[:, None])
+        assert img.shape == (3, 2)
+        for k, C in enumerate(clines):
+            for m, z in enumerate(zs):
+                assert abs(img[m, k] - C.invert(z)) < TOL
+
+    def test_degenerate_rows_are_nan(self):
+        A = ClineArray.from_clines(_sample_clines())
+        img = A.invert_points(np.full(len(A), 7 + 7j))
+        assert np.isnan(img[2]) and np.isnan(img[3])
+        assert np.isfinite(img[0]) and np.isfinite(img[1])
+
+    def test_infinity(self):
+        A = ClineArray.from_clines([Cline.from_circle(center=1, radius=1), Cline.from_line(0, 1)])
+        img = A.invert_points(np.array([complex(np.nan, np.nan)]))
+        assert abs(img[0] - 1) < TOL
+        assert np.isnan(img[1])
+
+
+class TestClineArrayInvertIn:
+    """Tests for the batched cline inversion."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(4)
+        clines = [Cline.from_circle(center=complex(*rng.normal(size=2) * 3),
+                                    radius=rng.uniform(0.2, 2)) for _ in range(20)]
+        clines.append(Cline.from_line(1, 2 + 1j))
+        J = Cline.from_circle(center=0.5, radius=1.5)
+        A = ClineArray.from_clines(clines).invert_in(J)
+        for k, C in enumerate(clines):
+            img = J.invert(C)
+            assert A.is_circle[k] == img.is_circle
+            if img.is_circle:
+                assert abs(A.center[k] - img.center) < 1e-8
+                assert abs(A.radius[k] - img.radius) < 1e-8
+
+    def test_elementwise_mirrors(self):
+        S = Cline.from_circle(center=0, radius=1)
+        L = Cline.from_line(-1, 1)
+        mirrors = ClineArray.from_clines([S, L])
+        sources = ClineArray.from_clines([Cline.from_circle(center=3, radius=1),
+                                          Cline.from_circle(center=2j, radius=1)])
+        img = sources.invert_in(mirrors)
+        assert abs(img.center[1] + 2j) < TOL
+        assert abs(img.radius[0] - S.invert(sources[0]).radius) < TOL
+
+    def test_degenerate_entries_nan(self):
+        A = ClineArray.from_clines(_sample_clines())
+        img = A.invert_in(Cline.from_circle(center=10, radius=1))
+        assert np.isnan(img.c[2]) and np.isnan(img.c[3])
+        assert not img.is_line[2] and not img.is_circle[2]
+
+    def test_degenerate_mirror_raises(self):
+        A = ClineArray.from_clines(_sample_clines())
+        with pytest.raises(ValueError):
+            A.invert_in(Cline(c=1, alpha=0, d=0))
+
+
+class TestClineArrayEquality:
+    """Tests for canonical scaling, keys and deduplication."""
+
+    def test_canonical_matches_scalar(self):
+        clines = _sample_clines()
+        A = ClineArray.from_clines(clines).canonical()
+        for k, C in enumerate(clines):
+            expected = C.canonical()
+            assert A.c[k] == pytest.approx(expected.c)
+            assert A.alpha[k] == pytest.approx(expected.alpha)
+            assert A.d[k] == pytest.approx(expected.d)
+
+    def test_keys_match_scalar(self):
+        clines = _sample_clines()
+        keys = ClineArray.from_clines(clines).keys()
+        assert [tuple(row) for row in keys.tolist()] == [C.canonical_key for C in clines]
+
+    def test_keys_scale_and_sign_invariant(self):
+        A = ClineArray([1, -3, 0, 0], [1 + 1j, -3 - 3j, 2j, -4j], [-2, 6, 1, -2])
+        keys = A.keys()
+        assert (keys[0] == keys[1]).all()
+        assert (keys[2] == keys[3]).all()
+        assert not (keys[0] == keys[2]).all()
+
+    def test_line_with_roundoff_in_c(self):
+        keys = ClineArray([0, 1e-17, -1e-17], [-1, -1, 1], [2, 2, -2]).keys()
+        assert (keys == keys[0]).all()
+
+    def test_isclose(self):
+        A = ClineArray.from_clines(_sample_clines()[:3])
+        B = ClineArray(-2 * A.c, -2 * A.alpha, -2 * A.d)
+        assert A.isclose(B).all()
+        assert A.isclose(A[0]).tolist() == [True, False, False]
+
+    def test_unique_keeps_first(self):
+        rng = np.random.default_rng(5)
+        centers = rng.normal(size=50) + 1j * rng.normal(size=50)
+        A = ClineArray(np.ones(50), -np.conj(centers), np.abs(centers) ** 2 - 1)
+        scales = rng.choice([-3.0, 0.5, 2.0], size=150)
+        B = ClineArray.concatenate([A, ClineArray(
+            np.tile(A.c, 3) * scales, np.tile(A.alpha, 3) * scales, np.tile(A.d, 3) * scales
+        )])
+        unique, indices = B[rng.permutation(200)].unique()
+        assert len(unique) == 50
+        assert (np.diff(indices) > 0).all()
+        assert len(set(unique.to_clines())) == 50
+
+    def test_unique_hash_collision(self, monkeypatch):
+        import cline_array
+
+        monkeypatch.setattr(cline_array, "_KEY_MIX", np.zeros(4, dtype=np.int64))
+        A = ClineArray.from_clines(_sample_clines() * 2)
+        unique, indices = A.unique()
+        assert indices.tolist() == [0, 1, 2, 3, 4]
+
+
+def _records_by_pair(records):
+    pairs = {}
+    for r in records:
+        pairs.setdefault((int(r["i"]), int(r["j"])), []).append(
+            (complex(r["point"]), int(r["multiplicity"])))
+    return pairs
+
+
+class TestClineArrayIntersections:
+    """Tests for the vectorized all-pairs intersection engine."""
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        clines = [Cline.from_circle(center=complex(*rng.normal(size=2) * 2),
+                                    radius=rng.uniform(0.3, 2)) for _ in range(30)]
+        clines += [Cline.from_line(complex(*rng.normal(size=2)), complex(*rng.normal(size=2)))
+                   for _ in range(8)]
+        pairs = _records_by_pair(ClineArray.from_clines(clines).pairwise_intersections())
+        for i in range(len(clines)):
+            for j in range(i + 1, len(clines)):
+                expected = clines[i].intersection(clines[j])
+                got = [p for p, _ in pairs.get((i, j), [])]
+                assert len(got) == len(expected)
+                for z in expected:
+                    assert min(abs(z - w) for w in got) < 1e-8
+
+    def test_tangent_multiplicity(self):
+        A = ClineArray.from_clines([
+            Cline.from_circle(center=0, radius=1),
+            Cline.from_circle(center=3, radius=2),   # externally tangent at 1
+            Cline.from_line(1, 1 + 1j),               # tangent line x = 1
+        ])
+        R = A.pairwise_intersections()
+        assert R["multiplicity"].tolist() == [2, 2, 2]
+        assert np.allclose(R["point"], 1)
+
+    @pytest.mark.parametrize("scale", [1e-6, 1.0, 1e4])
+    def test_tolerances_scale_with_radii(self, scale):
+        A = ClineArray.from_clines([
+            Cline.from_circle(center=0, radius=scale),
+            Cline.from_circle(center=3 * scale, radius=2 * scale),    # tangent at scale
+            Cline.from_circle(center=-scale, radius=scale),           # crossing the first
+            Cline.from_circle(center=1e-9 * scale, radius=2 * scale),  # nearly concentric
+        ])
+        # Rescale the coefficients so that tiny circles still classify as circles
+        A = ClineArray(A.c / scale, A.alpha / scale, A.d / scale)
+        R = A.pairwise_intersections()
+        by_pair = _records_by_pair(R)
+        assert [m for _, m in by_pair[(0, 1)]] == [2]
+        assert abs(by_pair[(0, 1)][0][0] - scale) < 1e-8 * scale
+        assert [m for _, m in by_pair[(0, 2)]] == [1, 1]
+        assert (0, 3) not in by_pair
+
+    def test_tolerance_follows_the_smaller_radius(self):
+        # Small circles near the point where the large one touches the origin
+        clines = [
+            Cline.from_circle(center=1000, radius=1000.0),
+            Cline.from_circle(center=-1e-3 - 1e-4, radius=1e-4),  # ten radii away
+            Cline.from_circle(center=-1e-4 - 1e-9, radius=1e-4),  # tangent
+            Cline.from_circle(center=1e-5j, radius=1e-4),         # crossing
+        ]
+        R = ClineArray.from_clines(clines).pairwise_intersections(index=False)
+        by_pair = _records_by_pair(R)
+        assert (0, 1) not in by_pair
+        assert clines[0].intersection(clines[1]) == []
+        assert [m for _, m in by_pair[(0, 2)]] == [2]
+        assert abs(by_pair[(0, 2)][0][0]) < 1e-8
+        assert [m for _, m in by_pair[(0, 3)]] == [1, 1]
+        assert len(clines[0].intersection(clines[3])) == 2
+
+    def test_degenerate_and_disjoint_pairs_skipped(self):
+        A = ClineArray.from_clines([
+            Cline.from_circle(center=0, radius=1),
+            Cline(c=2, alpha=0, d=-2),                # same circle, scaled
+            Cline.from_circle(center=0, radius=2),    # concentric
+            Cline.from_circle(center=10, radius=1),   # far away
+            Cline(c=1, alpha=0, d=0),                 # point
+        ])
+        assert len(A.pairwise_intersections()) == 0
+
+    def test_lines(self):
+        A = ClineArray.from_clines([
+            Cline.from_line(0, 1),
+            Cline.from_line(1j, 1 + 1j),              # parallel to the first
+            Cline.from_line(0, 1j),
+        ])
+        R = A.pairwise_intersections()
+        assert [(r["i"], r["j"]) for r in R] == [(0, 2), (1, 2)]
+        assert np.allclose(R["point"], [0, 1j])
+        assert R["multiplicity"].tolist() == [1, 1]
+
+    def test_chunking_is_invisible(self):
+        rng = np.random.default_rng(2)
+        n = 60
+        A = ClineArray(np.ones(n), rng.normal(size=n) + 1j * rng.normal(size=n),
+                       rng.normal(size=n) - 2)
+        full = A.pairwise_intersections()
+        assert np.array_equal(full, A.pairwise_intersections(chunk_size=7))
+        assert np.all(full["i"] < full["j"])
+        order = np.lexsort((full["j"], full["i"]))
+        assert np.array_equal(order, np.arange(len(full)))
+
+    def test_cross_intersections(self):
+        A = ClineArray.from_clines([Cline.from_circle(center=0, radius=1),
+                                    Cline.from_line(0, 1)])
+        B = ClineArray.from_clines([Cline.from_circle(center=1, radius=1)])
+        R = cross_intersections(A, B)
+        assert [(r["i"], r["j"]) for r in R] == [(0, 0), (0, 0), (1, 0), (1, 0)]
+        pairs = _records_by_pair(R)
+        assert sorted(p.imag for p, _ in pairs[(0, 0)]) == pytest.approx(
+            [-3 ** 0.5 / 2, 3 ** 0.5 / 2])
+        assert sorted(p.real for p, _ in pairs[(1, 0)]) == pytest.approx([0, 2])
+
+    def test_empty(self):
+        A = ClineArray.from_clines([Cline.from_circle(center=0, radius=1)])
+        assert len(A.pairwise_intersections()) == 0
+        assert A.pairwise_intersections().dtype == INTERSECTION_DTYPE
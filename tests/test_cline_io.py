@@ -0,0 +1,95 @@
+"""Tests for the cline_io module."""
+
+import os
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy
+
+import cline_io
+from cline import Cline
+from cline_array import CLINE_DTYPE, ClineArray
+from gaussian import GaussianRational
+
+
+def _scene(n=100, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=n) + 1j * rng.normal(size=n)
+    radii = rng.uniform(0.1, 2, n)
+    return ClineArray(np.ones(n), -np.conj(centers), np.abs(centers) ** 2 - radii ** 2)
+
+
+class TestSaveLoad:
+    """Tests for the .npy record format."""
+
+    def test_round_trip(self, tmp_path):
+        A = _scene()
+        path = cline_io.save(tmp_path / "scene", A)
+        assert path.endswith("scene.npy")
+        B = cline_io.load(path)
+        assert np.array_equal(B.c, A.c)
+        assert np.array_equal(B.alpha, A.alpha)
+        assert np.array_equal(B.d, A.d)
+
+    def test_plain_numpy_can_read(self, tmp_path):
+        A = _scene(10)
+        records = np.load(cline_io.save(tmp_path / "scene.npy", A))
+        assert records.dtype == CLINE_DTYPE
+        assert records.dtype.itemsize == 32
+        assert np.array_equal(records["alpha"], A.alpha)
+
+    def test_mmap_views_file(self, tmp_path):
+        A = _scene(1000)
+        path = cline_io.save(tmp_path / "scene", A)
+        B = cline_io.load(path, mmap_mode="r")
+        assert not B.c.flags.owndata
+        assert B.alpha.strides == (CLINE_DTYPE.itemsize,)
+        part = B[100:200]
+        assert np.shares_memory(part.d, B.d)
+        assert np.array_equal(part.radius, A.radius[100:200])
+        with pytest.raises(ValueError):
+            B.c[0] = 2
+
+    def test_chunked_writes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cline_io, "_SAVE_CHUNK_SIZE", 7)
+        A = _scene(50)
+        B = cline_io.load(cline_io.save(tmp_path / "scene", A))
+        assert np.array_equal(B.alpha, A.alpha)
+
+    def test_empty(self, tmp_path):
+        path = cline_io.save(tmp_path / "empty", ClineArray.from_clines([]))
+        assert len(cline_io.load(path, mmap_mode="r")) == 0
+
+    def test_wrong_dtype_raises(self, tmp_path):
+        path = tmp_path / "points.npy"
+        np.save(path, np.zeros(5, dtype=complex))
+        with pytest.raises(ValueError):
+            cline_io.load(path)
+
+
+class TestExactSideTable:
+    """Tests for the side table of exact clines."""
+
+    def test_exact_round_trip(self, tmp_path):
+        clines = [
+            Cline.from_circle(center=1 + 2j, radius=3),
+            Cline(c=Fraction(1, 2), alpha=GaussianRational(3, Fraction(-1, 4)), d=Fraction(-7)),
+            Cline.from_circle(center=sympy.Rational(1, 3) + sympy.I, radius=sympy.sqrt(2)),
+        ]
+        path = cline_io.save(tmp_path / "mixed", clines)
+        A = cline_io.load(path)
+        assert A.to_clines() == [Cline(c=float(C.c), alpha=complex(C.alpha), d=float(C.d)) for C in clines]
+        exact = cline_io.load_exact(path)
+        assert sorted(exact) == [1, 2]
+        assert exact[1]._is_gaussian and exact[1].c == Fraction(1, 2)
+        assert exact[1] == clines[1]
+        assert exact[2].radius == sympy.sqrt(2)
+
+    def test_numeric_save_removes_stale_table(self, tmp_path):
+        exact = [Cline(c=Fraction(1), alpha=GaussianRational(0), d=Fraction(-1))]
+        path = cline_io.save(tmp_path / "scene", exact)
+        assert os.path.exists(tmp_path / "scene.exact.json")
+        cline_io.save(path, _scene(5))
+        assert not os.path.exists(tmp_path / "scene.exact.json")
+        assert cline_io.load_exact(path) == {}
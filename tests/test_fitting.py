@@ -0,0 +1,128 @@
+"""Tests for least-squares cline fitting."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from fitting import ClineFitAccumulator, _signed_distances
+
+
+TOL = 1e-10
+
+
+def _noisy_circle(rng, n, center=3 + 4j, radius=2.0, noise=0.01, arc=2 * np.pi):
+    t = rng.uniform(0, arc, n)
+    jitter = noise * (rng.normal(size=n) + 1j * rng.normal(size=n))
+    return center + radius * np.exp(1j * t) + jitter
+
+
+def _geometric_cost(C, zs):
+    return np.sum((np.abs(zs - C.center) - C.radius) ** 2)
+
+
+class TestFit:
+    """Tests for Cline.fit."""
+
+    def test_exact_circle(self):
+        zs = _noisy_circle(np.random.default_rng(0), 50, noise=0.0)
+        C = Cline.fit(zs)
+        assert C.is_circle
+        assert abs(C.center - (3 + 4j)) < TOL
+        assert abs(C.radius - 2) < TOL
+
+    def test_normalization(self):
+        C = Cline.fit(_noisy_circle(np.random.default_rng(1), 100))
+        assert abs(C.discriminant - 1) < TOL
+        assert C.c > 0
+        assert abs(C.c - 1 / C.radius) < TOL
+
+    def test_exact_line(self):
+        zs = (1 + 1j) * np.linspace(-5, 5, 100) + 2j
+        L = Cline.fit(zs)
+        assert L.is_line
+        assert abs(abs(L.alpha) - 1) < TOL
+        assert np.abs(L.evaluate(zs)).max() < 1e-9
+
+    def test_nearly_straight_arc_stays_finite(self):
+        # A tiny arc of a circle of radius 1e6: center-radius fits are
+        # ill-conditioned here, but c just becomes small
+        t = np.linspace(-1e-6, 1e-6, 50) - np.pi / 2
+        zs = 1e6j + 1e6 * np.exp(1j * t)
+        C = Cline.fit(zs)
+        assert np.isfinite([C.c, C.alpha.real, C.alpha.imag, C.d]).all()
+        assert np.abs(C.evaluate(zs)).max() < 1e-6
+
+    def test_noisy_circle(self):
+        C = Cline.fit(_noisy_circle(np.random.default_rng(2), 2000))
+        assert abs(C.center - (3 + 4j)) < 1e-2
+        assert abs(C.radius - 2) < 1e-2
+
+    def test_refine_lowers_geometric_cost(self):
+        zs = _noisy_circle(np.random.default_rng(3), 300, noise=0.1, arc=np.pi / 2)
+        algebraic = Cline.fit(zs)
+        refined = Cline.fit(zs, refine=True)
+        assert _geometric_cost(refined, zs) < _geometric_cost(algebraic, zs)
+        assert abs(refined.discriminant - 1) < TOL
+
+    def test_refine_is_stationary(self):
+        zs = _noisy_circle(np.random.default_rng(4), 300, noise=0.05)
+        C = Cline.fit(zs, refine=True)
+        theta = np.array([C.c, 2 * C.alpha.real, -2 * C.alpha.imag, C.d])
+        g, J = _signed_distances(theta, zs.real, zs.imag)
+        assert np.abs(J.T @ g).max() < 1e-8
+
+    def test_too_few_points_raises(self):
+        with pytest.raises(ValueError):
+            Cline.fit([0, 1])
+
+    def test_coincident_points_raise(self):
+        with pytest.raises(ValueError):
+            Cline.fit([1 + 1j] * 5)
+
+    def test_non_finite_raises(self):
+        with pytest.raises(ValueError):
+            Cline.fit([0, 1, np.nan, 1j])
+
+
+class TestClineFitAccumulator:
+    """Tests for chunked fitting and merging."""
+
+    def test_chunks_match_single_fit(self):
+        zs = _noisy_circle(np.random.default_rng(5), 1000)
+        acc = ClineFitAccumulator()
+        for k in range(0, len(zs), 128):
+            acc.add(zs[k:k + 128])
+        assert acc.count == len(zs)
+        C, expected = acc.fit(), Cline.fit(zs)
+        assert abs(C.c - expected.c) < 1e-9
+        assert abs(C.alpha - expected.alpha) < 1e-9
+        assert abs(C.d - expected.d) < 1e-9
+
+    def test_merge(self):
+        zs = _noisy_circle(np.random.default_rng(6), 1000)
+        parts = [ClineFitAccumulator().add(zs[:400]), ClineFitAccumulator().add(zs[400:])]
+        merged = ClineFitAccumulator().merge(parts[0]).merge(parts[1])
+        assert merged.count == 1000
+        expected = Cline.fit(zs)
+        assert abs(merged.fit().alpha - expected.alpha) < 1e-9
+        assert parts[1].count == 600
+
+    def test_merge_far_apart_references(self):
+        zs = _noisy_circle(np.random.default_rng(7), 400, center=1e3 + 1e3j, radius=1e3)
+        left = ClineFitAccumulator().add(zs[zs.real < 1e3])
+        right = ClineFitAccumulator().add(zs[zs.real >= 1e3])
+        C = left.merge(right).fit()
+        assert abs(C.center - Cline.fit(zs).center) < 1e-6
+
+    def test_pickle_round_trip(self):
+        acc = ClineFitAccumulator().add(_noisy_circle(np.random.default_rng(8), 100))
+        clone = pickle.loads(pickle.dumps(acc))
+        assert clone.count == acc.count
+        assert clone.fit().c == acc.fit().c
+
+    def test_empty_chunks_are_ignored(self):
+        acc = ClineFitAccumulator().add([]).add([1, 1j, -1, -1j])
+        assert acc.count == 4
+        assert abs(acc.fit().radius - 1) < TOL
@@ -0,0 +1,205 @@
+"""Tests for Gaussian rationals and the Gaussian-rational mode of Cline."""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy
+
+from cline import Cline
+from cline_array import ClineArray
+from gaussian import GaussianRational
+
+
+G = GaussianRational
+
+
+class TestGaussianRational:
+    """Tests for exact complex arithmetic."""
+
+    def test_arithmetic(self):
+        z, w = G(1, 2), G(Fraction(1, 2), -1)
+        assert z + w == G(Fraction(3, 2), 1)
+        assert z - w == G(Fraction(1, 2), 3)
+        assert z * w == G(Fraction(5, 2), 0)
+        assert (z / w) * w == z
+        assert -z == G(-1, -2)
+        assert z ** 2 == G(-3, 4)
+        assert z ** -1 == 1 / z
+
+    def test_mixed_with_rationals(self):
+        z = G(1, 2)
+        assert z + 1 == G(2, 2)
+        assert 1 - z == G(0, -2)
+        assert Fraction(1, 2) * z == G(Fraction(1, 2), 1)
+        assert 2 / G(0, 1) == G(0, -2)
+
+    def test_mixed_with_floats_is_complex(self):
+        assert isinstance(G(1, 2) * 0.5, complex)
+        assert G(1, 2) + 1j == 1 + 3j
+
+    def test_conjugate_and_abs_sq(self):
+        z = G(3, -4)
+        assert z.conjugate() == G(3, 4)
+        assert z.abs_sq() == 25
+
+    def test_division_by_zero(self):
+        with pytest.raises(ZeroDivisionError):
+            G(1, 1) / G(0, 0)
+
+    def test_equality_and_hash(self):
+        assert G(2) == 2
+        assert G(Fraction(1, 2)) == Fraction(1, 2)
+        assert G(1, 2) == 1 + 2j
+        assert hash(G(Fraction(1, 2))) == hash(Fraction(1, 2))
+        assert hash(G(1, 2)) == hash(1 + 2j)
+        assert len({G(1, 2), G(1, 2), G(2, 1)}) == 2
+
+    def test_conversions(self):
+        assert complex(G(Fraction(1, 2), 3)) == 0.5 + 3j
+        assert float(G(Fraction(1, 4))) == 0.25
+        with pytest.raises(TypeError):
+            float(G(1, 1))
+
+    def test_sympify(self):
+        assert sympy.sympify(G(Fraction(1, 2), 3)) == sympy.Rational(1, 2) + 3 * sympy.I
+        assert sympy.expand(sympy.I * G(1, 1)) == sympy.I - 1
+        assert sympy.expand(G(1, 1) * sympy.I) == sympy.I - 1
+
+
+class TestGaussianCline:
+    """Tests for clines with Gaussian-rational coefficients."""
+
+    def test_mode_detection(self):
+        C = Cline.from_circle(center=G(1, 2), radius=Fraction(3, 2))
+        assert C._is_gaussian and C._is_exact
+        assert isinstance(C.c, Fraction)
+        assert isinstance(C.alpha, GaussianRational)
+        assert isinstance(C.d, Fraction)
+        assert not Cline(c=1, alpha=0, d=-1)._is_gaussian
+        assert not Cline(c=Fraction(1), alpha=0.5, d=-1)._is_gaussian
+        assert not Cline(c=Fraction(1), alpha=sympy.Integer(0), d=-1)._is_gaussian
+
+    def test_classification(self):
+        assert Cline(c=Fraction(1), alpha=G(1), d=Fraction(1, 2)).is_circle
+        assert Cline(c=Fraction(1), alpha=G(1), d=Fraction(1)).is_point
+        point_free = Cline(c=Fraction(1), alpha=G(1), d=Fraction(2))
+        assert not (point_free.is_circle or point_free.is_point or point_free.is_line)
+        assert Cline(c=Fraction(0), alpha=G(0, 1), d=Fraction(1)).is_line
+
+    def test_center_and_radius(self):
+        C = Cline.from_circle(center=G(1, 2), radius=Fraction(3, 2))
+        assert C.center == G(1, 2)
+        assert C.radius == Fraction(3, 2)
+        irrational = Cline(c=Fraction(2), alpha=G(1), d=Fraction(-1))
+        assert irrational.radius == sympy.sqrt(3) / 2
+
+    def test_from_three_points(self):
+        C = Cline.from_three_points(G(1), G(0, 1), G(-1))
+        assert (C.c, C.alpha, C.d) == (1, 0, -1)
+        assert C.points == [G(1), G(0, 1), G(-1)]
+        for z in (G(Fraction(3, 5), Fraction(4, 5)), G(0, -1)):
+            assert C.contains(z)
+
+    def test_from_three_points_matches_numeric(self):
+        points = [G(Fraction(1, 3), 2), G(-1, Fraction(1, 2)), G(2, -3)]
+        exact = Cline.from_three_points(*points)
+        numeric = Cline.from_three_points(*(complex(z) for z in points))
+        assert abs(complex(exact.center) - numeric.center) < 1e-10
+        assert abs(float(exact.radius) - numeric.radius) < 1e-10
+
+    def test_from_three_points_collinear_and_coincident(self):
+        assert Cline.from_three_points(G(0), G(1, 1), G(2, 2)).is_line
+        assert Cline.from_three_points(G(0), G(0), G(2, 2)).is_line
+        P = Cline.from_three_points(G(1, 1), G(1, 1), G(1, 1))
+        assert P.is_point
+        assert P.point == G(1, 1)
+
+    def test_contains(self):
+        L = Cline.from_line(G(0), G(1, 1))
+        assert L.contains(G(Fraction(7, 3), Fraction(7, 3)))
+        assert not L.contains(G(1, Fraction(10, 9)))
+        assert L.contains(sympy.zoo)
+
+    def test_contains_falls_back_for_sympy_points(self):
+        C = Cline.from_circle(center=G(0), radius=1)
+        assert C.contains(sympy.sqrt(2) / 2 * (1 + sympy.I))
+
+    def test_float_points_use_numeric_path(self):
+        C = Cline.from_circle(center=G(1, 1), radius=Fraction(1))
+        w = C.invert(0.3 + 0.2j)
+        assert isinstance(w, complex)
+        assert abs(w - (1 + 1j + 1 / np.conj(0.3 + 0.2j - (1 + 1j)))) < 1e-12
+        assert C.contains(1 + 1j + np.exp(0.7j))
+        assert not C.contains(0.5)
+
+    def test_invert_point(self):
+        S = Cline.from_circle(center=G(0), radius=Fraction(2))
+        assert S.invert(G(1, 1)) == G(2, 2)
+        assert S.invert(G(0)) is sympy.zoo
+        assert S.invert(sympy.zoo) == G(0)
+        L = Cline.from_line(G(0), G(1))  # real axis
+        assert L.invert(G(3, 4)) == G(3, -4)
+
+    def test_invert_cline(self):
+        S = Cline.from_circle(center=G(0), radius=1)
+        C = Cline.from_circle(center=G(2), radius=1)
+        image = S.invert(C)
+        assert image._is_gaussian
+        assert image.center == Fraction(2, 3)
+        assert image.radius == Fraction(1, 3)
+
+    def test_intersection_rational(self):
+        C1 = Cline.from_circle(center=G(0), radius=Fraction(5))
+        C2 = Cline.from_circle(center=G(6), radius=Fraction(5))
+        assert sorted(C1.intersection(C2), key=lambda z: z.imag) == [G(3, -4), G(3, 4)]
+
+    def test_intersection_line_line(self):
+        L1 = Cline.from_line(G(0), G(1, 1))
+        L2 = Cline.from_line(G(0, 1), G(3, 1))
+        assert L1.intersection(L2) == [G(1, 1)]
+        assert L1.intersection(Cline.from_line(G(1), G(2, 1))) == []
+
+    def test_intersection_tangent(self):
+        C = Cline.from_circle(center=G(0), radius=1)
+        L = Cline.from_line(G(1), G(1, 1))
+        assert C.intersection(L) == [G(1)]
+
+    def test_intersection_irrational_falls_back_to_sympy(self):
+        C = Cline.from_circle(center=G(0), radius=1)
+        L = Cline.from_line(G(0), G(1, 1))
+        points = C.intersection(L)
+        expected = {sympy.sqrt(2) / 2 * (1 + sympy.I), -sympy.sqrt(2) / 2 * (1 + sympy.I)}
+        assert {sympy.expand(z) for z in points} == {sympy.expand(z) for z in expected}
+
+    def test_is_orthogonal(self):
+        S = Cline.from_circle(center=G(0), radius=1)
+        assert S.is_orthogonal(Cline.from_circle(center=G(2), radius=Fraction(3, 2))) is False
+        # Center 2 and radius sqrt(3): |c1 - c2|^2 = r1^2 + r2^2
+        assert S.is_orthogonal(Cline(c=Fraction(1), alpha=G(-2), d=Fraction(1)))
+        assert S.is_orthogonal(Cline.from_line(G(0), G(1, 1)))
+
+    def test_angle_uses_sympy(self):
+        C1 = Cline.from_circle(center=G(0), radius=1)
+        C2 = Cline.from_circle(center=G(1), radius=1)
+        assert C1.angle(C2) == 2 * sympy.pi / 3
+
+    def test_mixed_with_numeric(self):
+        C = Cline.from_circle(center=G(0), radius=1)
+        N = Cline.from_circle(center=1, radius=1)
+        assert not C.is_orthogonal(N)
+        points = C.intersection(N)
+        assert len(points) == 2
+        assert all(isinstance(z, complex) for z in points)
+
+    def test_mixed_with_sympy(self):
+        C = Cline.from_circle(center=G(0), radius=1)
+        S = Cline.from_circle(center=sympy.Integer(2), radius=sympy.sqrt(3))
+        assert C.is_orthogonal(S)
+
+    def test_numeric_views(self):
+        C = Cline.from_circle(center=G(1, 2), radius=Fraction(3, 2))
+        assert abs(C.evaluate(np.array([1 + 3.5j]))[0]) < 1e-12
+        A = ClineArray.from_clines([C])
+        assert abs(A.center[0] - (1 + 2j)) < 1e-12
+        assert "radius 1.5" in str(C)
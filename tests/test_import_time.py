@@ -0,0 +1,75 @@
+"""Import-time regression tests for the cline module."""
+
+import os
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget in microseconds for importing cline on top of numpy. The lazy imports
+# keep this well under 100 ms; an eager sympy or matplotlib import costs ~1 s.
+IMPORT_BUDGET_US = 300_000
+
+
+def _run(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+
+
+def _cumulative_import_times(stderr):
+    """Parse ``-X importtime`` output into {top-level module: cumulative µs}."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        name = fields[2]
+        if name.startswith("  ") or not fields[1].strip().isdigit():
+            continue  # nested import or header line
+        times[name.strip()] = int(fields[1])
+    return times
+
+
+class TestImportTime:
+    """Importing cline must not pull in its heavy optional dependencies."""
+
+    def test_heavy_modules_not_loaded(self):
+        result = _run(
+            "import sys, cline, cline_array\n"
+            "print(sorted(m for m in ('sympy', 'matplotlib') if m in sys.modules))"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_numeric_use_does_not_load_sympy(self):
+        result = _run(
+            "import sys\n"
+            "from cline import Cline\n"
+            "C = Cline.from_circle(center=1, radius=2)\n"
+            "C.invert(C.invert(3j)); C.evaluate(0); C.intersection(Cline.from_line(0, 1))\n"
+            "C.angle(Cline.from_circle(center=2, radius=1))\n"
+            "print('sympy' in sys.modules)"
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_gaussian_use_with_float_points_does_not_load_sympy(self):
+        result = _run(
+            "import sys\n"
+            "from fractions import Fraction\n"
+            "from cline import Cline\n"
+            "from gaussian import GaussianRational\n"
+            "C = Cline.from_circle(center=GaussianRational(1, 1), radius=Fraction(1))\n"
+            "C.invert(0.3 + 0.2j); C.contains(0.5); C.invert(GaussianRational(3))\n"
+            "print('sympy' in sys.modules)"
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_import_budget(self):
+        result = _run("import numpy, cline", "-X", "importtime")
+        times = _cumulative_import_times(result.stderr)
+        assert times["cline"] < IMPORT_BUDGET_US, (
+            f"import cline took {times['cline'] / 1000:.1f} ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+        )
@@ -0,0 +1,137 @@
+"""Tests for the inversive-product Gram matrix and contact masks."""
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from cline_array import ClineArray
+from inversive import (
+    angle_matrix,
+    contact_pairs,
+    crossing_mask,
+    inversive_gram,
+    orthogonality_mask,
+    tangency_mask,
+)
+
+
+TOL = 1e-10
+
+
+def _sample_clines():
+    return [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=3, radius=2),            # externally tangent to 0
+        Cline.from_circle(center=2, radius=3 ** 0.5),     # orthogonal to 0
+        Cline(c=-2, alpha=-2, d=0),                        # circle |z + 1| = 1, negative c
+        Cline.from_line(0, 1),                             # real axis
+        Cline.from_line(1, 1 + 1j),                        # x = 1, tangent to 0
+        Cline(c=1, alpha=0, d=0),                          # point
+    ]
+
+
+class TestInversiveGram:
+    """Tests for inversive_gram."""
+
+    def test_matches_circle_formula(self):
+        rng = np.random.default_rng(0)
+        clines = [Cline.from_circle(center=complex(*rng.normal(size=2)), radius=rng.uniform(0.2, 2))
+                  for _ in range(15)]
+        G = inversive_gram(clines)
+        for i, Ci in enumerate(clines):
+            for j, Cj in enumerate(clines):
+                expected = (abs(Ci.center - Cj.center) ** 2 - Ci.radius ** 2 - Cj.radius ** 2) / (
+                    2 * Ci.radius * Cj.radius)
+                assert abs(G[i, j] - expected) < 1e-9
+
+    def test_symmetric_with_unit_diagonal(self):
+        G = inversive_gram(_sample_clines())
+        valid = ~np.isnan(G[:, 0])
+        assert np.allclose(G[np.ix_(valid, valid)], G[np.ix_(valid, valid)].T)
+        assert np.allclose(np.diag(G)[valid], -1)
+        assert np.isnan(G[6]).all() and np.isnan(G[:, 6]).all()
+
+    def test_sign_normalized(self):
+        C = Cline.from_circle(center=5j, radius=2)
+        negated = Cline(c=-C.c, alpha=-C.alpha, d=-C.d)
+        G = inversive_gram([C, negated])
+        assert np.allclose(G, -1)
+
+    def test_rectangular(self):
+        clines = _sample_clines()
+        G = inversive_gram(clines[:3], clines[3:6])
+        assert G.shape == (3, 3)
+        assert np.allclose(G, inversive_gram(clines)[:3, 3:6])
+
+    def test_moebius_invariance(self):
+        clines = _sample_clines()[:6]
+        J = Cline.from_circle(center=0.3 + 0.2j, radius=1.7)
+        G = inversive_gram(clines)
+        G_img = inversive_gram(ClineArray.from_clines(clines).invert_in(J))
+        assert np.allclose(np.abs(G), np.abs(G_img))
+
+
+class TestMasks:
+    """Orthogonality, tangency and crossing read off the Gram matrix."""
+
+    def test_masks(self):
+        clines = _sample_clines()
+        G = inversive_gram(clines)
+        tangent, orthogonal, crossing = tangency_mask(G), orthogonality_mask(G), crossing_mask(G)
+        assert tangent[0, 1] and tangent[0, 5]
+        assert orthogonal[0, 2] and orthogonal[0, 4]
+        assert crossing[0, 3] and not crossing[0, 1]
+        for i, Ci in enumerate(clines[:6]):
+            for j, Cj in enumerate(clines[:6]):
+                if i != j:
+                    assert orthogonal[i, j] == Ci.is_orthogonal(Cj)
+
+    def test_angles_match_cline_angle(self):
+        rng = np.random.default_rng(3)
+        clines = [Cline.from_circle(center=complex(*rng.normal(size=2)), radius=rng.uniform(0.5, 2))
+                  for _ in range(8)]
+        clines += [Cline.from_line(complex(*rng.normal(size=2)), complex(*rng.normal(size=2)))
+                   for _ in range(3)]
+        angles = angle_matrix(clines)
+        for i, Ci in enumerate(clines):
+            for j, Cj in enumerate(clines):
+                if i == j:
+                    continue
+                if (Ci.is_line and Cj.is_line) or Ci.intersection(Cj):
+                    assert abs(angles[i, j] - Ci.angle(Cj)) < 1e-8
+                else:
+                    assert np.isnan(angles[i, j])
+
+
+class TestContactPairs:
+    """Tests for contact_pairs."""
+
+    @pytest.mark.parametrize("kind", ["tangent", "orthogonal", "crossing", "intersecting"])
+    def test_index_matches_dense(self, kind):
+        rng = np.random.default_rng(5)
+        clines = _sample_clines() + [
+            Cline.from_circle(center=complex(*rng.uniform(-4, 4, size=2)), radius=rng.uniform(0.2, 2))
+            for _ in range(40)]
+        ii, jj, g = contact_pairs(clines, kind)
+        ii_d, jj_d, g_d = contact_pairs(clines, kind, index=False, block_size=10)
+        assert np.array_equal(ii, ii_d) and np.array_equal(jj, jj_d)
+        assert np.allclose(g, g_d)
+        assert np.all(ii < jj)
+
+    def test_tangent_pairs(self):
+        ii, jj, g = contact_pairs(_sample_clines(), "tangent")
+        pairs = set(zip(ii.tolist(), jj.tolist()))
+        assert {(0, 1), (0, 5), (1, 5)} <= pairs
+        assert np.allclose(np.abs(g), 1)
+
+    def test_far_from_origin(self):
+        # Tangent chain of small circles away from the origin, where the raw
+        # coefficient form of G loses most of its digits
+        centers = 10 + 2e-2 * np.arange(50) + 10j
+        A = ClineArray(np.ones(50), -np.conj(centers), np.abs(centers) ** 2 - 1e-4)
+        ii, jj, _ = contact_pairs(A, "tangent")
+        assert list(zip(ii.tolist(), jj.tolist())) == [(k, k + 1) for k in range(49)]
+
+    def test_bad_kind(self):
+        with pytest.raises(ValueError):
+            contact_pairs(_sample_clines(), "kissing")
@@ -0,0 +1,150 @@
+"""Tests for the limit_set module."""
+
+from itertools import islice
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from cline_array import ClineArray
+from limit_set import _letters, _pairing_matrix, limit_set
+from mobius import MoebiusTransformation, TransformChain
+
+
+def _schottky_pairs(radius=0.4):
+    C = [Cline.from_circle(center=z, radius=radius) for z in (1, -1, 1j, -1j)]
+    return [(C[0], C[1]), (C[2], C[3])]
+
+
+def _mirrors():
+    return [Cline.from_circle(center=np.exp(2j * np.pi * k / 3), radius=0.8) for k in range(3)]
+
+
+def _naive_disks(generators, depth):
+    """All disks g_1 ... g_{n-1}(D_{g_n}) of reduced words of length depth, by recursion."""
+    matrices, anti, inverse, sources = _letters(generators)
+    steps = []
+    for G, is_anti in zip(matrices, anti):
+        if is_anti:
+            (a, b), (c, d) = G
+            steps.append(Cline(c=c.real, alpha=d, d=-b.real))
+        else:
+            steps.append(MoebiusTransformation(*G.ravel()))
+    disks = []
+
+    def walk(word):
+        if len(word) == depth:
+            chain = TransformChain(steps[g] for g in reversed(word))
+            c, alpha, d = sources[word[-1]]
+            disks.append(chain.transform_cline(Cline(c=c.real, alpha=alpha, d=d.real)))
+            return
+        for g in range(len(steps)):
+            if not word or inverse[word[-1]] != g:
+                walk(word + [g])
+
+    walk([])
+    return ClineArray.from_clines(disks)
+
+
+def _centers_and_radii(A):
+    """Centers and radii from the coefficients, also for clines too small to classify."""
+    discriminant = np.abs(A.alpha) ** 2 - A.c * A.d
+    return -np.conj(A.alpha) / A.c, np.sqrt(discriminant) / np.abs(A.c)
+
+
+def _assert_same_circles(A, B):
+    centers_a, radii_a = _centers_and_radii(A)
+    centers_b, radii_b = _centers_and_radii(B)
+    distance = np.abs(centers_a[:, None] - centers_b[None, :]) + np.abs(radii_a[:, None] - radii_b[None, :])
+    assert len(A) == len(B)
+    assert distance.min(axis=0).max() < 1e-9
+    assert distance.min(axis=1).max() < 1e-9
+
+
+class TestLetters:
+    """Tests for the generators and their disks."""
+
+    def test_pairing_maps_circle_onto_partner(self):
+        C_a, C_A = Cline.from_circle(center=2, radius=0.5), Cline.from_circle(center=-1j, radius=1.5)
+        T = MoebiusTransformation(*_pairing_matrix(C_a, C_A).ravel())
+        image = T.transform_cline(C_a)
+        assert abs(image.center - C_A.center) < 1e-9
+        assert abs(image.radius - C_A.radius) < 1e-9
+        # The outside of C_a goes inside C_A
+        assert abs(T(100) - C_A.center) < C_A.radius
+
+    def test_letter_counts(self):
+        _, anti, inverse, _ = _letters(_schottky_pairs() + _mirrors())
+        assert anti.tolist() == [False] * 4 + [True] * 3
+        assert inverse.tolist() == [1, 0, 3, 2, 4, 5, 6]
+
+    def test_invalid_generators(self):
+        with pytest.raises(ValueError):
+            _letters([])
+        with pytest.raises(ValueError):
+            _letters([(Cline.from_line(0, 1), Cline.from_circle(center=0, radius=1))])
+        with pytest.raises(ValueError):
+            _letters([[[1, 2], [0, 1]]])  # fixes ∞
+        with pytest.raises(ValueError):
+            _letters([Cline(c=1, alpha=0, d=0)])
+
+
+class TestLimitSet:
+    """Tests for the depth-first word enumeration."""
+
+    @pytest.mark.parametrize("generators", [_schottky_pairs(), _mirrors()])
+    def test_matches_naive_recursion(self, generators):
+        depth = 4
+        (A,) = limit_set(generators, min_radius=1e-12, max_depth=depth, output="clines")
+        _assert_same_circles(A, _naive_disks(generators, depth))
+
+    def test_word_counts(self):
+        (A,) = limit_set(_schottky_pairs(), min_radius=1e-12, max_depth=5, output="clines")
+        assert len(A) == 4 * 3 ** 4
+        (B,) = limit_set(_mirrors(), min_radius=1e-12, max_depth=5, output="clines")
+        assert len(B) == 3 * 2 ** 4
+
+    def test_limit_set_is_invariant(self):
+        pairs = _schottky_pairs()
+        points = np.concatenate(list(limit_set(pairs, min_radius=1e-4)))
+        T = MoebiusTransformation(*_pairing_matrix(*pairs[0]).ravel())
+        images = T(points)
+        gaps = np.abs(images[:, None] - points[None, :]).min(axis=1)
+        assert gaps.max() < 1e-2
+
+    def test_points_inside_disks(self):
+        points = np.concatenate(list(limit_set(_mirrors(), min_radius=1e-5)))
+        inside = np.zeros(len(points), dtype=bool)
+        for C in _mirrors():
+            inside |= np.abs(points - complex(C.center)) < C.radius
+        assert inside.all()
+
+    def test_radius_cutoff(self):
+        chunks = list(limit_set(_schottky_pairs(), min_radius=1e-3, output="clines", chunk_size=64))
+        A = ClineArray.concatenate(chunks)
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        assert (A.radius < 1e-3).all()
+        assert np.allclose(A.discriminant, 1)
+
+    def test_matrix_generators_use_isometric_circles(self):
+        # With equal radii the isometric circles of a pairing are the pair itself
+        pairs = _schottky_pairs()
+        matrices = [_pairing_matrix(*pair) for pair in pairs]
+        from_pairs = ClineArray.concatenate(list(limit_set(pairs, min_radius=1e-3, output="clines")))
+        from_matrices = ClineArray.concatenate(list(limit_set(matrices, min_radius=1e-3, output="clines")))
+        _assert_same_circles(from_pairs, from_matrices)
+
+    def test_streams_lazily(self):
+        # A cutoff far below what could ever be enumerated still streams
+        chunks = limit_set(_mirrors(), min_radius=1e-100, max_depth=200, chunk_size=256)
+        first = list(islice(chunks, 3))
+        assert [len(chunk) for chunk in first] == [256] * 3
+        assert np.isfinite(np.concatenate(first)).all()
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            next(limit_set(_mirrors(), min_radius=0))
+        with pytest.raises(ValueError):
+            next(limit_set(_mirrors(), min_radius=1e-3, max_depth=0))
+        with pytest.raises(ValueError):
+            next(limit_set(_mirrors(), min_radius=1e-3, output="pixels"))
@@ -0,0 +1,421 @@
+"""Tests for the MoebiusTransformation class."""
+
+import cmath
+
+import numpy as np
+import pytest
+import sympy
+
+from cline import Cline
+from cline_array import ClineArray
+from mobius import MoebiusTransformation, TransformChain, transform_clines
+
+
+TOL = 1e-10
+
+
+class TestConstruction:
+    """Tests for coefficients, matrix, determinant and degeneracy."""
+
+    def test_matrix_and_det(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        assert np.allclose(T.matrix, [[2, 3], [1, 4]])
+        assert abs(T.det - 5) < TOL
+        assert abs(T.trace - 6) < TOL
+
+    def test_degenerate_raises(self):
+        with pytest.raises(ValueError):
+            MoebiusTransformation(1, 2, 2, 4)
+
+    def test_symbolic_degenerate_raises(self):
+        with pytest.raises(ValueError):
+            MoebiusTransformation(sympy.Integer(1), 2, 2, 4)
+
+    def test_symbolic_matrix(self):
+        T = MoebiusTransformation(sympy.Integer(2), 3, 1, 4)
+        assert T.matrix == sympy.Matrix([[2, 3], [1, 4]])
+        assert T.det == 5
+
+    def test_str(self):
+        assert str(MoebiusTransformation(2, 3, 1, 4)) == "T(z) = (2z + 3)/(1z + 4)"
+
+
+class TestCall:
+    """Tests for applying a transformation to scalar points."""
+
+    def test_identity(self):
+        I = MoebiusTransformation(1, 0, 0, 1)
+        assert I(3 + 4j) == 3 + 4j
+        assert I(sympy.zoo) is sympy.zoo
+        assert I.classification() == "identity"
+
+    def test_pole_maps_to_infinity(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        assert T(-4) is sympy.zoo
+
+    def test_infinity_maps_to_a_over_c(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        assert abs(T(sympy.zoo) - 2) < TOL
+
+    def test_symbolic(self):
+        T = MoebiusTransformation(sympy.Integer(2), 3, 1, 4)
+        assert T(sympy.Integer(1)) == 1
+        assert T(-4) is sympy.zoo
+        assert T(sympy.zoo) == 2
+
+    def test_tuple_is_one_point(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        assert abs(T((1, 2)) - T(1 + 2j)) < TOL
+        S = MoebiusTransformation(sympy.Integer(2), 3, 1, 4)
+        assert S((sympy.Integer(1), 0)) == 1
+
+
+class TestCallArray:
+    """Tests for vectorized evaluation on point arrays."""
+
+    def test_matches_scalar(self):
+        T = MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4)
+        zs = np.random.default_rng(0).normal(size=50) + 1j
+        expected = np.array([T(z) for z in zs.tolist()])
+        assert np.allclose(T(zs), expected)
+
+    def test_shape_preserved(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        zs = np.arange(12, dtype=complex).reshape(3, 4)
+        assert T(zs).shape == (3, 4)
+
+    def test_list_input(self):
+        T = MoebiusTransformation.inversion()
+        assert np.allclose(T([1, 2j, -4]), [1, -0.5j, -0.25])
+
+    def test_pole_and_infinity(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        w = T(np.array([-4, np.nan, np.inf, 0]))
+        assert np.isnan(w[0])
+        assert w[1] == 2
+        assert w[2] == 2
+        assert abs(w[3] - 0.75) < TOL
+
+    def test_affine(self):
+        T = MoebiusTransformation(2, 1j, 0, 1)
+        w = T(np.array([1, np.nan]))
+        assert w[0] == 2 + 1j
+        assert np.isnan(w[1])
+
+    def test_out_buffer(self):
+        T = MoebiusTransformation.translation(1)
+        zs = np.arange(5, dtype=complex)
+        out = np.empty(5, dtype=complex)
+        assert T(zs, out=out) is out
+        assert np.allclose(out, zs + 1)
+
+    def test_out_buffer_wrong_shape_raises(self):
+        T = MoebiusTransformation.translation(1)
+        with pytest.raises(ValueError):
+            T(np.zeros(5), out=np.empty(4, dtype=complex))
+
+    def test_spans_several_blocks(self):
+        T = MoebiusTransformation(1, 1j, 1, 0)
+        zs = np.linspace(-3, 3, 50_001) + 0.5j
+        zs[[0, 20_000, 50_000]] = 0
+        w = T(zs)
+        assert np.isnan(w[[0, 20_000, 50_000]]).all()
+        finite = zs != 0
+        assert np.allclose(w[finite], (zs[finite] + 1j) / zs[finite])
+
+    def test_no_warnings(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        with np.errstate(all="raise"):
+            T(np.array([-4, np.nan, 1]))
+
+
+class TestTransformCline:
+    """Tests for the action on clines."""
+
+    def test_inversion_maps_circle_to_circle(self):
+        C2 = MoebiusTransformation.inversion().transform_cline(Cline.from_circle(center=2, radius=1))
+        assert C2.is_circle
+        assert abs(C2.center - 2 / 3) < TOL
+        assert abs(C2.radius - 1 / 3) < TOL
+
+    def test_inversion_maps_line_through_origin_to_line(self):
+        L2 = MoebiusTransformation.inversion().transform_cline(Cline.from_line(0, 1 + 1j))
+        assert L2.is_line
+        assert L2.contains(1 - 1j)
+
+    def test_line_not_through_origin_maps_to_circle_through_origin(self):
+        img = MoebiusTransformation.inversion().transform_cline(Cline.from_line(1, 1 + 1j))
+        assert img.is_circle
+        assert abs(abs(img.center) - img.radius) < TOL
+
+    def test_round_trip(self):
+        T = MoebiusTransformation(1, 1j, 0, 1)
+        C = Cline.from_circle(center=0, radius=2)
+        C_back = T.inverse().transform_cline(T.transform_cline(C))
+        assert abs(C_back.center - C.center) < TOL
+        assert abs(C_back.radius - C.radius) < TOL
+
+    def test_rotation_fixes_unit_circle(self):
+        S2 = MoebiusTransformation.rotation(0.5).transform_cline(Cline.from_circle(center=0, radius=1))
+        assert abs(S2.center) < TOL
+        assert abs(S2.radius - 1) < TOL
+
+    def test_image_contains_image_points(self):
+        T = MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4)
+        C = Cline.from_circle(center=1 + 1j, radius=2)
+        image = T.transform_cline(C)
+        for z in C.center + 2 * np.exp(1j * np.linspace(0, 6, 7)):
+            assert image.contains(T(complex(z)))
+
+    def test_symbolic(self):
+        T = MoebiusTransformation(sympy.Integer(0), 1, 1, 0)
+        C = Cline.from_circle(center=sympy.Integer(2), radius=1)
+        image = T.transform_cline(C)
+        assert image.center == sympy.Rational(2, 3)
+        assert image.radius == sympy.Rational(1, 3)
+
+
+class TestComposeInverse:
+    """Tests for composition, inverses and the three-point construction."""
+
+    def test_compose(self):
+        T1 = MoebiusTransformation(1, 2, 0, 1)
+        T2 = MoebiusTransformation(0, 1, 1, 0)
+        z = 3 + 1j
+        assert abs(T1.compose(T2)(z) - T1(T2(z))) < TOL
+
+    def test_inverse(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        z = 1 + 2j
+        assert abs(T(T.inverse()(z)) - z) < TOL
+
+    def test_from_three_points(self):
+        T = MoebiusTransformation.from_three_points(0, 1, 1j, 1, 0, sympy.zoo)
+        assert abs(T(0) - 1) < TOL
+        assert abs(T(1)) < TOL
+        assert T(1j) is sympy.zoo
+
+    def test_from_three_points_infinite_source(self):
+        T = MoebiusTransformation.from_three_points(sympy.zoo, 0, 1, 2, 3j, 4)
+        assert abs(T(sympy.zoo) - 2) < TOL
+        assert abs(T(0) - 3j) < TOL
+        assert abs(T(1) - 4) < TOL
+
+
+class TestClassification:
+    """Tests for fixed points and the trace classification."""
+
+    def test_parabolic(self):
+        P = MoebiusTransformation(1, 1, 0, 1)
+        assert P.classification() == "parabolic"
+        assert P.fixed_points == [sympy.zoo]
+
+    def test_elliptic(self):
+        E = MoebiusTransformation(cmath.exp(1j * cmath.pi / 6), 0, 0, cmath.exp(-1j * cmath.pi / 6))
+        assert E.classification() == "elliptic"
+
+    def test_hyperbolic(self):
+        H = MoebiusTransformation(2, 0, 0, 1)
+        assert H.classification() == "hyperbolic"
+        assert H.fixed_points[1] is sympy.zoo
+        assert abs(H.fixed_points[0]) < TOL
+
+    def test_loxodromic(self):
+        assert MoebiusTransformation(1 + 1j, 0, 0, 1).classification() == "loxodromic"
+
+    def test_fixed_points_are_fixed(self):
+        T = MoebiusTransformation(2, 3, 1, 4)
+        points = T.fixed_points
+        assert len(points) == 2
+        for z in points:
+            assert abs(T(z) - z) < TOL
+
+    def test_symbolic_classification(self):
+        T = MoebiusTransformation(sympy.Integer(2), 0, 0, 1)
+        assert T.classification() == "hyperbolic"
+        assert MoebiusTransformation(sympy.Integer(1), 1, 0, 1).classification() == "parabolic"
+
+
+class TestTransformClines:
+    """Tests for the batched action on stacks of cline matrices."""
+
+    @staticmethod
+    def _clines():
+        return ClineArray.from_clines([
+            Cline.from_circle(center=1 + 1j, radius=2),
+            Cline.from_circle(center=-3, radius=0.5),
+            Cline.from_line(0, 1 + 1j),
+            Cline.from_line(1, 1 + 1j),
+        ])
+
+    @staticmethod
+    def _maps():
+        return [
+            MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4),
+            MoebiusTransformation.inversion(),
+            MoebiusTransformation.translation(1j),
+        ]
+
+    def _assert_same_cline(self, H, C):
+        # Hermitian matrices of the same cline agree up to a real factor
+        H_ref = C.hermitian_matrix.astype(complex)
+        scale = np.vdot(H_ref, H).real / np.vdot(H_ref, H_ref).real
+        assert np.allclose(H, scale * H_ref)
+
+    def test_one_map_many_clines(self):
+        A = self._clines()
+        T = self._maps()[0]
+        H = transform_clines(T, A.hermitian_matrix)
+        assert H.shape == (len(A), 2, 2)
+        for k, C in enumerate(A):
+            self._assert_same_cline(H[k], T.transform_cline(C))
+
+    def test_cline_array_input(self):
+        A = self._clines()
+        T = self._maps()[0]
+        assert np.allclose(transform_clines(T, A), transform_clines(T, A.hermitian_matrix))
+
+    def test_many_maps_many_clines(self):
+        A = self._clines()
+        maps = self._maps()
+        stack = np.array([T.matrix for T in maps])[:, None]
+        H = transform_clines(stack, A.hermitian_matrix)
+        assert H.shape == (len(maps), len(A), 2, 2)
+        for m, T in enumerate(maps):
+            for k, C in enumerate(A):
+                self._assert_same_cline(H[m, k], T.transform_cline(C))
+
+    def test_pairwise_maps(self):
+        A = self._clines()[:3]
+        maps = self._maps()
+        H = transform_clines(np.array([T.matrix for T in maps]), A.hermitian_matrix)
+        for k, (T, C) in enumerate(zip(maps, A)):
+            self._assert_same_cline(H[k], T.transform_cline(C))
+
+    def test_result_is_cline_array_input(self):
+        A = self._clines()
+        B = ClineArray.from_hermitian_matrix(transform_clines(MoebiusTransformation.inversion(), A))
+        assert B.is_circle[0] and B.is_circle[1]
+        assert B.is_line[2]
+        assert B.is_circle[3]
+
+    def test_degenerate_map_raises(self):
+        with pytest.raises(ValueError):
+            transform_clines(np.array([[1, 2], [2, 4]]), self._clines())
+
+    def test_not_hermitian_raises(self):
+        with pytest.raises(ValueError):
+            transform_clines(MoebiusTransformation.inversion(), np.array([[[1, 1], [0, 1]]]))
+
+
+class TestTransformChain:
+    """Tests for fused chains of Möbius maps and inversions."""
+
+    @staticmethod
+    def _mirrors():
+        return [
+            Cline.from_circle(center=0, radius=1),
+            Cline.from_circle(center=2 + 1j, radius=1.5),
+            Cline.from_line(-1, 1j),
+            Cline.from_circle(center=-1 - 2j, radius=0.7),
+        ]
+
+    def test_empty_chain_is_identity(self):
+        chain = TransformChain()
+        assert len(chain) == 0
+        assert not chain.is_anti
+        assert abs(chain(1 + 2j) - (1 + 2j)) < TOL
+
+    def test_single_inversion_matches_cline(self):
+        for mirror in self._mirrors():
+            chain = TransformChain([mirror])
+            assert chain.is_anti
+            for z in (0.3 + 0.4j, -2 + 1j, 5j):
+                assert abs(chain(z) - mirror.invert(z)) < TOL
+
+    def test_tuple_is_one_point(self):
+        chain = TransformChain(self._mirrors())
+        assert abs(chain((0.3, 0.4)) - chain(0.3 + 0.4j)) < TOL
+
+    def test_inversion_pole_and_infinity(self):
+        chain = TransformChain([Cline.from_circle(center=1j, radius=2)])
+        assert chain(1j) is sympy.zoo
+        assert abs(chain(sympy.zoo) - 1j) < TOL
+
+    def test_chain_matches_sequential_points(self):
+        steps = self._mirrors() + [MoebiusTransformation(2 + 1j, 3, 1 - 1j, 4)] + self._mirrors()[:2]
+        chain = TransformChain(steps)
+        assert len(chain) == len(steps)
+        assert not chain.is_anti
+        zs = np.array([0.1 + 0.2j, 3 - 1j, -0.5j])
+        expected = []
+        for z in zs.tolist():
+            for step in steps:
+                z = step(z) if isinstance(step, MoebiusTransformation) else step.invert(z)
+            expected.append(z)
+        assert np.allclose(chain(zs), expected)
+
+    def test_chain_matches_sequential_clines(self):
+        steps = self._mirrors() + [MoebiusTransformation.translation(1)] + self._mirrors()[:2]
+        chain = TransformChain(steps)
+        C = Cline.from_circle(center=0.5 + 3j, radius=0.25)
+        expected = C
+        for step in steps:
+            if isinstance(step, MoebiusTransformation):
+                expected = step.transform_cline(expected)
+            else:
+                expected = step.invert(expected)
+        image = chain.transform_cline(C)
+        assert abs(image.center - expected.center) < 1e-8
+        assert abs(image.radius - expected.radius) < 1e-8
+
+    def test_cline_array(self):
+        chain = TransformChain(self._mirrors()[:3])
+        clines = [Cline.from_circle(center=3, radius=0.5), Cline.from_line(0, 1)]
+        images = chain.transform_cline(ClineArray.from_clines(clines))
+        assert isinstance(images, ClineArray)
+        for k, C in enumerate(clines):
+            image = chain.transform_cline(C)
+            assert np.allclose([images.c[k], images.alpha[k], images.d[k]],
+                               [image.c, image.alpha, image.d])
+
+    def test_image_contains_image_points(self):
+        chain = TransformChain(self._mirrors()).then(MoebiusTransformation.translation(1j))
+        C = Cline.from_circle(center=1 + 1j, radius=2)
+        image = chain.transform_cline(C)
+        for z in C.center + 2 * np.exp(1j * np.linspace(0, 6, 7)):
+            assert image.contains(chain(complex(z)))
+
+    def test_double_inversion_is_identity(self):
+        mirror = self._mirrors()[1]
+        chain = TransformChain([mirror, mirror])
+        assert not chain.is_anti
+        assert chain.to_moebius().classification() == "identity"
+
+    def test_long_chain_stays_normalized(self):
+        chain = TransformChain([MoebiusTransformation.dilation(2)] * 2000)
+        assert np.isfinite(chain.matrix).all()
+        assert abs(np.linalg.norm(chain.matrix) - 1) < TOL
+
+    def test_long_chain_accuracy(self):
+        chain = TransformChain([MoebiusTransformation.rotation(0.001)] * 2000)
+        assert abs(chain(1) - np.exp(2j)) < 1e-9
+
+    def test_nested_chain(self):
+        inner = TransformChain(self._mirrors()[:3])
+        chain = TransformChain([MoebiusTransformation.inversion(), inner])
+        assert len(chain) == 4
+        z = 0.7 - 0.2j
+        assert abs(chain(z) - inner(1 / z)) < TOL
+
+    def test_to_moebius_of_anti_chain_raises(self):
+        with pytest.raises(ValueError):
+            TransformChain([self._mirrors()[0]]).to_moebius()
+
+    def test_degenerate_mirror_raises(self):
+        with pytest.raises(ValueError):
+            TransformChain([Cline(c=1, alpha=0, d=0)])
+
+    def test_unknown_step_raises(self):
+        with pytest.raises(TypeError):
+            TransformChain([1j])
@@ -0,0 +1,97 @@
+"""Tests for the orbit module."""
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from orbit import reflection_orbit
+
+
+def _dihedral_mirrors(n):
+    """Two lines through the origin at angle pi/n, generating a group of order 2n."""
+    return [Cline.from_line(0, 1), Cline.from_line(0, np.exp(1j * np.pi / n))]
+
+
+def _disjoint_mirrors():
+    return [Cline.from_circle(center=np.exp(2j * np.pi * k / 3), radius=0.8) for k in range(3)]
+
+
+def _assert_consistent(orbit, stats, n_seeds=1):
+    assert sum(stats.levels) == len(orbit)
+    assert stats.generated == stats.duplicates + stats.pruned + len(orbit) - n_seeds
+
+
+class TestReflectionOrbit:
+    """Tests for the breadth-first orbit expansion."""
+
+    @pytest.mark.parametrize("n", [2, 3, 5])
+    def test_dihedral_orbit_is_finite(self, n):
+        seed = Cline.from_circle(center=2 + 0.3j, radius=0.5)
+        orbit, stats = reflection_orbit([seed], _dihedral_mirrors(n), max_length=50)
+        assert len(orbit) == 2 * n
+        assert stats.duplicates > 0
+        assert stats.levels[-1] == 0
+        assert len(stats.levels) < 50
+        _assert_consistent(orbit, stats)
+        # Every image is a circle of the same radius at the same distance from 0
+        assert np.allclose(orbit.radius, 0.5)
+        assert np.allclose(np.abs(orbit.center), abs(2 + 0.3j))
+
+    def test_matches_naive_enumeration(self):
+        mirrors = _dihedral_mirrors(3) + [Cline.from_circle(center=3, radius=1)]
+        seed = Cline.from_circle(center=0.5 + 1.5j, radius=0.25)
+        words = [seed]
+        images = [seed]
+        for _ in range(4):
+            words = [M.invert(C) for C in words for M in mirrors]
+            images.extend(words)
+        expected = {
+            (round(float(C.center.real), 6), round(float(C.center.imag), 6), round(float(C.radius), 6))
+            for C in images
+        }
+        orbit, stats = reflection_orbit([seed], mirrors, max_length=4)
+        found = {
+            (round(z.real, 6), round(z.imag, 6), round(r, 6))
+            for z, r in zip(orbit.center.tolist(), orbit.radius.tolist())
+        }
+        assert found == expected
+        assert len(orbit) == len(expected)
+        _assert_consistent(orbit, stats)
+
+    def test_free_group_has_no_duplicates(self):
+        orbit, stats = reflection_orbit(
+            [Cline.from_circle(center=0, radius=0.1)], _disjoint_mirrors(), max_length=6
+        )
+        assert stats.duplicates == 0
+        assert stats.levels == [1] + [3 * 2 ** k for k in range(6)]
+        _assert_consistent(orbit, stats)
+
+    def test_min_radius_prunes(self):
+        orbit, stats = reflection_orbit(
+            [Cline.from_circle(center=0, radius=0.1)], _disjoint_mirrors(), min_radius=1e-3
+        )
+        assert stats.pruned > 0
+        assert (orbit.radius >= 1e-3).all()
+        assert stats.levels[-1] == 0
+        _assert_consistent(orbit, stats)
+
+    def test_max_clines(self):
+        orbit, stats = reflection_orbit(
+            [Cline.from_circle(center=0, radius=0.1)], _disjoint_mirrors(), max_clines=20
+        )
+        assert len(orbit) == 20
+        _assert_consistent(orbit, stats)
+
+    def test_duplicate_seeds_within_tolerance(self):
+        C = Cline.from_circle(center=2 + 1j, radius=0.5)
+        D = Cline(c=float(C.c), alpha=complex(C.alpha) + 1e-13, d=float(C.d))
+        orbit, stats = reflection_orbit([C, D], _dihedral_mirrors(2), max_length=5)
+        assert stats.levels[0] == 1
+        assert len(orbit) == 4
+
+    def test_invalid_arguments(self):
+        seed = [Cline.from_circle(center=0, radius=1)]
+        with pytest.raises(ValueError):
+            reflection_orbit(seed, _dihedral_mirrors(3))
+        with pytest.raises(ValueError):
+            reflection_orbit(seed, [Cline(c=1, alpha=0, d=0)], max_length=2)
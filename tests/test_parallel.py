@@ -0,0 +1,113 @@
+"""Tests for process-parallel tree generation."""
+
+import numpy as np
+import pytest
+
+from apollonian import apollonian_gasket
+from cline import Cline
+from cline_array import ClineArray
+from limit_set import limit_set
+from parallel import map_ordered, parallel_gasket, parallel_limit_set
+
+
+def _roots():
+    return [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=0.5, radius=0.5),
+        Cline.from_circle(center=-0.5, radius=0.5),
+    ]
+
+
+def _square(x):
+    return x * x
+
+
+class TestMapOrdered:
+    """Tests for the ordered process-pool map."""
+
+    def test_results_in_task_order(self):
+        tasks = list(range(20))
+        assert list(map_ordered(_square, tasks, processes=2, window=3)) == [x * x for x in tasks]
+
+    def test_window_bounds_tasks_in_flight(self):
+        pulled = []
+
+        def tasks():
+            for x in range(100):
+                pulled.append(x)
+                yield x
+
+        results = map_ordered(_square, tasks(), processes=2, window=3)
+        assert next(results) == 0
+        assert len(pulled) == 3
+        assert next(results) == 1
+        assert len(pulled) == 4
+        results.close()
+
+    def test_inline(self):
+        assert list(map_ordered(_square, [1, 2, 3], processes=1)) == [1, 4, 9]
+
+
+class TestParallelGasket:
+    """Tests for parallel_gasket."""
+
+    def test_matches_serial_gasket(self):
+        parallel = ClineArray.concatenate(parallel_gasket(_roots(), min_radius=0.005, processes=1))
+        serial = ClineArray.concatenate(apollonian_gasket(_roots(), min_radius=0.005))
+        assert len(parallel) == len(serial)
+        assert np.allclose(np.sort(parallel.c), np.sort(serial.c))
+
+    def test_deterministic_across_process_counts(self):
+        one = list(parallel_gasket(_roots(), min_radius=0.01, split_depth=2, processes=1))
+        two = list(parallel_gasket(_roots(), min_radius=0.01, split_depth=2, processes=2))
+        assert len(one) == len(two)
+        for A, B in zip(one, two):
+            assert np.array_equal(A.c, B.c)
+            assert np.array_equal(A.alpha, B.alpha)
+            assert np.array_equal(A.d, B.d)
+
+    def test_split_depth_zero(self):
+        A = ClineArray.concatenate(parallel_gasket(_roots(), min_radius=0.05, split_depth=0, processes=1))
+        serial = ClineArray.concatenate(apollonian_gasket(_roots(), min_radius=0.05))
+        assert np.allclose(np.sort(A.c), np.sort(serial.c))
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            next(parallel_gasket(_roots(), min_radius=0))
+        with pytest.raises(ValueError):
+            next(parallel_gasket(_roots(), min_radius=0.1, split_depth=-1))
+        with pytest.raises(ValueError):
+            next(parallel_gasket(_roots(), min_radius=0.1, order="random"))
+
+
+def _mirrors():
+    return [Cline.from_circle(center=np.exp(2j * np.pi * k / 3), radius=0.8) for k in range(3)]
+
+
+class TestParallelLimitSet:
+    """Tests for parallel_limit_set."""
+
+    @pytest.mark.parametrize("split_depth", [1, 3, 20])
+    def test_matches_serial_limit_set(self, split_depth):
+        serial = np.concatenate(list(limit_set(_mirrors(), min_radius=1e-3)))
+        parallel = np.concatenate(
+            list(parallel_limit_set(_mirrors(), min_radius=1e-3, split_depth=split_depth, processes=1))
+        )
+        assert len(parallel) == len(serial)
+        assert np.allclose(np.sort_complex(parallel), np.sort_complex(serial))
+
+    def test_deterministic_across_process_counts(self):
+        one = list(parallel_limit_set(_mirrors(), min_radius=1e-2, output="clines", processes=1))
+        two = list(parallel_limit_set(_mirrors(), min_radius=1e-2, output="clines", processes=2))
+        assert len(one) == len(two)
+        for A, B in zip(one, two):
+            assert np.array_equal(A.c, B.c)
+            assert np.array_equal(A.alpha, B.alpha)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            next(parallel_limit_set(_mirrors(), min_radius=0))
+        with pytest.raises(ValueError):
+            next(parallel_limit_set(_mirrors(), min_radius=1e-2, split_depth=0))
+        with pytest.raises(ValueError):
+            next(parallel_limit_set(_mirrors(), min_radius=1e-2, output="pixels"))
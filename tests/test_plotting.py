@@ -0,0 +1,217 @@
+"""Tests for the plotting module and view-adaptive Cline.plot."""
+
+from fractions import Fraction
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+import sympy  # noqa: E402
+from matplotlib.collections import EllipseCollection, LineCollection  # noqa: E402
+
+from cline import Cline  # noqa: E402
+from cline_array import ClineArray  # noqa: E402
+from gaussian import GaussianRational  # noqa: E402
+from plotting import _clip_lines, _pixels_per_unit, _visible_arcs, plot_clines  # noqa: E402
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def _scene():
+    return [
+        Cline.from_circle(center=0, radius=1),
+        Cline.from_circle(center=3 + 1j, radius=2),
+        Cline.from_line(0, 1 + 1j),
+        Cline(c=1, alpha=-2, d=4),  # point at 2
+        Cline(c=1, alpha=0, d=1),   # invalid
+    ]
+
+
+class TestClipLines:
+    """Tests for analytic clipping of lines to a box."""
+
+    def test_axis_aligned_and_diagonal(self):
+        # x = 0, y = 0 and y = x in the box [-1, 1]^2
+        segments, visible = _clip_lines(np.array([1, 1j, 1 + 1j]), np.zeros(3), (-1, 1), (-1, 1))
+        assert visible.all()
+        expected = [[[0, -1], [0, 1]], [[-1, 0], [1, 0]], [[-1, -1], [1, 1]]]
+        for segment, ends in zip(segments, expected):
+            assert np.allclose(sorted(segment.tolist()), sorted(ends))
+
+    def test_lines_missing_the_box(self):
+        # x = -50 and y = x + 10 both miss [-1, 1]^2
+        alpha = np.array([1, 1 + 1j])
+        d = np.array([100, 20])
+        segments, visible = _clip_lines(alpha, d, (-1, 1), (-1, 1))
+        assert not visible.any()
+        assert segments.shape == (0, 2, 2)
+
+    def test_endpoints_lie_on_line_and_box(self):
+        rng = np.random.default_rng(0)
+        alpha = np.exp(1j * rng.uniform(0, 2 * np.pi, 200))
+        d = rng.uniform(-3, 3, 200)
+        segments, visible = _clip_lines(alpha, d, (-2, 1), (-1, 3))
+        z = segments[..., 0] + 1j * segments[..., 1]
+        residual = 2 * (alpha[visible, None] * z).real + d[visible, None]
+        assert np.abs(residual).max() < 1e-9
+        assert (segments[..., 0] >= -2 - 1e-9).all() and (segments[..., 0] <= 1 + 1e-9).all()
+        assert (segments[..., 1] >= -1 - 1e-9).all() and (segments[..., 1] <= 3 + 1e-9).all()
+
+
+class TestPlotClines:
+    """Tests for plot_clines."""
+
+    def test_one_artist_per_kind(self, ax):
+        plot_clines(_scene(), ax=ax)
+        ellipses = [c for c in ax.collections if isinstance(c, EllipseCollection)]
+        lines = [c for c in ax.collections if isinstance(c, LineCollection)]
+        assert len(ellipses) == 1 and len(lines) == 1
+        assert len(ellipses[0].get_offsets()) == 2
+        assert len(lines[0].get_segments()) == 1
+        # Circles, line and the point scatter; nothing for the invalid cline
+        assert len(ax.collections) == 3
+        assert not ax.texts
+
+    def test_auto_limits_cover_circles(self, ax):
+        plot_clines(ClineArray.from_clines(_scene()), ax=ax)
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        assert x0 < -1 and x1 > 5
+        assert y0 < -1 and y1 > 3
+
+    def test_lines_clipped_to_given_limits(self, ax):
+        plot_clines([Cline.from_line(0, 1)], ax=ax, xlim=(-3, 4), ylim=(-1, 1))
+        (segment,) = ax.collections[0].get_segments()
+        assert np.allclose(sorted(segment[:, 0]), [-3, 4])
+
+    def test_lines_follow_later_views(self, ax):
+        lines = [Cline.from_line(0, 1), Cline.from_line(5j, 5j + 1)]  # y = 0, y = 5
+        plot_clines(lines, ax=ax, color=["red", "blue"], xlim=(-3, 4), ylim=(-1, 1))
+        (collection,) = ax.collections
+        first, second = collection.get_segments()
+        assert np.allclose(sorted(first[:, 0]), [-3, 4])
+        assert len(second) == 0
+
+        ax.set_xlim(-10, 10)
+        ax.set_ylim(-6, 6)
+        first, second = collection.get_segments()
+        assert np.allclose(sorted(first[:, 0]), [-10, 10])
+        assert np.allclose(second[:, 1], 5) and np.allclose(sorted(second[:, 0]), [-10, 10])
+        assert np.allclose(collection.get_colors()[1], matplotlib.colors.to_rgba("blue"))
+
+    def test_per_cline_colors_and_labels(self, ax):
+        scene = _scene()
+        colors = ["red", "green", "blue", "black", "gray"]
+        plot_clines(scene, ax=ax, color=colors, labels=list("abcde"), show_centers=True)
+        (ellipses,) = [c for c in ax.collections if isinstance(c, EllipseCollection)]
+        assert np.allclose(ellipses.get_edgecolor()[1], matplotlib.colors.to_rgba("green"))
+        assert sorted(t.get_text().strip() for t in ax.texts) == ["a", "b", "c", "d"]
+
+    def test_color_count_mismatch_raises(self, ax):
+        with pytest.raises(ValueError):
+            plot_clines(_scene(), ax=ax, color=["red", "blue"])
+
+    def test_draws(self, ax):
+        rng = np.random.default_rng(1)
+        centers = rng.uniform(-10, 10, 500) + 1j * rng.uniform(-10, 10, 500)
+        A = ClineArray(np.ones(500), -np.conj(centers), np.abs(centers) ** 2 - 1)
+        plot_clines(A, ax=ax)
+        ax.figure.canvas.draw()
+
+
+class TestVisibleArcs:
+    """Tests for clipping circles to a box."""
+
+    def test_inside_and_enclosing(self):
+        assert _visible_arcs(0j, 1, (-2, 2), (-2, 2)) == [(0.0, 2 * np.pi)]
+        assert _visible_arcs(0j, 10, (-2, 2), (-2, 2)) == []
+        assert _visible_arcs(10 + 0j, 1, (-2, 2), (-2, 2)) == []
+
+    def test_half_circle(self):
+        (arc,) = _visible_arcs(0j, 1, (0, 2), (-2, 2))
+        assert np.allclose(arc, (1.5 * np.pi, 2.5 * np.pi))
+
+    def test_arcs_stay_in_box(self):
+        rng = np.random.default_rng(2)
+        for _ in range(50):
+            center = complex(*rng.uniform(-3, 3, 2))
+            radius = rng.uniform(0.5, 4)
+            for start, end in _visible_arcs(center, radius, (-1, 2), (-2, 1)):
+                z = center + radius * np.exp(1j * np.linspace(start, end, 50))
+                assert (z.real >= -1 - 1e-9).all() and (z.real <= 2 + 1e-9).all()
+                assert (z.imag >= -2 - 1e-9).all() and (z.imag <= 1 + 1e-9).all()
+
+
+class TestAdaptivePlot:
+    """Tests for view-dependent sampling in Cline.plot."""
+
+    def test_huge_circle_only_visible_arc(self, ax):
+        C = Cline.from_circle(center=1e6j, radius=1e6)
+        C.plot(ax=ax, xlim=(-1, 1), ylim=(-1, 1), show_points=False)
+        x, y = ax.lines[0].get_data()
+        assert len(x) < 100
+        assert np.abs(x).max() <= 1 + 1e-9 and np.abs(y).max() <= 1 + 1e-9
+
+    def test_tiny_circle_is_cheap(self, ax):
+        C = Cline.from_circle(center=0, radius=1e-4)
+        C.plot(ax=ax, xlim=(-10, 10), ylim=(-10, 10), show_points=False)
+        assert len(ax.lines[0].get_xdata()) <= 10
+
+    def test_sampling_error_below_a_pixel(self, ax):
+        C = Cline.from_circle(center=0, radius=1)
+        C.plot(ax=ax, xlim=(-1.1, 1.1), ylim=(-1.1, 1.1), show_points=False)
+        x, y = ax.lines[0].get_data()
+        mid = (x[1:] + x[:-1]) / 2 + 1j * (y[1:] + y[:-1]) / 2
+        sagitta_px = (1 - np.abs(mid)).max() * _pixels_per_unit(ax)
+        assert sagitta_px < 0.5
+
+    def test_fixed_num_points(self, ax):
+        Cline.from_circle(center=0, radius=1).plot(ax=ax, num_points=37, show_points=False)
+        assert len(ax.lines[0].get_xdata()) == 37
+
+    def test_line_without_points(self, ax):
+        L = Cline(c=0, alpha=1 + 1j, d=-4)  # y = x - 2
+        L.plot(ax=ax)
+        (line,) = ax.lines
+        x, y = line.get_data()
+        assert np.allclose(y, x - 2)
+        assert np.allclose(sorted(x), ax.get_xlim())
+
+    @pytest.mark.parametrize("L", [
+        Cline(c=0, alpha=sympy.Rational(1, 2) + sympy.I / 2, d=-6),
+        Cline(c=Fraction(0), alpha=GaussianRational(Fraction(1, 2), Fraction(1, 2)), d=Fraction(-6)),
+    ])
+    def test_exact_line_without_points(self, ax, L):
+        L.plot(ax=ax, show_points=False)  # y = x - 6
+        x, y = ax.lines[0].get_data()
+        assert np.allclose(y, x - 6)
+        # The window is centered on the point of the line closest to the origin
+        assert np.allclose([np.mean(ax.get_xlim()), np.mean(ax.get_ylim())], [3, -3])
+
+    def test_earlier_clines_follow_later_views(self, ax):
+        Cline(c=0, alpha=1, d=0).plot(ax=ax, show_points=False)  # Re(z) = 0
+        Cline.from_circle(center=100j, radius=1).plot(ax=ax, show_points=False)
+        x, y = ax.lines[0].get_data()
+        assert np.allclose(x, 0)
+        assert np.allclose(sorted(y), ax.get_ylim())
+
+        circle = ax.lines[1]
+        ax.set_xlim(-0.5, 0.5)
+        assert np.nanmax(np.abs(circle.get_xdata())) <= 0.5 + 1e-9
+        ax.set_xlim(-2, 2)
+        z = circle.get_xdata() + 1j * circle.get_ydata()
+        assert np.allclose(np.abs(z - 100j), 1)
+        assert np.isclose(z.real.max(), 1) and np.isclose(z.real.min(), -1)
+
+        connected = len(ax.callbacks.callbacks["xlim_changed"])
+        circle.remove()
+        ax.set_xlim(-3, 3)
+        assert len(ax.callbacks.callbacks["xlim_changed"]) == connected - 1
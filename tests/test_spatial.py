@@ -0,0 +1,124 @@
+"""Tests for the ClineIndex spatial index."""
+
+import numpy as np
+import pytest
+
+from cline import Cline
+from cline_array import ClineArray
+from spatial import ClineIndex
+
+
+def _random_scene(seed, n=200):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, size=n) + 1j * rng.uniform(-10, 10, size=n)
+    radii = rng.uniform(0.1, 1.5, size=n)
+    radii[:2] = 25  # oversized
+    clines = [Cline.from_circle(center=z, radius=r) for z, r in zip(centers, radii)]
+    clines += [Cline.from_line(complex(*rng.normal(size=2) * 5), complex(*rng.normal(size=2) * 5))
+               for _ in range(10)]
+    clines.append(Cline(c=1, alpha=0, d=0))  # point, never indexed
+    return ClineArray.from_clines(clines)
+
+
+def _brute_force_pairs(A):
+    R = A.pairwise_intersections(index=False)
+    return set(zip(R["i"].tolist(), R["j"].tolist()))
+
+
+class TestCandidatePairs:
+    """The broad phase must never drop a pair that intersects."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_superset_of_intersecting_pairs(self, seed):
+        A = _random_scene(seed)
+        index = ClineIndex(A, max_cells_per_circle=16)
+        ii, jj = index.candidate_pairs()
+        candidates = set(zip(ii.tolist(), jj.tolist()))
+        assert len(candidates) == len(ii)  # no duplicates
+        assert np.all(ii < jj)
+        assert _brute_force_pairs(A) <= candidates
+        assert len(candidates) < len(A) * (len(A) - 1) // 2
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_pairwise_intersections_match_brute_force(self, seed):
+        A = _random_scene(seed)
+        expected = A.pairwise_intersections(index=False)
+        assert np.array_equal(A.pairwise_intersections(), expected)
+        assert np.array_equal(A.pairwise_intersections(chunk_size=3), expected)
+        index = ClineIndex(A, cell_size=0.7)
+        assert np.array_equal(A.pairwise_intersections(index=index), expected)
+
+    def test_tangent_pairs_kept(self):
+        # Boxes touch only along an edge
+        A = ClineArray.from_clines([Cline.from_circle(center=0, radius=1),
+                                    Cline.from_circle(center=2, radius=1),
+                                    Cline.from_line(1, 1 + 1j)])
+        R = A.pairwise_intersections()
+        assert len(R) == 3
+        assert R["multiplicity"].tolist() == [2, 2, 2]
+
+    def test_very_different_radii_match_brute_force(self):
+        # Small circles at a range of gaps from a huge one, all near the origin
+        gaps = np.concatenate([[0.0], np.geomspace(1e-12, 1e-2, 21)])
+        clines = [Cline.from_circle(center=1000, radius=1000.0),
+                  Cline.from_circle(center=-1, radius=1.0),
+                  Cline.from_line(0, 1j)]
+        for r in (1e-4, 1e-2):
+            clines += [Cline.from_circle(center=-r - g, radius=r) for g in gaps]
+            clines += [Cline.from_circle(center=(r + g) * 1j, radius=r) for g in gaps]
+        A = ClineArray.from_clines(clines)
+        expected = A.pairwise_intersections(index=False)
+        assert (expected["multiplicity"] == 2).any()
+        assert np.array_equal(A.pairwise_intersections(), expected)
+
+    def test_index_for_other_array_rejected(self):
+        A = _random_scene(0, n=10)
+        with pytest.raises(ValueError):
+            A.pairwise_intersections(index=ClineIndex(A[:5]))
+
+    def test_bad_cell_size(self):
+        with pytest.raises(ValueError):
+            ClineIndex(_random_scene(0, n=5), cell_size=0)
+
+
+class TestQueries:
+    """Tests for query_cline and query_region."""
+
+    def test_query_cline_circle(self):
+        A = _random_scene(3)
+        index = ClineIndex(A)
+        pairs = _brute_force_pairs(A)
+        for k in range(0, 40, 7):
+            found = set(index.query_cline(A[k]).tolist())
+            assert k in found
+            for i, j in pairs:
+                if k in (i, j):
+                    assert (j if i == k else i) in found
+
+    def test_query_cline_line(self):
+        A = _random_scene(4)
+        index = ClineIndex(A)
+        L = Cline.from_line(0, 1)  # the real axis
+        found = index.query_cline(L)
+        hits = A.to_clines()
+        for k in range(len(A)):
+            if A.is_circle[k] and hits[k].intersection(L):
+                assert k in found
+        assert np.all(A.is_line[found] | (np.abs(A.center[found].imag) <= A.radius[found] + 1e-6))
+
+    def test_query_cline_degenerate_raises(self):
+        with pytest.raises(ValueError):
+            ClineIndex(_random_scene(0, n=5)).query_cline(Cline(c=1, alpha=0, d=0))
+
+    def test_query_region(self):
+        A = ClineArray.from_clines([
+            Cline.from_circle(center=0.5 + 0.5j, radius=0.2),  # inside the box
+            Cline.from_circle(center=0.5 + 0.5j, radius=5),    # encloses the box
+            Cline.from_circle(center=3, radius=2.2),           # crosses x = 1
+            Cline.from_circle(center=10, radius=1),            # far away
+            Cline.from_line(0, 1j),                            # x = 0
+            Cline.from_line(5, 5 + 1j),                        # x = 5
+        ])
+        index = ClineIndex(A)
+        assert index.query_region((0, 1), (0, 1)).tolist() == [0, 2, 4]
+        assert index.query_region((0, 1), (0, 1), margin=8).tolist() == [0, 1, 2, 3, 4, 5]